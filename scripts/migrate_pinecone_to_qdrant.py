@@ -3,15 +3,25 @@
 Migration script to transfer vectors from Pinecone to Qdrant.
 
 This script has two separate steps:
-1. STEP 1: Extract data from Pinecone and save to a pickle file
-2. STEP 2: Load data from pickle file and upload to Qdrant
+1. STEP 1: Extract data from Pinecone and save to a .npz file
+2. STEP 2: Load data from the .npz file and upload to Qdrant
+
+Alternatively, the migrate step streams each fetched batch straight into
+Qdrant without writing an intermediate file.
+
+The .npz file stores IDs and a float32 vector matrix as NumPy arrays, plus
+metadata as JSON lines. Legacy pickle files (any other extension) can
+still be written and read. Append .zst to either to zstd-compress the file.
 
 Usage:
     # Step 1: Extract from Pinecone
-    python migrate_pinecone_to_qdrant.py --step extract --output pinecone_data.pkl
+    python migrate_pinecone_to_qdrant.py --step extract --output pinecone_data.npz
 
     # Step 2: Upload to Qdrant
-    python migrate_pinecone_to_qdrant.py --step upload --input pinecone_data.pkl
+    python migrate_pinecone_to_qdrant.py --step upload --input pinecone_data.npz
+
+    # Or both at once, without an intermediate file
+    python migrate_pinecone_to_qdrant.py --step migrate
 """
 
 import os
@@ -19,34 +29,658 @@ import sys
 import time
 import pickle
 import argparse
+import io
+import json
+import multiprocessing
+import queue
+import random
+import tempfile
+import threading
+import uuid
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from functools import partial
+from itertools import chain
+from typing import List, Dict, Any, Optional, Callable, Iterator, Iterable, BinaryIO, Tuple
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 try:
+    import numpy as np
     from pinecone import Pinecone
     from qdrant_client import QdrantClient
     from qdrant_client.models import (
         Distance,
         VectorParams,
-        PointStruct,
+        Batch,
+        BinaryQuantization,
+        BinaryQuantizationConfig,
+        CompressionRatio,
+        ProductQuantization,
+        ProductQuantizationConfig,
+        ScalarQuantization,
+        ScalarQuantizationConfig,
+        ScalarType,
     )
 except ImportError as e:
     print(f"Error: Missing required package. Please install: {e.name}")
-    print("Run: pip install pinecone-client qdrant-client")
+    print("Run: pip install pinecone-client qdrant-client numpy")
     sys.exit(1)
 
 
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Extract the Retry-After delay from a rate-limited (HTTP 429) API error.
+
+    Both pinecone-client and qdrant-client expose the status code and response
+    headers on their exceptions, under slightly different attribute names.
+
+    Args:
+        error: Exception raised by the API client
+
+    Returns:
+        Delay in seconds if the error is a 429 response, None otherwise
+    """
+    status = getattr(error, "status", None) or getattr(error, "status_code", None)
+    if status != 429:
+        return None
+    headers = getattr(error, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after") or headers.get("Retry-After") or 1.0)
+    except (TypeError, ValueError):
+        return 1.0
+
+
+# gRPC status codes (qdrant-client with prefer_grpc) worth retrying
+RETRYABLE_GRPC_CODES = {
+    "UNAVAILABLE",
+    "RESOURCE_EXHAUSTED",
+    "DEADLINE_EXCEEDED",
+    "ABORTED",
+    "INTERNAL",
+}
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Decide whether a failed API call is worth retrying.
+
+    Rate limits (429), timeouts (408), server errors (5xx) and network
+    failures are transient. Other 4xx responses and invalid arguments would
+    fail again, so they are raised immediately.
+
+    Args:
+        error: Exception raised by the API client
+
+    Returns:
+        True if the call should be retried
+    """
+    if isinstance(error, (ValueError, TypeError, KeyError, AttributeError)):
+        return False
+    status = getattr(error, "status", None) or getattr(error, "status_code", None)
+    if isinstance(status, int):
+        return status in (408, 429) or status >= 500
+    code = getattr(error, "code", None)
+    if callable(code):
+        try:
+            return getattr(code(), "name", None) in RETRYABLE_GRPC_CODES
+        except Exception:
+            return True
+    return True
+
+
+def _call_with_retries(func: Callable, *args, max_retries: int = 5, **kwargs) -> Any:
+    """
+    Call an API function, retrying transient failures with backoff.
+
+    Backoff is exponential from 0.1s (capped at 5s) with random jitter, so
+    concurrent workers that fail together do not retry in lockstep.
+    Rate-limited responses (HTTP 429) wait for the server-provided
+    Retry-After delay instead. Non-retryable errors are raised immediately.
+
+    Args:
+        func: Function to call
+        max_retries: Maximum number of attempts before re-raising the error
+
+    Returns:
+        Return value of func
+    """
+    for attempt in range(max_retries):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            if attempt == max_retries - 1 or not _is_retryable(e):
+                raise
+            wait_time = _retry_after_seconds(e)
+            if wait_time is None:
+                backoff = min(5.0, 0.1 * 2**attempt)
+                wait_time = backoff + random.uniform(0, backoff)
+            print(f"  Attempt {attempt + 1}/{max_retries} failed: {e}")
+            print(f"  Retrying in {wait_time:.2f}s...")
+            time.sleep(wait_time)
+
+
+@dataclass
+class ExtractedBatch:
+    """
+    Extracted vectors in column layout.
+
+    Embeddings live in one (N, D) float32 matrix rather than per-vector
+    Python float lists, which takes roughly an eighth of the memory. IDs and
+    metadata are parallel lists indexed by matrix row.
+    """
+
+    ids: List[str]
+    vectors: np.ndarray
+    metadata: List[Dict[str, Any]]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, index: slice) -> "ExtractedBatch":
+        return ExtractedBatch(self.ids[index], self.vectors[index], self.metadata[index])
+
+    def take(self, rows: List[int]) -> "ExtractedBatch":
+        """Return a new batch with only the given rows"""
+        return ExtractedBatch(
+            [self.ids[row] for row in rows],
+            self.vectors[rows],
+            [self.metadata[row] for row in rows],
+        )
+
+    @classmethod
+    def from_rows(
+        cls, rows: List[Tuple[str, Any, Optional[Dict[str, Any]]]], dimension: int
+    ) -> "ExtractedBatch":
+        """
+        Build a batch from (id, values, metadata) rows.
+
+        Args:
+            rows: Vector ID, vector values and metadata for each vector
+            dimension: Vector dimension, used to preallocate the matrix
+
+        Returns:
+            ExtractedBatch holding the rows
+        """
+        matrix = np.empty((len(rows), dimension), dtype=np.float32)
+        for row, (_, values, _) in enumerate(rows):
+            matrix[row] = values
+        return cls(
+            [vec_id for vec_id, _, _ in rows],
+            matrix,
+            [metadata or {} for _, _, metadata in rows],
+        )
+
+    @classmethod
+    def concat(cls, batches: List["ExtractedBatch"], dimension: int) -> "ExtractedBatch":
+        """Concatenate batches in order into a single batch"""
+        if not batches:
+            return cls([], np.empty((0, dimension), dtype=np.float32), [])
+        return cls(
+            [vec_id for batch in batches for vec_id in batch.ids],
+            np.concatenate([batch.vectors for batch in batches]),
+            [record for batch in batches for record in batch.metadata],
+        )
+
+
+def save_vectors_npz(f: BinaryIO, data: Dict[str, Any]) -> None:
+    """
+    Save extracted vectors to a NumPy .npz archive.
+
+    Vectors are stored as one contiguous float32 matrix instead of per-row
+    Python float lists, which keeps the file small and fast to load.
+    Per-vector metadata is stored as UTF-8 JSON lines.
+
+    Args:
+        f: Seekable binary file to write the archive to
+        data: Dictionary with "metadata" and "vectors" (ExtractedBatch) keys
+    """
+    vectors = data["vectors"]
+    payloads = "\n".join(
+        json.dumps(record, ensure_ascii=False) for record in vectors.metadata
+    ).encode("utf-8")
+
+    np.savez(
+        f,
+        info=np.array(json.dumps(data["metadata"])),
+        ids=np.array(vectors.ids, dtype=str),
+        vectors=np.asarray(vectors.vectors, dtype=np.float32),
+        payloads=np.frombuffer(payloads, dtype=np.uint8),
+    )
+
+
+def load_vectors_npz(f: BinaryIO) -> Dict[str, Any]:
+    """
+    Load vectors saved by save_vectors_npz().
+
+    Args:
+        f: Seekable binary file to read the archive from
+
+    Returns:
+        Dictionary with "metadata" and "vectors" (ExtractedBatch) keys
+    """
+    with np.load(f, allow_pickle=False) as archive:
+        metadata = json.loads(str(archive["info"]))
+        ids = archive["ids"].tolist()
+        matrix = archive["vectors"]
+        payloads = archive["payloads"].tobytes().decode("utf-8")
+
+    records = payloads.split("\n") if payloads else []
+    vectors = ExtractedBatch(ids, matrix, [json.loads(record) for record in records])
+    return {"metadata": metadata, "vectors": vectors}
+
+
+# Header of pickle files written with out-of-band vector buffers; files
+# without it are plain pickles from earlier versions of this script
+PICKLE_OOB_MAGIC = b"PCQD-PKL5\n"
+
+
+def save_vectors_pickle(f: BinaryIO, data: Dict[str, Any]) -> None:
+    """
+    Save extracted vectors to a pickle file using protocol 5.
+
+    The vectors are stacked into one float32 matrix and written as a raw
+    out-of-band buffer after the pickle stream, so the bulk of the file is a
+    single memcpy on load instead of millions of Python float objects.
+
+    Layout: magic header, then length-prefixed pickle stream, then each
+    out-of-band buffer length-prefixed (8-byte little-endian lengths).
+
+    Args:
+        f: Binary file to write to
+        data: Dictionary with "metadata" and "vectors" (ExtractedBatch) keys
+    """
+    vectors = data["vectors"]
+    payload = {
+        "metadata": data["metadata"],
+        "ids": vectors.ids,
+        "matrix": np.ascontiguousarray(vectors.vectors, dtype=np.float32),
+        "records": vectors.metadata,
+    }
+
+    buffers: List[pickle.PickleBuffer] = []
+    stream = pickle.dumps(payload, protocol=5, buffer_callback=buffers.append)
+
+    f.write(PICKLE_OOB_MAGIC)
+    f.write(len(stream).to_bytes(8, "little"))
+    f.write(stream)
+    for buffer in buffers:
+        raw = buffer.raw()
+        f.write(raw.nbytes.to_bytes(8, "little"))
+        f.write(raw)
+
+
+def load_vectors_pickle(f: BinaryIO) -> Dict[str, Any]:
+    """
+    Load vectors saved by save_vectors_pickle() or a legacy plain pickle.
+
+    Args:
+        f: Binary file to read from (need not be seekable)
+
+    Returns:
+        Dictionary with "metadata" and "vectors" (ExtractedBatch) keys
+    """
+    header = f.read(len(PICKLE_OOB_MAGIC))
+    if header != PICKLE_OOB_MAGIC:
+        # Legacy pickles hold a list of {"id", "vector", "metadata"} dicts
+        data = pickle.loads(header + f.read())
+        records = data["vectors"]
+        dimension = len(records[0]["vector"]) if records else 0
+        data["vectors"] = ExtractedBatch.from_rows(
+            [(v["id"], v["vector"], v.get("metadata")) for v in records], dimension
+        )
+        return data
+
+    stream = f.read(int.from_bytes(f.read(8), "little"))
+    buffers = []
+    while length_bytes := f.read(8):
+        buffer = bytearray(int.from_bytes(length_bytes, "little"))
+        f.readinto(buffer)
+        buffers.append(buffer)
+
+    payload = pickle.loads(stream, buffers=buffers)
+    vectors = ExtractedBatch(payload["ids"], payload["matrix"], payload["records"])
+    return {"metadata": payload["metadata"], "vectors": vectors}
+
+
+# Whole-file saves and loads are sequential, so use large I/O buffers to
+# move the multi-GB vector matrix in a few big syscalls
+IO_BUFFER_SIZE = 16 * 1024 * 1024
+
+
+def _open_sequential(path: str, mode: str) -> BinaryIO:
+    """
+    Open a file for one sequential pass with a large buffer.
+
+    Args:
+        path: File path
+        mode: "rb" or "wb"
+
+    Returns:
+        Open binary file object
+    """
+    f = open(path, mode, buffering=IO_BUFFER_SIZE)
+    if mode == "rb" and hasattr(os, "posix_fadvise"):
+        # Let the kernel read ahead aggressively
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return f
+
+
+def _import_zstandard():
+    """Import zstandard, which is only needed for compressed (.zst) files"""
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError(
+            "Compressed .zst files require the zstandard package. "
+            "Run: pip install zstandard"
+        ) from e
+    return zstandard
+
+
+def save_vectors(output_file: str, data: Dict[str, Any]) -> None:
+    """
+    Save extracted vectors, choosing the format from the file extension.
+
+    Files ending in .npz (or .npz.zst) use the NumPy format, anything else
+    is pickled. A trailing .zst compresses the file with multi-threaded
+    zstd (level 3).
+
+    Args:
+        output_file: Path to output file
+        data: Dictionary with "metadata" and "vectors" (ExtractedBatch) keys
+    """
+    compressed = output_file.endswith(".zst")
+    base_name = output_file[: -len(".zst")] if compressed else output_file
+    save = save_vectors_npz if base_name.endswith(".npz") else save_vectors_pickle
+
+    if not compressed:
+        with _open_sequential(output_file, "wb") as f:
+            save(f, data)
+        return
+
+    compressor = _import_zstandard().ZstdCompressor(level=3, threads=-1)
+    with _open_sequential(output_file, "wb") as f:
+        if save is save_vectors_npz:
+            # Zip archives need a seekable file, so build it in a temp file first
+            with tempfile.TemporaryFile() as tmp:
+                save(tmp, data)
+                tmp.seek(0)
+                compressor.copy_stream(
+                    tmp, f, read_size=IO_BUFFER_SIZE, write_size=IO_BUFFER_SIZE
+                )
+        else:
+            with compressor.stream_writer(f, closefd=False) as writer:
+                save(writer, data)
+
+
+def load_vectors(input_file: str) -> Dict[str, Any]:
+    """
+    Load vectors saved by save_vectors().
+
+    Args:
+        input_file: Path to input file
+
+    Returns:
+        Dictionary with "metadata" and "vectors" (ExtractedBatch) keys
+    """
+    compressed = input_file.endswith(".zst")
+    base_name = input_file[: -len(".zst")] if compressed else input_file
+    load = load_vectors_npz if base_name.endswith(".npz") else load_vectors_pickle
+
+    if not compressed:
+        with _open_sequential(input_file, "rb") as f:
+            return load(f)
+
+    decompressor = _import_zstandard().ZstdDecompressor()
+    with _open_sequential(input_file, "rb") as f:
+        if load is load_vectors_npz:
+            with tempfile.TemporaryFile() as tmp:
+                decompressor.copy_stream(
+                    f, tmp, read_size=IO_BUFFER_SIZE, write_size=IO_BUFFER_SIZE
+                )
+                tmp.seek(0)
+                return load(tmp)
+        with decompressor.stream_reader(f) as reader:
+            # Buffered so read()/readinto() always return the full size requested
+            return load(io.BufferedReader(reader))
+
+
+class VectorFileReader:
+    """
+    Reads a vectors file saved by save_vectors() one batch at a time.
+
+    For .npz files (optionally .zst-compressed) the arrays are read straight
+    from the archive members, so only the current batch of vectors is ever
+    in memory. np.load(mmap_mode=...) cannot memory-map arrays inside an .npz,
+    hence the streaming reads. Pickle files are loaded whole and sliced.
+
+    Usage:
+        with VectorFileReader("pinecone_data.npz") as reader:
+            for batch in reader.iter_batches(500):
+                ...
+    """
+
+    def __init__(self, input_file: str):
+        """
+        Initialize the reader.
+
+        Args:
+            input_file: Path to input file
+        """
+        self.input_file = input_file
+        self.metadata: Dict[str, Any] = {}
+        self.count = 0
+        self._vectors: Optional[ExtractedBatch] = None
+        self._archive: Optional[zipfile.ZipFile] = None
+        self._stack = ExitStack()
+
+    def __enter__(self) -> "VectorFileReader":
+        try:
+            self._open()
+        except BaseException:
+            self._stack.close()
+            raise
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stack.close()
+
+    def _open(self) -> None:
+        """Open the file and read the extraction metadata and vector count"""
+        compressed = self.input_file.endswith(".zst")
+        base_name = self.input_file[: -len(".zst")] if compressed else self.input_file
+
+        if not base_name.endswith(".npz"):
+            data = load_vectors(self.input_file)
+            self.metadata = data["metadata"]
+            self._vectors = data["vectors"]
+            self.count = len(self._vectors)
+            return
+
+        f = self._stack.enter_context(open(self.input_file, "rb"))
+        if compressed:
+            # Zip archives need random access, so decompress to a temp file once
+            tmp = self._stack.enter_context(tempfile.TemporaryFile())
+            _import_zstandard().ZstdDecompressor().copy_stream(f, tmp)
+            tmp.seek(0)
+            f = tmp
+
+        self._archive = self._stack.enter_context(zipfile.ZipFile(f))
+        with self._archive.open("info.npy") as member:
+            self.metadata = json.loads(
+                str(np.lib.format.read_array(member, allow_pickle=False))
+            )
+        with self._archive.open("ids.npy") as member:
+            shape, _ = self._read_header(member)
+        self.count = shape[0]
+
+    @staticmethod
+    def _read_header(member: BinaryIO) -> Tuple[Tuple[int, ...], np.dtype]:
+        """Read an .npy header, leaving the member positioned at the array data"""
+        version = np.lib.format.read_magic(member)
+        if version == (1, 0):
+            shape, _, dtype = np.lib.format.read_array_header_1_0(member)
+        else:
+            shape, _, dtype = np.lib.format.read_array_header_2_0(member)
+        return shape, dtype
+
+    def _open_member(self, name: str) -> Tuple[BinaryIO, Tuple[int, ...], np.dtype]:
+        """Open an array in the archive for sequential reading"""
+        member = self._stack.enter_context(self._archive.open(f"{name}.npy"))
+        shape, dtype = self._read_header(member)
+        return member, shape, dtype
+
+    def iter_batches(self, batch_size: int) -> Iterator[ExtractedBatch]:
+        """
+        Iterate over the vectors in batches.
+
+        Args:
+            batch_size: Number of vectors per batch
+
+        Yields:
+            Batches of vector IDs, values, and metadata
+        """
+        if self._vectors is not None:
+            for i in range(0, self.count, batch_size):
+                yield self._vectors[i : i + batch_size]
+            return
+
+        ids_member, _, ids_dtype = self._open_member("ids")
+        vectors_member, vectors_shape, vectors_dtype = self._open_member("vectors")
+        payloads_member, _, _ = self._open_member("payloads")
+        dimension = vectors_shape[-1] if len(vectors_shape) == 2 else 0
+
+        for start in range(0, self.count, batch_size):
+            size = min(batch_size, self.count - start)
+            ids = np.frombuffer(
+                ids_member.read(size * ids_dtype.itemsize), dtype=ids_dtype
+            ).tolist()
+            matrix = np.frombuffer(
+                vectors_member.read(size * dimension * vectors_dtype.itemsize),
+                dtype=vectors_dtype,
+            ).reshape(size, dimension)
+            records = [json.loads(payloads_member.readline()) for _ in range(size)]
+            yield ExtractedBatch(ids, matrix, records)
+
+
+def _detect_text_field(metadata: Dict[str, Any]) -> Optional[str]:
+    """
+    Find the metadata field holding the document text.
+
+    Metadata shape is the same across an index, so this is run once on a
+    sample vector rather than for every row.
+
+    Args:
+        metadata: Metadata of a sample vector
+
+    Returns:
+        Name of the text field, or None if there is no standard one
+    """
+    return next(
+        (field for field in ("text", "content", "page_content") if field in metadata),
+        None,
+    )
+
+
+def _convert_to_langchain_format(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Convert Pinecone metadata to LangChain Qdrant format.
+
+    LangChain Qdrant expects:
+    - page_content: The main text content
+    - metadata: Dictionary with all other fields
+
+    Args:
+        metadata: Original metadata from Pinecone
+
+    Returns:
+        Dictionary with page_content and metadata keys
+    """
+    # Identify the text field (common field names: text, content, page_content)
+    text_field = None
+    for field in ["text", "content", "page_content"]:
+        if field in metadata:
+            text_field = field
+            break
+
+    if not text_field:
+        # If no text field found, try to use the first string value or empty string
+        print("⚠ Warning: No 'text', 'content', or 'page_content' field found in metadata")
+        print(f"  Available fields: {list(metadata.keys())[:5]}")
+        # Use empty string as fallback, or try to find any string field
+        page_content = ""
+        for key, value in metadata.items():
+            if isinstance(value, str) and len(value) > len(page_content):
+                page_content = value
+                text_field = key
+        if not page_content:
+            page_content = ""  # Fallback to empty string
+    else:
+        page_content = metadata[text_field]
+
+    # Create metadata dict without the text field
+    langchain_metadata = {k: v for k, v in metadata.items() if k != text_field}
+
+    # Return in LangChain format
+    return {
+        "page_content": page_content,
+        "metadata": langchain_metadata
+    }
+
+
+def _to_langchain_payloads(
+    records: List[Dict[str, Any]], text_field: Optional[str]
+) -> List[Dict[str, Any]]:
+    """
+    Convert a batch of Pinecone metadata to LangChain Qdrant payloads.
+
+    Rows containing the text field detected for the index take a fast path;
+    the rest fall back to the full per-row conversion.
+
+    Args:
+        records: Pinecone metadata of each vector
+        text_field: Text field detected by _detect_text_field()
+
+    Returns:
+        Payloads with page_content and metadata keys
+    """
+    payloads = []
+    for metadata in records:
+        if text_field in metadata:
+            langchain_metadata = dict(metadata)
+            payloads.append(
+                {
+                    "page_content": langchain_metadata.pop(text_field),
+                    "metadata": langchain_metadata,
+                }
+            )
+        else:
+            payloads.append(_convert_to_langchain_format(metadata))
+    return payloads
+
+
 class PineconeExtractor:
     """Extracts vectors from Pinecone and saves to file"""
 
+    FETCH_BATCH_SIZE = 1000  # Pinecone fetch limit per request
+    LIST_PAGE_SIZE = 100  # Pinecone list_paginated limit per request
+
     def __init__(
         self,
         pinecone_api_key: str,
         pinecone_index_name: str,
+        concurrency: int = 16,
+        id_prefix: Optional[str] = None,
+        shard_index: int = 0,
+        shards: int = 1,
     ):
         """
         Initialize the extractor.
@@ -54,9 +688,20 @@ class PineconeExtractor:
         Args:
             pinecone_api_key: Pinecone API key
             pinecone_index_name: Name of Pinecone index to extract from
+            concurrency: Maximum number of fetch requests in flight at once
+            id_prefix: Only list vector IDs starting with this prefix
+            shard_index: Shard of the vector IDs this extractor handles
+            shards: Total number of shards the vector IDs are split into
         """
         self.pinecone_api_key = pinecone_api_key
         self.pinecone_index_name = pinecone_index_name
+        self.concurrency = concurrency
+        self.id_prefix = id_prefix
+        self.shard_index = shard_index
+        self.shards = shards
+
+        # Fetch response decoder, chosen from the first response's shape
+        self._decode_batch: Optional[Callable[[Any], ExtractedBatch]] = None
 
         # Initialize Pinecone client
         print("Initializing Pinecone client...")
@@ -67,8 +712,8 @@ class PineconeExtractor:
         print(f"Fetching Pinecone index stats for '{pinecone_index_name}'...")
         try:
             stats = self.pinecone_index.describe_index_stats()
-            # Default dimension for text-embedding-3-large
-            self.vector_dimension = 3072
+            # Fall back to the text-embedding-3-large dimension
+            self.vector_dimension = stats.get("dimension") or 3072
             print(f"Using vector dimension: {self.vector_dimension}")
         except Exception as e:
             print(f"Warning: Could not determine vector dimension: {e}")
@@ -90,7 +735,7 @@ class PineconeExtractor:
 
     def fetch_all_pinecone_vectors(
         self, vector_ids: Optional[List[str]] = None
-    ) -> List[Dict[str, Any]]:
+    ) -> ExtractedBatch:
         """
         Fetch all vectors from Pinecone index.
 
@@ -99,10 +744,10 @@ class PineconeExtractor:
                        If None, attempts to query all vectors (may not get all).
 
         Returns:
-            List of vectors with their IDs, values, and metadata
+            Batch of vector IDs, values, and metadata
         """
         print("\nFetching vectors from Pinecone...")
-        all_vectors = []
+        namespace_batches: List[ExtractedBatch] = []
 
         try:
             # Get index stats first
@@ -111,7 +756,7 @@ class PineconeExtractor:
 
             if total_vectors == 0:
                 print("No vectors found in Pinecone index")
-                return []
+                return ExtractedBatch.concat([], self.vector_dimension)
 
             print(f"Total vectors in index: {total_vectors}")
 
@@ -122,40 +767,11 @@ class PineconeExtractor:
 
             # Strategy 2: Try to use list_paginated if available (Pinecone serverless)
             try:
-                print("Attempting to list all vector IDs using list_paginated...")
-                all_ids = []
-                pagination_token = None
-
-                # Try to get all IDs using pagination
-                while True:
-                    if pagination_token:
-                        result = self.pinecone_index.list(
-                            pagination_token=pagination_token, limit=100
-                        )
-                    else:
-                        result = self.pinecone_index.list(limit=100)
-
-                    if hasattr(result, "vectors"):
-                        all_ids.extend([v.id for v in result.vectors])
-                    elif hasattr(result, "ids"):
-                        all_ids.extend(result.ids)
-                    else:
-                        break
-
-                    # Check if there's more to fetch
-                    if hasattr(result, "pagination") and result.pagination:
-                        pagination_token = result.pagination.next
-                    elif hasattr(result, "next"):
-                        pagination_token = result.next
-                    else:
-                        break
-
-                    if not pagination_token:
-                        break
-
-                if all_ids:
-                    print(f"Found {len(all_ids)} vector IDs, fetching vectors...")
-                    return self._fetch_vectors_by_ids(all_ids)
+                print("Listing vector IDs with list_paginated, fetching each page as it arrives...")
+                all_vectors = self._fetch_id_batches(self.iter_id_batches(), total_vectors)
+
+                if all_vectors:
+                    return all_vectors
             except Exception as e:
                 print(f"list_paginated not available: {e}")
                 print("Falling back to query-based approach...")
@@ -166,29 +782,38 @@ class PineconeExtractor:
                 "⚠ Note: This method has limitations. Consider providing a list of vector IDs."
             )
 
-            # Create a zero vector for querying
-            zero_vector = [0.0] * self.vector_dimension
-
-            # Query with high top_k (Pinecone limit is usually 10000)
-            top_k = min(10000, total_vectors)
+            # Pinecone caps top_k at 10000 per query, but the cap applies per
+            # namespace, so query every non-empty namespace in parallel.
+            namespace_counts = {
+                name: summary["vector_count"]
+                for name, summary in (stats.get("namespaces") or {}).items()
+                if summary["vector_count"] > 0
+            } or {"": total_vectors}
 
-            print(f"Querying Pinecone with top_k={top_k}...")
-            results = self.pinecone_index.query(
-                vector=zero_vector,
-                top_k=top_k,
-                include_metadata=True,
-                include_values=True,
+            print(
+                f"Querying {len(namespace_counts)} namespace(s) with up to "
+                f"{self.concurrency} parallel requests..."
             )
-
-            for match in results.matches:
-                vector_data = {
-                    "id": match.id,
-                    "vector": match.values,
-                    "metadata": match.metadata or {},
-                    "score": match.score,
+            with ThreadPoolExecutor(
+                max_workers=min(self.concurrency, len(namespace_counts))
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        self._query_namespace, namespace, min(10000, count)
+                    ): namespace
+                    for namespace, count in namespace_counts.items()
                 }
-                all_vectors.append(vector_data)
+                for future in as_completed(futures):
+                    namespace = futures[future]
+                    matches = future.result()
+                    namespace_batches.append(matches)
+                    label = namespace or "(default)"
+                    print(
+                        f"  Namespace {label}: fetched {len(matches)} of "
+                        f"{namespace_counts[namespace]} vectors"
+                    )
 
+            all_vectors = ExtractedBatch.concat(namespace_batches, self.vector_dimension)
             print(f"Fetched {len(all_vectors)} vectors from Pinecone")
 
             # If we didn't get all vectors, warn the user
@@ -210,7 +835,145 @@ class PineconeExtractor:
 
         return all_vectors
 
-    def _fetch_vectors_by_ids(self, vector_ids: List[str]) -> List[Dict[str, Any]]:
+    def iter_vector_id_pages(self) -> Iterator[List[str]]:
+        """
+        List all vector IDs in the index, one page at a time.
+
+        Uses list_paginated() (Pinecone serverless), which returns at most
+        LIST_PAGE_SIZE IDs per call. When id_prefix is set, Pinecone filters
+        the IDs server-side.
+
+        Yields:
+            Lists of vector IDs, one per pagination page
+        """
+        pagination_token = None
+
+        while True:
+            result = _call_with_retries(
+                self.pinecone_index.list_paginated,
+                prefix=self.id_prefix,
+                limit=self.LIST_PAGE_SIZE,
+                pagination_token=pagination_token,
+            )
+            yield [v.id for v in result.vectors]
+
+            # Check if there's more to fetch
+            pagination_token = result.pagination.next if result.pagination else None
+            if not pagination_token:
+                break
+
+    def iter_id_batches(
+        self, vector_ids: Optional[List[str]] = None
+    ) -> Iterator[List[str]]:
+        """
+        Group vector IDs into batches sized for a single fetch() request.
+
+        When sharded, only the IDs belonging to this extractor's shard are
+        yielded.
+
+        Args:
+            vector_ids: Optional list of vector IDs. If None, IDs are listed
+                        from the index page by page.
+
+        Yields:
+            Lists of at most FETCH_BATCH_SIZE vector IDs
+        """
+        if vector_ids:
+            vector_ids = self._filter_shard(vector_ids)
+            for i in range(0, len(vector_ids), self.FETCH_BATCH_SIZE):
+                yield vector_ids[i : i + self.FETCH_BATCH_SIZE]
+            return
+
+        batch_ids: List[str] = []
+        for page in self.iter_vector_id_pages():
+            batch_ids.extend(self._filter_shard(page))
+            while len(batch_ids) >= self.FETCH_BATCH_SIZE:
+                yield batch_ids[: self.FETCH_BATCH_SIZE]
+                batch_ids = batch_ids[self.FETCH_BATCH_SIZE :]
+        if batch_ids:
+            yield batch_ids
+
+    def _filter_shard(self, vector_ids: List[str]) -> List[str]:
+        """
+        Keep the vector IDs that belong to this extractor's shard.
+
+        IDs are assigned to shards by CRC32, which is stable across processes
+        and hosts (unlike hash()), so every shard sees a disjoint subset.
+        """
+        if self.shards <= 1:
+            return vector_ids
+        return [
+            vec_id
+            for vec_id in vector_ids
+            if zlib.crc32(vec_id.encode("utf-8")) % self.shards == self.shard_index
+        ]
+
+    def _query_namespace(self, namespace: str, top_k: int) -> ExtractedBatch:
+        """
+        Fetch up to top_k vectors from one namespace with a zero-vector query.
+
+        Args:
+            namespace: Pinecone namespace to query ("" for the default namespace)
+            top_k: Number of matches to request (Pinecone allows at most 10000)
+
+        Returns:
+            Batch of vector IDs, values, and metadata
+        """
+        results = _call_with_retries(
+            self.pinecone_index.query,
+            namespace=namespace,
+            vector=[0.0] * self.vector_dimension,
+            top_k=top_k,
+            include_metadata=True,
+            include_values=True,
+        )
+        return ExtractedBatch.from_rows(
+            [(match.id, match.values, match.metadata) for match in results.matches],
+            self.vector_dimension,
+        )
+
+    def _fetch_batch(self, batch_ids: List[str]) -> ExtractedBatch:
+        """
+        Fetch a single batch of vectors by their IDs.
+
+        Args:
+            batch_ids: Vector IDs to fetch (at most FETCH_BATCH_SIZE)
+
+        Returns:
+            Batch of vector IDs, values, and metadata
+        """
+        fetch_response = _call_with_retries(self.pinecone_index.fetch, ids=batch_ids)
+
+        # The response shape depends on the pinecone-client version and never
+        # changes within a run, so dispatch once instead of on every vector
+        if self._decode_batch is None:
+            if hasattr(fetch_response, "vectors"):
+                self._decode_batch = self._decode_object_response
+            else:
+                self._decode_batch = self._decode_dict_response
+        return self._decode_batch(fetch_response)
+
+    def _decode_object_response(self, fetch_response: Any) -> ExtractedBatch:
+        """Decode a FetchResponse object (current pinecone-client)"""
+        return ExtractedBatch.from_rows(
+            [
+                (vec_id, vec_data.values, vec_data.metadata)
+                for vec_id, vec_data in fetch_response.vectors.items()
+            ],
+            self.vector_dimension,
+        )
+
+    def _decode_dict_response(self, fetch_response: Dict[str, Any]) -> ExtractedBatch:
+        """Decode a plain {id: {"values", "metadata"}} dict response"""
+        return ExtractedBatch.from_rows(
+            [
+                (vec_id, vec_data["values"], vec_data.get("metadata"))
+                for vec_id, vec_data in fetch_response.items()
+            ],
+            self.vector_dimension,
+        )
+
+    def _fetch_vectors_by_ids(self, vector_ids: List[str]) -> ExtractedBatch:
         """
         Fetch vectors by their IDs using Pinecone's fetch() method.
 
@@ -218,61 +981,68 @@ class PineconeExtractor:
             vector_ids: List of vector IDs to fetch
 
         Returns:
-            List of vectors with their IDs, values, and metadata
+            Batch of vector IDs, values, and metadata
         """
-        all_vectors = []
-        batch_size = 1000  # Pinecone fetch limit per request
+        return self._fetch_id_batches(self.iter_id_batches(vector_ids), len(vector_ids))
 
-        print(f"Fetching {len(vector_ids)} vectors in batches of {batch_size}...")
+    def _fetch_id_batches(
+        self, id_batches: Iterable[List[str]], total: int
+    ) -> ExtractedBatch:
+        """
+        Fetch batches of vector IDs concurrently on a thread pool.
 
-        for i in range(0, len(vector_ids), batch_size):
-            batch_ids = vector_ids[i : i + batch_size]
+        The fetch step is bound by network round-trips rather than CPU.
+        Batches are submitted as soon as the iterable yields them, so when IDs
+        are listed page by page, fetching overlaps with listing.
 
-            try:
-                fetch_response = self.pinecone_index.fetch(ids=batch_ids)
-
-                # Process fetched vectors
-                if hasattr(fetch_response, "vectors"):
-                    for vec_id, vec_data in fetch_response.vectors.items():
-                        vector_info = {
-                            "id": vec_id,
-                            "vector": vec_data.values
-                            if hasattr(vec_data, "values")
-                            else None,
-                            "metadata": vec_data.metadata
-                            if hasattr(vec_data, "metadata")
-                            else {},
-                        }
-                        all_vectors.append(vector_info)
-                elif isinstance(fetch_response, dict):
-                    for vec_id, vec_data in fetch_response.items():
-                        vector_info = {
-                            "id": vec_id,
-                            "vector": vec_data.get("values")
-                            if isinstance(vec_data, dict)
-                            else None,
-                            "metadata": vec_data.get("metadata", {})
-                            if isinstance(vec_data, dict)
-                            else {},
-                        }
-                        all_vectors.append(vector_info)
-
-                progress = min(i + batch_size, len(vector_ids))
-                print(f"  Progress: {progress}/{len(vector_ids)} vectors fetched")
+        Args:
+            id_batches: Iterable of ID batches (at most FETCH_BATCH_SIZE each)
+            total: Expected number of vectors, for progress reporting
 
-            except Exception as e:
-                print(f"  ⚠ Error fetching batch {i//batch_size + 1}: {e}")
-                continue
+        Returns:
+            Batch of vector IDs, values, and metadata
+        """
+        print(
+            f"Fetching vectors in batches of {self.FETCH_BATCH_SIZE} "
+            f"({self.concurrency} concurrent requests)..."
+        )
+
+        batch_results: Dict[int, ExtractedBatch] = {}
+        fetched_count = 0
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = {
+                executor.submit(self._fetch_batch, batch_ids): (batch_num, len(batch_ids))
+                for batch_num, batch_ids in enumerate(id_batches)
+            }
+            for future in as_completed(futures):
+                batch_num, batch_len = futures[future]
+                try:
+                    batch_results[batch_num] = future.result()
+                except Exception as e:
+                    print(f"  ⚠ Error fetching batch {batch_num + 1}: {e}")
+                    continue
+
+                fetched_count += batch_len
+                print(f"  Progress: {fetched_count}/{total} vectors fetched")
+
+        # Keep the original ID order regardless of completion order
+        all_vectors = ExtractedBatch.concat(
+            [batch_results[batch_num] for batch_num in sorted(batch_results)],
+            self.vector_dimension,
+        )
 
         print(f"Successfully fetched {len(all_vectors)} vectors")
         return all_vectors
 
     def extract_and_save(self, output_file: str, vector_ids: Optional[List[str]] = None) -> bool:
         """
-        Extract vectors from Pinecone and save to pickle file.
+        Extract vectors from Pinecone and save to file.
+
+        Files ending in .npz use the NumPy format, anything else is pickled.
+        A trailing .zst compresses the file with zstd.
 
         Args:
-            output_file: Path to output pickle file
+            output_file: Path to output .npz (or pickle) file
             vector_ids: Optional list of vector IDs to extract
 
         Returns:
@@ -301,7 +1071,12 @@ class PineconeExtractor:
             return False
         print()
 
-        # Save to pickle file
+        # Convert to LangChain payloads once here, so every upload of the file
+        # sends them as-is instead of converting inside the upload loop
+        text_field = _detect_text_field(vectors.metadata[0])
+        vectors.metadata = _to_langchain_payloads(vectors.metadata, text_field)
+
+        # Save to file
         print(f"Saving {len(vectors)} vectors to {output_file}...")
         try:
             # Create metadata
@@ -310,7 +1085,8 @@ class PineconeExtractor:
                 "pinecone_index": self.pinecone_index_name,
                 "vector_count": len(vectors),
                 "vector_dimension": self.vector_dimension,
-                "sample_ids": [v["id"] for v in vectors[:5]] if vectors else [],
+                "sample_ids": vectors.ids[:5],
+                "payload_format": "langchain",
             }
 
             # Save data
@@ -319,21 +1095,21 @@ class PineconeExtractor:
                 "vectors": vectors,
             }
 
-            with open(output_file, "wb") as f:
-                pickle.dump(data, f)
+            save_vectors(output_file, data)
 
             file_size = os.path.getsize(output_file) / (1024 * 1024)  # Size in MB
             print(f"✓ Successfully saved {len(vectors)} vectors to {output_file}")
             print(f"  File size: {file_size:.2f} MB")
             print(f"  Extraction date: {metadata['extraction_date']}")
             
-            # Show sample metadata structure
+            # Show sample payload structure
             if vectors:
-                sample_metadata = vectors[0].get("metadata", {})
-                print(f"\n  Sample metadata fields: {list(sample_metadata.keys())[:10]}")
-                if "text" in sample_metadata:
-                    text_preview = sample_metadata["text"][:100] + "..." if len(sample_metadata["text"]) > 100 else sample_metadata["text"]
-                    print(f"  Text field found: {text_preview}")
+                sample_payload = vectors.metadata[0]
+                print(f"\n  Sample metadata fields: {list(sample_payload['metadata'].keys())[:10]}")
+                if text_field:
+                    page_content = sample_payload["page_content"]
+                    text_preview = page_content[:100] + "..." if len(page_content) > 100 else page_content
+                    print(f"  Text field found ({text_field}): {text_preview}")
                 print()
 
             print("=" * 60)
@@ -354,12 +1130,18 @@ class PineconeExtractor:
 class QdrantUploader:
     """Loads vectors from file and uploads to Qdrant"""
 
+    QUANTIZATION_TYPES = ("scalar", "binary", "product")
+
     def __init__(
         self,
         qdrant_url: str,
         qdrant_api_key: Optional[str],
         qdrant_collection_name: str,
-        batch_size: int = 100,
+        batch_size: int = 500,
+        concurrency: int = 8,
+        prefer_grpc: bool = True,
+        grpc_port: int = 6334,
+        quantization: Optional[str] = None,
     ):
         """
         Initialize the uploader.
@@ -369,18 +1151,43 @@ class QdrantUploader:
             qdrant_api_key: Qdrant API key (optional)
             qdrant_collection_name: Name of Qdrant collection to create/use
             batch_size: Number of vectors to process in each batch
+            concurrency: Maximum number of upsert requests in flight at once
+            prefer_grpc: Use the gRPC API, whose binary protobuf payloads are
+                         several times smaller than REST JSON for vectors
+            grpc_port: Qdrant gRPC port
+            quantization: Quantization for new collections ("scalar", "binary"
+                          or "product"); original vectors are then kept on disk
         """
         self.qdrant_url = qdrant_url
         self.qdrant_api_key = qdrant_api_key
         self.qdrant_collection_name = qdrant_collection_name
         self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.quantization = quantization
+
+        # Metadata field holding the document text, detected from a sample vector
+        self.text_field: Optional[str] = None
+
+        # Set when uploading a file whose payloads were already converted to
+        # the LangChain format at extract time
+        self.payloads_normalized = False
+
+        # Set when uploading into an existing collection, so interrupted
+        # migrations can resume without re-sending completed batches
+        self.skip_existing = False
 
         # Initialize Qdrant client
-        print("Initializing Qdrant client...")
+        print(f"Initializing Qdrant client ({'gRPC' if prefer_grpc else 'REST'})...")
+        client_kwargs: Dict[str, Any] = {"url": qdrant_url, "timeout": 60}
         if qdrant_api_key:
-            self.qdrant_client = QdrantClient(url=qdrant_url, api_key=qdrant_api_key)
-        else:
-            self.qdrant_client = QdrantClient(url=qdrant_url)
+            client_kwargs["api_key"] = qdrant_api_key
+        if prefer_grpc:
+            client_kwargs.update(
+                prefer_grpc=True,
+                grpc_port=grpc_port,
+                grpc_options={"grpc.max_send_message_length": 256 * 1024 * 1024},
+            )
+        self.qdrant_client = QdrantClient(**client_kwargs)
 
     def check_qdrant_connection(self) -> bool:
         """Check if Qdrant is accessible"""
@@ -410,9 +1217,12 @@ class QdrantUploader:
             print(f"✗ Failed to drop collection: {e}")
             return False
 
-    def create_qdrant_collection(self, vector_dimension: int, drop_existing: bool = True) -> bool:
+    def create_qdrant_collection(self, vector_dimension: int, drop_existing: bool = False) -> bool:
         """
         Create Qdrant collection. Optionally drops existing collection first.
+
+        When the existing collection is kept, points that are already present
+        are skipped during upload, so an interrupted migration can be resumed.
         
         Args:
             vector_dimension: Dimension of the vectors
@@ -424,6 +1234,7 @@ class QdrantUploader:
                 if not self.drop_collection_if_exists():
                     return False
                 print()
+            self.skip_existing = False
 
             # Check if collection still exists (shouldn't if we just dropped it)
             collections = self.qdrant_client.get_collections()
@@ -443,16 +1254,23 @@ class QdrantUploader:
                 print(
                     f"  Distance: {collection_info.config.params.vectors.distance}"
                 )
+                print("  Points already in the collection will be skipped")
+                self.skip_existing = True
                 return True
 
-            # Create collection
+            # Create collection. With quantization, only the quantized copy is
+            # kept in RAM and the original vectors move to disk.
             print(f"Creating Qdrant collection '{self.qdrant_collection_name}'...")
+            if self.quantization:
+                print(f"  Quantization: {self.quantization} (original vectors on disk)")
             self.qdrant_client.create_collection(
                 collection_name=self.qdrant_collection_name,
                 vectors_config=VectorParams(
                     size=vector_dimension,
                     distance=Distance.COSINE,
+                    on_disk=bool(self.quantization),
                 ),
+                quantization_config=self._quantization_config(),
             )
             print(
                 f"✓ Collection '{self.qdrant_collection_name}' created successfully"
@@ -462,35 +1280,47 @@ class QdrantUploader:
             print(f"✗ Failed to create collection: {e}")
             return False
 
+    def _quantization_config(self):
+        """
+        Build the quantization config for the configured quantization type.
+
+        Returns:
+            Qdrant quantization config, or None when quantization is disabled
+        """
+        if self.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+            )
+        if self.quantization == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        if self.quantization == "product":
+            return ProductQuantization(
+                product=ProductQuantizationConfig(
+                    compression=CompressionRatio.X16, always_ram=True
+                )
+            )
+        return None
+
     def load_from_file(self, input_file: str) -> Dict[str, Any]:
         """
-        Load vectors from pickle file.
+        Load vectors from .npz or pickle file.
 
         Args:
-            input_file: Path to input pickle file
+            input_file: Path to input .npz (or pickle) file
 
         Returns:
             Dictionary with metadata and vectors
         """
         print(f"Loading data from {input_file}...")
         try:
-            with open(input_file, "rb") as f:
-                data = pickle.load(f)
+            data = load_vectors(input_file)
 
             if "metadata" not in data or "vectors" not in data:
                 raise ValueError(
                     "Invalid file format: missing 'metadata' or 'vectors' keys"
                 )
 
-            metadata = data["metadata"]
-            vectors = data["vectors"]
-
-            print(f"✓ Loaded {len(vectors)} vectors from file")
-            print(f"  Extraction date: {metadata.get('extraction_date', 'unknown')}")
-            print(f"  Pinecone index: {metadata.get('pinecone_index', 'unknown')}")
-            print(f"  Vector dimension: {metadata.get('vector_dimension', 'unknown')}")
-            print()
-
+            self._print_file_summary(len(data["vectors"]), data["metadata"])
             return data
 
         except Exception as e:
@@ -500,59 +1330,21 @@ class QdrantUploader:
             traceback.print_exc()
             raise
 
-    def _convert_to_langchain_format(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Convert Pinecone metadata to LangChain Qdrant format.
-        
-        LangChain Qdrant expects:
-        - page_content: The main text content
-        - metadata: Dictionary with all other fields
-        
-        Args:
-            metadata: Original metadata from Pinecone
-            
-        Returns:
-            Dictionary with page_content and metadata keys
-        """
-        # Identify the text field (common field names: text, content, page_content)
-        text_field = None
-        for field in ["text", "content", "page_content"]:
-            if field in metadata:
-                text_field = field
-                break
-        
-        if not text_field:
-            # If no text field found, try to use the first string value or empty string
-            print("⚠ Warning: No 'text', 'content', or 'page_content' field found in metadata")
-            print(f"  Available fields: {list(metadata.keys())[:5]}")
-            # Use empty string as fallback, or try to find any string field
-            page_content = ""
-            for key, value in metadata.items():
-                if isinstance(value, str) and len(value) > len(page_content):
-                    page_content = value
-                    text_field = key
-            if not page_content:
-                page_content = ""  # Fallback to empty string
-        else:
-            page_content = metadata[text_field]
-        
-        # Create metadata dict without the text field
-        langchain_metadata = {k: v for k, v in metadata.items() if k != text_field}
-        
-        # Return in LangChain format
-        return {
-            "page_content": page_content,
-            "metadata": langchain_metadata
-        }
-
-    def insert_vectors_to_qdrant(
-        self, vectors: List[Dict[str, Any]]
-    ) -> bool:
+    @staticmethod
+    def _print_file_summary(vector_count: int, metadata: Dict[str, Any]) -> None:
+        """Print the vector count and extraction metadata of a loaded file"""
+        print(f"✓ Loaded {vector_count} vectors from file")
+        print(f"  Extraction date: {metadata.get('extraction_date', 'unknown')}")
+        print(f"  Pinecone index: {metadata.get('pinecone_index', 'unknown')}")
+        print(f"  Vector dimension: {metadata.get('vector_dimension', 'unknown')}")
+        print()
+
+    def insert_vectors_to_qdrant(self, vectors: ExtractedBatch) -> bool:
         """
         Insert vectors into Qdrant collection in LangChain-compatible format.
 
         Args:
-            vectors: List of vectors with IDs, values, and metadata
+            vectors: Batch of vector IDs, values, and metadata
 
         Returns:
             True if successful, False otherwise
@@ -563,62 +1355,18 @@ class QdrantUploader:
 
         print(f"\nInserting {len(vectors)} vectors into Qdrant...")
         print("Converting to LangChain format (page_content + metadata)...")
-        
-        # Show sample conversion
-        if vectors:
-            sample_vec = vectors[0]
-            sample_langchain = self._convert_to_langchain_format(sample_vec["metadata"])
-            print(f"  Sample conversion:")
-            print(f"    page_content length: {len(sample_langchain['page_content'])} chars")
-            print(f"    metadata keys: {list(sample_langchain['metadata'].keys())[:5]}")
         print()
 
         try:
-            # Process vectors in batches
-            total_batches = (len(vectors) + self.batch_size - 1) // self.batch_size
-            inserted_count = 0
-
-            for batch_num in range(total_batches):
-                start_idx = batch_num * self.batch_size
-                end_idx = min(start_idx + self.batch_size, len(vectors))
-                batch = vectors[start_idx:end_idx]
-
-                # Convert to Qdrant PointStruct format with LangChain structure
-                points = []
-                for vec in batch:
-                    # Qdrant requires integer or UUID IDs
-                    # Convert string IDs to integers if possible, otherwise use hash
-                    point_id = self._convert_id(vec["id"])
-
-                    # Convert metadata to LangChain format
-                    langchain_data = self._convert_to_langchain_format(vec["metadata"])
-                    
-                    # Create payload with page_content and metadata as LangChain expects
-                    payload = {
-                        "page_content": langchain_data["page_content"],
-                        "metadata": langchain_data["metadata"]
-                    }
-
-                    point = PointStruct(
-                        id=point_id,
-                        vector=vec["vector"],
-                        payload=payload,
-                    )
-                    points.append(point)
-
-                # Insert batch into Qdrant
-                self.qdrant_client.upsert(
-                    collection_name=self.qdrant_collection_name, points=points
-                )
-
-                inserted_count += len(batch)
-                progress = (inserted_count / len(vectors)) * 100
-                print(
-                    f"  Progress: {inserted_count}/{len(vectors)} vectors ({progress:.1f}%)"
-                )
+            batches = (
+                vectors[i : i + self.batch_size]
+                for i in range(0, len(vectors), self.batch_size)
+            )
+            inserted_count, failed_count = self.upsert_stream(batches, total=len(vectors))
 
-                # Small delay to avoid overwhelming the server
-                time.sleep(0.1)
+            if failed_count:
+                print(f"✗ Failed to insert {failed_count} of {len(vectors)} vectors into Qdrant")
+                return False
 
             print(f"✓ Successfully inserted {inserted_count} vectors into Qdrant")
             return True
@@ -630,36 +1378,180 @@ class QdrantUploader:
             traceback.print_exc()
             return False
 
-    def _convert_id(self, id_str: str) -> int:
+    def _show_sample_conversion(self, metadata: Dict[str, Any]) -> None:
+        """Print the LangChain conversion of a sample vector and detect its text field"""
+        if self.payloads_normalized:
+            sample_langchain = metadata
+        else:
+            sample_langchain = _convert_to_langchain_format(metadata)
+            self.text_field = _detect_text_field(metadata)
+        print(f"  Sample conversion:")
+        print(f"    page_content length: {len(sample_langchain['page_content'])} chars")
+        print(f"    metadata keys: {list(sample_langchain['metadata'].keys())[:5]}")
+
+    def upsert_stream(
+        self,
+        batches: Iterable[ExtractedBatch],
+        total: Optional[int] = None,
+    ) -> Tuple[int, int]:
         """
-        Convert string ID to integer for Qdrant.
+        Upsert batches of vectors concurrently as they are produced.
 
-        Qdrant supports both integer and UUID IDs. This function converts
-        string IDs to integers using a hash function to ensure consistency.
+        Incoming batches are re-split to batch_size and handed to a thread
+        pool. At most twice `concurrency` upserts are pending at once, so
+        lazily produced batches (a streamed file, a live Pinecone fetch) are
+        never fully materialised in memory.
 
         Args:
-            id_str: String ID from Pinecone
+            batches: Iterable of vector batches of any size
+            total: Total number of vectors, for progress reporting
 
         Returns:
-            Integer ID for Qdrant
+            Tuple of (inserted_count, failed_count)
+        """
+        slots = threading.BoundedSemaphore(self.concurrency * 2)
+        lock = threading.Lock()
+        counts = {"inserted": 0, "failed": 0}
+
+        def on_done(future, size: int) -> None:
+            with lock:
+                error = future.exception()
+                if error is not None:
+                    counts["failed"] += size
+                    print(f"  ⚠ Error upserting batch: {error}")
+                elif total:
+                    counts["inserted"] += size
+                    progress = (counts["inserted"] / total) * 100
+                    print(
+                        f"  Progress: {counts['inserted']}/{total} vectors ({progress:.1f}%)"
+                    )
+                else:
+                    counts["inserted"] += size
+                    print(f"  Progress: {counts['inserted']} vectors")
+            slots.release()
+
+        print(
+            f"Uploading in batches of up to {self.batch_size} vectors "
+            f"({self.concurrency} concurrent requests)..."
+        )
+
+        sample_shown = False
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            for vectors in batches:
+                if vectors and not sample_shown:
+                    self._show_sample_conversion(vectors.metadata[0])
+                    sample_shown = True
+
+                for i in range(0, len(vectors), self.batch_size):
+                    chunk = vectors[i : i + self.batch_size]
+                    slots.acquire()
+                    future = executor.submit(self._upsert_batch, chunk)
+                    future.add_done_callback(partial(on_done, size=len(chunk)))
+
+        return counts["inserted"], counts["failed"]
+
+    def _upsert_batch(self, batch: ExtractedBatch) -> None:
+        """
+        Convert a batch of vectors to points and upsert them into Qdrant.
+
+        Args:
+            batch: Batch of vector IDs, values, and metadata
         """
-        # Use hash to convert string to integer
-        # This ensures consistent mapping
-        return abs(hash(id_str)) % (2**63)  # Keep within int64 range
+        # Qdrant requires integer or UUID IDs, so convert the whole batch up front
+        point_ids = self._convert_ids(batch.ids)
+
+        # When resuming into an existing collection, skip points already uploaded
+        if self.skip_existing:
+            existing = {
+                record.id
+                for record in _call_with_retries(
+                    self.qdrant_client.retrieve,
+                    collection_name=self.qdrant_collection_name,
+                    ids=point_ids,
+                    with_payload=False,
+                    with_vectors=False,
+                )
+            }
+            if existing:
+                remaining = [
+                    row for row, point_id in enumerate(point_ids) if point_id not in existing
+                ]
+                if not remaining:
+                    return
+                point_ids = [point_ids[row] for row in remaining]
+                batch = batch.take(remaining)
+
+        # Build the batch column-wise in LangChain structure. Files from the
+        # extract step already hold LangChain payloads; otherwise convert with
+        # the text field detected once per upload. A column-oriented Batch
+        # skips validating a PointStruct model per vector and converts
+        # straight to gRPC.
+        if self.payloads_normalized:
+            payloads = batch.metadata
+        else:
+            payloads = _to_langchain_payloads(batch.metadata, self.text_field)
 
-    def verify_migration(self, expected_count: int) -> bool:
-        """Verify that all vectors were migrated successfully"""
+        points = Batch(
+            ids=point_ids,
+            vectors=batch.vectors.tolist(),
+            payloads=payloads,
+        )
+
+        # wait=False lets Qdrant acknowledge before the batch is applied;
+        # verify_migration() waits for the final point count instead
+        _call_with_retries(
+            self.qdrant_client.upsert,
+            collection_name=self.qdrant_collection_name,
+            points=points,
+            wait=False,
+        )
+
+    @staticmethod
+    def _convert_ids(id_strs: List[str]) -> List[str]:
+        """
+        Convert string IDs to UUIDs for Qdrant.
+
+        Qdrant supports both integer and UUID IDs. Each Pinecone ID maps to a
+        deterministic UUIDv5, so the same vector always gets the same point ID
+        (re-runs overwrite instead of duplicate), there is no risk of hash
+        collisions, and a point can be looked up again from its Pinecone ID.
+
+        Args:
+            id_strs: String IDs from Pinecone
+
+        Returns:
+            UUID strings for Qdrant, in the same order
+        """
+        uuid5 = uuid.uuid5
+        namespace = uuid.NAMESPACE_URL
+        return [str(uuid5(namespace, id_str)) for id_str in id_strs]
+
+    def verify_migration(self, expected_count: int, timeout: float = 30.0) -> bool:
+        """
+        Verify that all vectors were migrated successfully.
+
+        Upserts are sent with wait=False, so the point count is polled until it
+        reaches the expected value or the timeout expires.
+        """
         print("\nVerifying migration...")
         try:
-            collection_info = self.qdrant_client.get_collection(
-                self.qdrant_collection_name
-            )
-            actual_count = collection_info.points_count
+            deadline = time.monotonic() + timeout
+            while True:
+                collection_info = self.qdrant_client.get_collection(
+                    self.qdrant_collection_name
+                )
+                actual_count = collection_info.points_count
+                if actual_count >= expected_count or time.monotonic() >= deadline:
+                    break
+                time.sleep(1)
 
             print(f"Expected vectors: {expected_count}")
             print(f"Actual vectors in Qdrant: {actual_count}")
 
-            if actual_count == expected_count:
+            # A collection resumed into may also hold points from other runs
+            if actual_count == expected_count or (
+                self.skip_existing and actual_count > expected_count
+            ):
                 print("✓ Migration verification successful")
                 return True
             else:
@@ -672,12 +1564,12 @@ class QdrantUploader:
             print(f"✗ Error verifying migration: {e}")
             return False
 
-    def upload_from_file(self, input_file: str, drop_existing: bool = True) -> bool:
+    def upload_from_file(self, input_file: str, drop_existing: bool = False) -> bool:
         """
         Load vectors from file and upload to Qdrant.
 
         Args:
-            input_file: Path to input pickle file
+            input_file: Path to input .npz (or pickle) file
 
         Returns:
             True if successful, False otherwise
@@ -693,16 +1585,23 @@ class QdrantUploader:
             return False
         print()
 
-        # Load data from file
+        # Open data file; .npz files are streamed batch by batch, so memory
+        # use stays flat regardless of the file size
+        print(f"Loading data from {input_file}...")
         try:
-            data = self.load_from_file(input_file)
-            vectors = data["vectors"]
-            metadata = data["metadata"]
-            vector_dimension = metadata.get("vector_dimension", 3072)
+            with VectorFileReader(input_file) as reader:
+                return self._upload_from_reader(reader, drop_existing)
         except Exception as e:
             print(f"✗ Failed to load data: {e}")
             return False
 
+    def _upload_from_reader(self, reader: VectorFileReader, drop_existing: bool) -> bool:
+        """Create the collection and upload all batches from an open reader"""
+        metadata = reader.metadata
+        vector_dimension = metadata.get("vector_dimension", 3072)
+        self.payloads_normalized = metadata.get("payload_format") == "langchain"
+        self._print_file_summary(reader.count, metadata)
+
         # Create collection (will drop existing if requested)
         print("Setting up Qdrant collection...")
         if drop_existing:
@@ -712,14 +1611,26 @@ class QdrantUploader:
         print()
 
         # Insert vectors
-        print("Inserting vectors into Qdrant...")
-        if not self.insert_vectors_to_qdrant(vectors):
+        print(f"Inserting {reader.count} vectors into Qdrant...")
+        try:
+            inserted_count, failed_count = self.upsert_stream(
+                reader.iter_batches(self.batch_size), total=reader.count
+            )
+        except Exception as e:
+            print(f"✗ Error inserting vectors into Qdrant: {e}")
+            import traceback
+
+            traceback.print_exc()
+            return False
+        if failed_count:
+            print(f"✗ Failed to insert {failed_count} of {reader.count} vectors into Qdrant")
             return False
+        print(f"✓ Successfully inserted {inserted_count} vectors into Qdrant")
         print()
 
         # Verify migration
         print("Verifying migration...")
-        self.verify_migration(len(vectors))
+        self.verify_migration(reader.count)
         print()
 
         print("=" * 60)
@@ -728,69 +1639,421 @@ class QdrantUploader:
         return True
 
 
+class Migrator:
+    """Streams vectors from Pinecone straight into Qdrant"""
+
+    def __init__(
+        self,
+        extractor: PineconeExtractor,
+        uploader: QdrantUploader,
+        queue_size: int = 4,
+    ):
+        """
+        Initialize the migrator.
+
+        Args:
+            extractor: Extractor for the source Pinecone index
+            uploader: Uploader for the target Qdrant collection
+            queue_size: Maximum number of fetched batches waiting for upload
+        """
+        self.extractor = extractor
+        self.uploader = uploader
+        self.queue_size = queue_size
+        self.migrated_count = 0
+        # Vectors in ID batches whose Pinecone fetch failed
+        self.failed_fetch_count = 0
+
+    def _produce(
+        self,
+        id_batches: Iterator[List[str]],
+        fetched: "queue.Queue[Optional[ExtractedBatch]]",
+        errors: List[Exception],
+    ) -> None:
+        """
+        Fetch ID batches concurrently and push the results onto the queue.
+
+        At most `extractor.concurrency` fetches are in flight, and the bounded
+        queue blocks fetching whenever the upload side falls behind.
+        """
+        try:
+            with ThreadPoolExecutor(max_workers=self.extractor.concurrency) as executor:
+                in_flight: deque = deque()
+                for batch_ids in id_batches:
+                    future = executor.submit(self.extractor._fetch_batch, batch_ids)
+                    in_flight.append((batch_ids, future))
+                    if len(in_flight) >= self.extractor.concurrency:
+                        self._put_result(*in_flight.popleft(), fetched)
+                while in_flight:
+                    self._put_result(*in_flight.popleft(), fetched)
+        except Exception as e:
+            errors.append(e)
+        finally:
+            fetched.put(None)
+
+    def _put_result(self, batch_ids: List[str], future, fetched: "queue.Queue") -> None:
+        """Move a completed fetch onto the queue, counting the IDs of failed batches."""
+        try:
+            fetched.put(future.result())
+        except Exception as e:
+            self.failed_fetch_count += len(batch_ids)
+            print(f"  ⚠ Error fetching batch: {e}")
+
+    def run(
+        self,
+        vector_ids: Optional[List[str]] = None,
+        drop_existing: bool = False,
+        setup_collection: bool = True,
+    ) -> bool:
+        """
+        Migrate all vectors, overlapping Pinecone fetches with Qdrant upserts.
+
+        When the extractor is sharded, only that shard's vectors are migrated
+        and the final point count is not verified, since other shards write
+        to the same collection.
+
+        Args:
+            vector_ids: Optional list of vector IDs to migrate
+            drop_existing: If True, drop existing collection before creating new one
+            setup_collection: If False, the collection has already been
+                              created (e.g. by the parent of sharded workers)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        sharded = self.extractor.shards > 1
+        print("=" * 60)
+        print("Migrate Data from Pinecone to Qdrant")
+        print("=" * 60)
+        print()
+
+        print("Checking connections...")
+        if not self.extractor.check_pinecone_connection():
+            return False
+        if not self.uploader.check_qdrant_connection():
+            return False
+        print()
+
+        if setup_collection:
+            print("Setting up Qdrant collection...")
+            if drop_existing:
+                print("Note: Existing collection will be dropped and recreated")
+            if not self.uploader.create_qdrant_collection(
+                self.extractor.vector_dimension, drop_existing=drop_existing
+            ):
+                return False
+            print()
+
+        # Peek at the first ID batch; without ID listing, fall back to the
+        # non-streaming query-based extraction
+        id_batches = self.extractor.iter_id_batches(vector_ids)
+        try:
+            first_batch = next(id_batches, None)
+        except Exception as e:
+            print(f"list_paginated not available: {e}")
+            if sharded:
+                # The query-based fallback cannot be split between shards
+                print("✗ Sharded migration requires listing vector IDs")
+                return False
+            first_batch = None
+
+        if first_batch is None and sharded:
+            print(f"No vectors in shard {self.extractor.shard_index}")
+            expected_count = 0
+        elif first_batch is None:
+            print("Vector IDs could not be listed, falling back to non-streaming migration...")
+            vectors = self.extractor.fetch_all_pinecone_vectors(vector_ids=vector_ids)
+            if not self.uploader.insert_vectors_to_qdrant(vectors):
+                return False
+            expected_count = len(vectors)
+        else:
+            print("Streaming vectors from Pinecone to Qdrant...")
+            fetched: "queue.Queue[Optional[ExtractedBatch]]" = queue.Queue(
+                maxsize=self.queue_size
+            )
+            errors: List[Exception] = []
+            producer = threading.Thread(
+                target=self._produce,
+                args=(chain([first_batch], id_batches), fetched, errors),
+                daemon=True,
+            )
+            producer.start()
+            expected_count, failed_count = self.uploader.upsert_stream(
+                iter(fetched.get, None)
+            )
+            producer.join()
+
+            if errors:
+                print(f"✗ Error listing vectors from Pinecone: {errors[0]}")
+                return False
+            if self.failed_fetch_count:
+                print(f"✗ Failed to fetch {self.failed_fetch_count} vectors from Pinecone")
+                return False
+            if failed_count:
+                print(f"✗ Failed to upsert {failed_count} vectors into Qdrant")
+                return False
+            print(f"✓ Successfully migrated {expected_count} vectors into Qdrant")
+        print()
+
+        self.migrated_count = expected_count
+        if not sharded:
+            if not self.uploader.verify_migration(expected_count):
+                return False
+            print()
+
+        print("=" * 60)
+        print("Migration completed successfully!")
+        print("=" * 60)
+        return True
+
+
+def _read_vector_ids(vector_ids_file: Optional[str]) -> Optional[List[str]]:
+    """Read vector IDs (one per line) if a vector IDs file was given"""
+    if not vector_ids_file or not os.path.exists(vector_ids_file):
+        return None
+
+    print(f"Reading vector IDs from {vector_ids_file}...")
+    with open(vector_ids_file, "r") as f:
+        vector_ids = [line.strip() for line in f if line.strip()]
+    print(f"Loaded {len(vector_ids)} vector IDs from file")
+    print()
+    return vector_ids
+
+
+def _create_extractor_from_env(shard_index: int = 0, shards: int = 1) -> PineconeExtractor:
+    """Create a PineconeExtractor from environment variables"""
+    pinecone_api_key = os.getenv("PINECONE_API_KEY")
+    pinecone_index_name = os.getenv("PINECONE_INDEX_NAME", "informasi-umum-itb")
+    concurrency = int(os.getenv("PINECONE_CONCURRENCY", "16"))
+    id_prefix = os.getenv("PINECONE_ID_PREFIX") or None
+
+    if not pinecone_api_key:
+        print("Error: PINECONE_API_KEY environment variable is required")
+        sys.exit(1)
+
+    print("Extraction Configuration:")
+    print(f"  Pinecone Index: {pinecone_index_name}")
+    print(f"  Concurrency: {concurrency}")
+    if id_prefix:
+        print(f"  ID Prefix: {id_prefix}")
+    if shards > 1:
+        print(f"  Shard: {shard_index + 1} of {shards}")
+    print()
+
+    return PineconeExtractor(
+        pinecone_api_key=pinecone_api_key,
+        pinecone_index_name=pinecone_index_name,
+        concurrency=concurrency,
+        id_prefix=id_prefix,
+        shard_index=shard_index,
+        shards=shards,
+    )
+
+
+def _create_uploader_from_env() -> QdrantUploader:
+    """Create a QdrantUploader from environment variables"""
+    qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
+    qdrant_api_key = os.getenv("QDRANT_API_KEY")
+    qdrant_collection_name = os.getenv(
+        "QDRANT_COLLECTION_NAME", "informasi-umum-itb"
+    )
+    batch_size = int(os.getenv("MIGRATION_BATCH_SIZE", "500"))
+    concurrency = int(os.getenv("MIGRATION_CONCURRENCY", "8"))
+    prefer_grpc = os.getenv("QDRANT_PREFER_GRPC", "true").lower() == "true"
+    grpc_port = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+    quantization = os.getenv("QDRANT_QUANTIZATION", "").lower() or None
+
+    if not qdrant_url:
+        print("Error: QDRANT_URL environment variable is required")
+        sys.exit(1)
+
+    if quantization and quantization not in QdrantUploader.QUANTIZATION_TYPES:
+        print(
+            f"Error: QDRANT_QUANTIZATION must be one of "
+            f"{', '.join(QdrantUploader.QUANTIZATION_TYPES)}"
+        )
+        sys.exit(1)
+
+    print("Upload Configuration:")
+    print(f"  Qdrant URL: {qdrant_url}")
+    print(f"  Qdrant Collection: {qdrant_collection_name}")
+    print(f"  Batch Size: {batch_size}")
+    print(f"  Concurrency: {concurrency}")
+    print(f"  Transport: {f'gRPC (port {grpc_port})' if prefer_grpc else 'REST'}")
+    print(f"  Quantization: {quantization or 'none'}")
+    print()
+
+    return QdrantUploader(
+        qdrant_url=qdrant_url,
+        qdrant_api_key=qdrant_api_key,
+        qdrant_collection_name=qdrant_collection_name,
+        batch_size=batch_size,
+        concurrency=concurrency,
+        prefer_grpc=prefer_grpc,
+        grpc_port=grpc_port,
+        quantization=quantization,
+    )
+
+
+def _print_next_steps() -> None:
+    """Print follow-up steps after vectors are in Qdrant"""
+    print("\nNext steps:")
+    print("1. Update your code to use Qdrant instead of Pinecone")
+    print("2. Test your application with the new Qdrant vector store")
+    print("3. Once verified, you can remove Pinecone configuration")
+
+
+def _migrate_shard(
+    shard_index: int,
+    shards: int,
+    vector_ids: Optional[List[str]],
+    skip_existing: bool,
+) -> Tuple[bool, int]:
+    """
+    Migrate one shard in a worker process.
+
+    The collection is set up by the parent process, so workers only stream
+    their share of the vectors into it.
+
+    Returns:
+        Tuple of (success, migrated_count)
+    """
+    extractor = _create_extractor_from_env(shard_index=shard_index, shards=shards)
+    uploader = _create_uploader_from_env()
+    uploader.skip_existing = skip_existing
+
+    migrator = Migrator(extractor, uploader)
+    success = migrator.run(vector_ids=vector_ids, setup_collection=False)
+    return success, migrator.migrated_count
+
+
+def _migrate_sharded(
+    shards: int, vector_ids: Optional[List[str]], drop_existing: bool
+) -> bool:
+    """
+    Migrate with one worker process per shard.
+
+    Each worker has its own Pinecone and Qdrant connections, so throughput
+    is no longer bound by one process's CPU core and sockets.
+
+    Args:
+        shards: Number of worker processes
+        vector_ids: Optional list of vector IDs to migrate
+        drop_existing: If True, drop existing collection before creating new one
+
+    Returns:
+        True if successful, False otherwise
+    """
+    extractor = _create_extractor_from_env()
+    uploader = _create_uploader_from_env()
+
+    print("Setting up Qdrant collection...")
+    if drop_existing:
+        print("Note: Existing collection will be dropped and recreated")
+    if not uploader.check_qdrant_connection() or not uploader.create_qdrant_collection(
+        extractor.vector_dimension, drop_existing=drop_existing
+    ):
+        return False
+    print()
+
+    print(f"Starting {shards} shard worker processes...")
+    # Spawn rather than fork: gRPC channels do not survive a fork
+    context = multiprocessing.get_context("spawn")
+    with context.Pool(shards) as pool:
+        results = pool.starmap(
+            _migrate_shard,
+            [
+                (shard_index, shards, vector_ids, uploader.skip_existing)
+                for shard_index in range(shards)
+            ],
+        )
+
+    failed_shards = [index for index, (success, _) in enumerate(results) if not success]
+    if failed_shards:
+        print(f"✗ Shards failed: {', '.join(str(index) for index in failed_shards)}")
+        return False
+
+    expected_count = sum(count for _, count in results)
+    print(f"✓ Successfully migrated {expected_count} vectors into Qdrant")
+    return uploader.verify_migration(expected_count)
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
-        description="Migrate vectors from Pinecone to Qdrant (two-step process)"
+        description="Migrate vectors from Pinecone to Qdrant (two-step or streaming)"
     )
     parser.add_argument(
         "--step",
-        choices=["extract", "upload"],
+        choices=["extract", "upload", "migrate"],
         required=True,
-        help="Step to execute: 'extract' to pull from Pinecone, 'upload' to push to Qdrant",
+        help=(
+            "Step to execute: 'extract' to pull from Pinecone, 'upload' to push to Qdrant, "
+            "'migrate' to stream from Pinecone to Qdrant without an intermediate file"
+        ),
     )
     parser.add_argument(
         "--output",
         type=str,
-        help="Output file path for extract step (default: pinecone_data.pkl)",
-        default="pinecone_data.pkl",
+        help="Output file path for extract step, .npz or pickle (default: pinecone_data.npz)",
+        default="pinecone_data.npz",
     )
     parser.add_argument(
         "--input",
         type=str,
-        help="Input file path for upload step (default: pinecone_data.pkl)",
-        default="pinecone_data.pkl",
+        help="Input file path for upload step, .npz or pickle (default: pinecone_data.npz)",
+        default="pinecone_data.npz",
     )
     parser.add_argument(
         "--vector-ids-file",
         type=str,
-        help="Optional file containing vector IDs (one per line) for extract step",
+        help="Optional file containing vector IDs (one per line) for extract and migrate steps",
+    )
+    parser.add_argument(
+        "--drop",
+        action="store_true",
+        help="Drop existing collection before uploading (default: keep it and skip points already uploaded)",
     )
     parser.add_argument(
         "--no-drop",
         action="store_true",
-        help="Don't drop existing collection before uploading (default: drops existing collection)",
+        help="Keep existing collection (the default; kept for backwards compatibility)",
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Split the migrate step into N shards by vector ID hash, one worker process each (default: 1)",
+    )
+    parser.add_argument(
+        "--shard-index",
+        type=int,
+        help="Only migrate this shard (0-based) in the current process, e.g. to spread shards across hosts",
     )
 
     args = parser.parse_args()
 
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+    if args.shards > 1 and args.step != "migrate":
+        parser.error("--shards is only supported by the migrate step")
+    if args.shard_index is not None:
+        if args.shards == 1:
+            parser.error("--shard-index requires --shards")
+        if not 0 <= args.shard_index < args.shards:
+            parser.error("--shard-index must be between 0 and --shards - 1")
+        if args.drop:
+            parser.error("--drop cannot be combined with --shard-index")
+
+    # Keep existing collection by default; point IDs are deterministic, so
+    # re-running resumes instead of duplicating (unless --drop flag is set)
+    drop_existing = args.drop and not args.no_drop
+
     if args.step == "extract":
         # Step 1: Extract from Pinecone
-        pinecone_api_key = os.getenv("PINECONE_API_KEY")
-        pinecone_index_name = os.getenv("PINECONE_INDEX_NAME", "informasi-umum-itb")
-
-        if not pinecone_api_key:
-            print("Error: PINECONE_API_KEY environment variable is required")
-            sys.exit(1)
-
-        print("Extraction Configuration:")
-        print(f"  Pinecone Index: {pinecone_index_name}")
-        print(f"  Output File: {args.output}")
+        extractor = _create_extractor_from_env()
+        print(f"Output File: {args.output}")
         print()
-
-        # Load vector IDs if provided
-        vector_ids = None
-        if args.vector_ids_file and os.path.exists(args.vector_ids_file):
-            print(f"Reading vector IDs from {args.vector_ids_file}...")
-            with open(args.vector_ids_file, "r") as f:
-                vector_ids = [line.strip() for line in f if line.strip()]
-            print(f"Loaded {len(vector_ids)} vector IDs from file")
-            print()
-
-        extractor = PineconeExtractor(
-            pinecone_api_key=pinecone_api_key,
-            pinecone_index_name=pinecone_index_name,
-        )
+        vector_ids = _read_vector_ids(args.vector_ids_file)
 
         success = extractor.extract_and_save(args.output, vector_ids=vector_ids)
 
@@ -805,52 +2068,48 @@ def main():
 
     elif args.step == "upload":
         # Step 2: Upload to Qdrant
-        qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
-        qdrant_api_key = os.getenv("QDRANT_API_KEY")
-        qdrant_collection_name = os.getenv(
-            "QDRANT_COLLECTION_NAME", "informasi-umum-itb"
-        )
-        batch_size = int(os.getenv("MIGRATION_BATCH_SIZE", "100"))
-
-        if not qdrant_url:
-            print("Error: QDRANT_URL environment variable is required")
-            sys.exit(1)
-
         if not os.path.exists(args.input):
             print(f"Error: Input file '{args.input}' does not exist")
             print("Please run the extract step first:")
             print(f"  python {sys.argv[0]} --step extract --output {args.input}")
             sys.exit(1)
 
-        print("Upload Configuration:")
-        print(f"  Qdrant URL: {qdrant_url}")
-        print(f"  Qdrant Collection: {qdrant_collection_name}")
-        print(f"  Input File: {args.input}")
-        print(f"  Batch Size: {batch_size}")
+        uploader = _create_uploader_from_env()
+        print(f"Input File: {args.input}")
         print()
 
-        uploader = QdrantUploader(
-            qdrant_url=qdrant_url,
-            qdrant_api_key=qdrant_api_key,
-            qdrant_collection_name=qdrant_collection_name,
-            batch_size=batch_size,
-        )
-
-        # Drop existing collection by default (unless --no-drop flag is set)
-        drop_existing = not args.no_drop
         success = uploader.upload_from_file(args.input, drop_existing=drop_existing)
 
         if success:
             print("\n✓ Upload completed successfully!")
-            print("\nNext steps:")
-            print("1. Update your code to use Qdrant instead of Pinecone")
-            print("2. Test your application with the new Qdrant vector store")
-            print("3. Once verified, you can remove Pinecone configuration")
+            _print_next_steps()
             sys.exit(0)
         else:
             print("\n✗ Upload failed. Please check the errors above.")
             sys.exit(1)
 
+    elif args.step == "migrate":
+        # Both steps, streamed without an intermediate file
+        vector_ids = _read_vector_ids(args.vector_ids_file)
+
+        if args.shards > 1 and args.shard_index is None:
+            success = _migrate_sharded(args.shards, vector_ids, drop_existing)
+        else:
+            extractor = _create_extractor_from_env(
+                shard_index=args.shard_index or 0, shards=args.shards
+            )
+            uploader = _create_uploader_from_env()
+            migrator = Migrator(extractor, uploader)
+            success = migrator.run(vector_ids=vector_ids, drop_existing=drop_existing)
+
+        if success:
+            print("\n✓ Migration completed successfully!")
+            _print_next_steps()
+            sys.exit(0)
+        else:
+            print("\n✗ Migration failed. Please check the errors above.")
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -17,11 +17,17 @@ Usage:
 """
 
 import argparse
+import asyncio
+import io
 import json
-import os
 import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, Dict, Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add project root and scripts dir to path for imports
 SCRIPT_DIR = Path(__file__).parent
@@ -70,164 +76,58 @@ def pretty_print_pasals(pasals, limit: Optional[int] = None) -> None:
         print(f"  Content: {pasal.content[:200]}{'...' if len(pasal.content) > 200 else ''}")
 
 
-def load_rag_documents_from_json(json_path: str) -> List[Dict[str, Any]]:
-    """Load RAG documents from a JSON file."""
-    json_file = Path(json_path)
-    if not json_file.exists():
-        raise FileNotFoundError(f"JSON file not found: {json_path}")
-
-    with open(json_file, "r", encoding="utf-8") as f:
-        data = json.load(f)
-
-    # Handle both formats: direct list or dict with "documents" key
-    if isinstance(data, list):
-        return data
-    elif isinstance(data, dict) and "documents" in data:
-        return data["documents"]
-    else:
-        raise ValueError("JSON must be a list or a dict with 'documents' key")
-
-
-def upload_to_qdrant(
-    documents: List[Dict[str, Any]],
-    batch_size: int = 50,
-    embedding_provider: str = "openai",
-) -> bool:
+def load_rag_documents_from_json(json_path: str) -> Iterator[Dict[str, Any]]:
     """
-    Embed and upload documents to Qdrant.
-
-    Args:
-        documents: List of documents to embed and upload
-        batch_size: Batch size for upload
-        embedding_provider: Either "openai" or "qwen"
+    Stream RAG documents from a JSON file.
 
-    Uses the same configuration as agents/models.py:
-    - OpenAI: text-embedding-3-large, collection "informasi-umum-itb"
-    - Qwen: qwen/qwen3-embedding-8b, collection "informasi-umum-itb-qwen3"
+    Documents are yielded as they are parsed with ijson, so memory use does
+    not grow with the file size. Without ijson the whole file is loaded.
     """
-    # Load environment variables
-    from dotenv import load_dotenv
-    load_dotenv()
+    json_file = Path(json_path)
+    if not json_file.exists():
+        raise FileNotFoundError(f"JSON file not found: {json_path}")
 
-    # Import Qdrant and embeddings
-    try:
-        from langchain_openai import OpenAIEmbeddings
-        from langchain_qdrant import QdrantVectorStore
-        from qdrant_client import QdrantClient
-        from langchain_core.documents import Document
-    except ImportError as e:
-        print(f"Error: Required packages are missing: {e}")
-        print("Run: pip install langchain-openai langchain-qdrant qdrant-client python-dotenv")
-        return False
-
-    # Get configuration from environment
-    qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
-    qdrant_api_key = os.getenv("QDRANT_API_KEY")
-
-    # Normalize embedding provider
-    embedding_provider = embedding_provider.lower()
-
-    # Set collection name and embedding based on provider
-    if embedding_provider == "qwen":
-        collection_name = "informasi-umum-itb-qwen3"
-        embedding_model = os.getenv("EMBEDDING_MODEL", "qwen/qwen3-embedding-8b")
-        openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
-
-        if not openrouter_api_key:
-            print("Error: OPENROUTER_API_KEY environment variable is required for Qwen embeddings")
-            return False
-
-        embeddings = OpenAIEmbeddings(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=openrouter_api_key,
-            model=embedding_model,
-            dimensions=1024,  # Explicitly set dimension for qwen3-embedding-8b
-        )
-        print(f"  Using Qwen embedding: {embedding_model}")
-    else:  # openai (default)
-        collection_name = "informasi-umum-itb"
-        embeddings = OpenAIEmbeddings(model="text-embedding-3-large")
-        print(f"  Using OpenAI embedding: text-embedding-3-large")
-
-    # Initialize Qdrant client
-    if qdrant_api_key:
-        qdrant_client = QdrantClient(url=qdrant_url, api_key=qdrant_api_key)
-    else:
-        qdrant_client = QdrantClient(url=qdrant_url)
-
-    print(f"  Qdrant URL: {qdrant_url}")
-    print(f"  Collection: {collection_name}")
-
-    # Check if collection exists
     try:
-        collections = qdrant_client.get_collections()
-        existing_collections = [col.name for col in collections.collections]
-
-        if collection_name not in existing_collections:
-            print(f"  Warning: Collection '{collection_name}' does not exist")
-            print(f"  Creating collection '{collection_name}'...")
+        import ijson
+    except ImportError:
+        ijson = None
 
-            # Get embedding dimension
-            test_embedding = embeddings.embed_query("test")
-            dimension = len(test_embedding)
-
-            from qdrant_client.models import Distance, VectorParams
-            qdrant_client.create_collection(
-                collection_name=collection_name,
-                vectors_config=VectorParams(size=dimension, distance=Distance.COSINE),
-            )
-            print(f"  Created collection with dimension {dimension}")
+    if ijson is None:
+        if orjson is not None:
+            data = orjson.loads(json_file.read_bytes())
         else:
-            collection_info = qdrant_client.get_collection(collection_name)
-            print(f"  Existing collection points: {collection_info.points_count}")
-    except Exception as e:
-        print(f"  Error checking/creating collection: {e}")
-        return False
-
-    # Initialize vector store
-    vectorstore = QdrantVectorStore(
-        client=qdrant_client,
-        collection_name=collection_name,
-        embedding=embeddings,
-    )
-
-    # Convert documents to LangChain Document format
-    langchain_docs = []
-    for doc in documents:
-        if isinstance(doc, dict):
-            langchain_docs.append(Document(
-                page_content=doc.get("page_content", doc.get("content", "")),
-                metadata=doc.get("metadata", {}),
-            ))
+            with open(json_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+
+        # Handle both formats: direct list or dict with "documents" key
+        if isinstance(data, list):
+            return iter(data)
+        elif isinstance(data, dict) and "documents" in data:
+            return iter(data["documents"])
         else:
-            # Already a Document object
-            langchain_docs.append(doc)
-
-    print(f"  Uploading {len(langchain_docs)} documents in batches of {batch_size}...")
-
-    # Upload in batches
-    total = len(langchain_docs)
-    try:
-        for i in range(0, total, batch_size):
-            batch = langchain_docs[i:i + batch_size]
-            vectorstore.add_documents(batch)
-
-            progress = min(i + batch_size, total)
-            pct = progress / total * 100
-            print(f"    Progress: {progress}/{total} ({pct:.1f}%)")
+            raise ValueError("JSON must be a list or a dict with 'documents' key")
 
-        # Verify upload
-        collection_info = qdrant_client.get_collection(collection_name)
-        print(f"  Upload complete!")
-        print(f"  Collection now has {collection_info.points_count} points")
+    # Walk the whole file once before streaming so malformed JSON fails
+    # before any upload starts, and find where the documents array lives
+    prefix = None
+    with open(json_file, "rb") as f:
+        try:
+            for path, event, _ in ijson.parse(f):
+                if prefix is None and event == "start_array":
+                    if path == "":
+                        prefix = "item"
+                    elif path == "documents":
+                        prefix = "documents.item"
+        except ijson.JSONError as e:
+            raise ValueError(f"Invalid JSON in {json_path}: {e}") from e
+    if prefix is None:
+        raise ValueError("JSON must be a list or a dict with 'documents' key")
 
-        return True
+    def iter_documents() -> Iterator[Dict[str, Any]]:
+        with open(json_file, "rb") as f:
+            yield from ijson.items(f, prefix, use_float=True)
 
-    except Exception as e:
-        print(f"  Error uploading documents: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    return iter_documents()
 
 
 def main():
@@ -305,6 +205,12 @@ Examples:
         action="store_true",
         help="Include raw extracted text in JSON output",
     )
+    parser.add_argument(
+        "--pdf-workers",
+        type=int,
+        default=None,
+        help="Processes extracting PDF pages in parallel; 1 disables (default: number of CPUs)",
+    )
     parser.add_argument(
         "--upload-to-qdrant",
         action="store_true",
@@ -313,8 +219,50 @@ Examples:
     parser.add_argument(
         "--batch-size",
         type=int,
-        default=50,
-        help="Batch size for Qdrant upload (default: 50)",
+        default=32,
+        help="Documents per Qdrant upload batch; 15-50 is the sweet spot, at most 256 (default: 32)",
+    )
+    parser.add_argument(
+        "--upload-concurrency",
+        type=int,
+        default=4,
+        help="Number of batches uploading to Qdrant at once (default: 4)",
+    )
+    parser.add_argument(
+        "--no-embed-cache",
+        action="store_true",
+        help="Disable the embedding cache (always call the embedding API)",
+    )
+    parser.add_argument(
+        "--clear-embed-cache",
+        action="store_true",
+        help="Clear cached embeddings for the embedding model before uploading",
+    )
+    parser.add_argument(
+        "--local-qwen",
+        action="store_true",
+        help="Run Qwen embeddings locally with sentence-transformers (GPU) instead of OpenRouter",
+    )
+    parser.add_argument(
+        "--embed-batch-size",
+        type=int,
+        default=64,
+        help="Texts per forward pass with --local-qwen (default: 64)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print per-step upload details in addition to the progress bars",
+    )
+    parser.add_argument(
+        "--force-reupload",
+        action="store_true",
+        help="Re-embed and upload documents that are already in the collection",
+    )
+    parser.add_argument(
+        "--no-quantize",
+        action="store_true",
+        help="Create new collections with plain float32 vectors in RAM instead of int8 quantization",
     )
     parser.add_argument(
         "--embedding-provider",
@@ -326,10 +274,21 @@ Examples:
 
     args = parser.parse_args()
 
+    if not 1 <= args.batch_size <= 256:
+        parser.error("--batch-size must be between 1 and 256")
+    if args.pdf_workers is not None and args.pdf_workers < 1:
+        parser.error("--pdf-workers must be at least 1")
+    if args.upload_concurrency < 1:
+        parser.error("--upload-concurrency must be at least 1")
+    if args.local_qwen and args.embedding_provider != "qwen":
+        parser.error("--local-qwen requires --embedding-provider qwen")
+    if args.embed_batch_size < 1:
+        parser.error("--embed-batch-size must be at least 1")
+
     print_header()
 
     # Variables to hold RAG documents for upload
-    rag_documents: List[Dict[str, Any]] = []
+    rag_documents: Iterable[Dict[str, Any]] = []
     parser_instance = None
     input_path = None
 
@@ -342,8 +301,8 @@ Examples:
 
         print(f"Loading from JSON: {args.json_input}")
         try:
+            # Streamed into the uploader rather than loaded up front
             rag_documents = load_rag_documents_from_json(args.json_input)
-            print(f"Loaded {len(rag_documents)} documents from JSON")
         except Exception as e:
             print(f"Error loading JSON: {e}")
             import traceback
@@ -378,12 +337,19 @@ Examples:
         print(f"Source name: {source_name}")
         print()
 
-        parser_instance = PeraturanParser(args.pdf_path, source_name)
+        # Read the file once; the parser works on the in-memory bytes
+        pdf_bytes = input_path.read_bytes()
+        parser_instance = PeraturanParser(
+            args.pdf_path,
+            source_name,
+            io.BytesIO(pdf_bytes),
+            max_workers=args.pdf_workers,
+        )
 
         # Parse document
         print("Parsing document...")
         try:
-            pasals = parser_instance.parse()
+            pasals = parser_instance.parse(keep_raw=args.include_raw_text)
         except Exception as e:
             print(f"Error parsing document: {e}")
             import traceback
@@ -396,8 +362,8 @@ Examples:
 
         print(f"Found {len(pasals)} Pasal")
 
-        # Convert to RAG format
-        rag_documents = parser_instance.to_rag_documents()
+        # Convert to RAG format lazily; only the rag output and upload use it
+        rag_documents = parser_instance.iter_rag_documents()
 
         # Output based on format (skip if only uploading)
         if args.output == "console":
@@ -425,15 +391,20 @@ Examples:
 
             rag_data = {
                 "metadata": parser_instance.get_summary(),
-                "documents": rag_documents,
+                "documents": parser_instance.to_rag_documents(),
             }
 
             if args.include_raw_text:
                 rag_data["raw_text"] = parser_instance.raw_text
 
-            output_path.write_text(
-                json.dumps(rag_data, ensure_ascii=False, indent=2)
-            )
+            if orjson is not None:
+                output_path.write_bytes(
+                    orjson.dumps(rag_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                output_path.write_text(
+                    json.dumps(rag_data, ensure_ascii=False, indent=2)
+                )
 
             print(f"\nRAG format output written to: {output_path}")
             print_summary(parser_instance)
@@ -445,7 +416,26 @@ Examples:
         print("Uploading to Qdrant")
         print("=" * 60)
 
-        success = upload_to_qdrant(rag_documents, args.batch_size, args.embedding_provider)
+        try:
+            from parsers.qdrant_upload import upload_documents
+        except ImportError:
+            from scripts.parsers.qdrant_upload import upload_documents
+
+        success = asyncio.run(
+            upload_documents(
+                rag_documents,
+                provider=args.embedding_provider,
+                batch_size=args.batch_size,
+                concurrency=args.upload_concurrency,
+                embed_cache_dir=None if args.no_embed_cache else "cache",
+                clear_embed_cache=args.clear_embed_cache,
+                local_qwen=args.local_qwen,
+                embed_batch_size=args.embed_batch_size,
+                verbose=args.verbose,
+                force_reupload=args.force_reupload,
+                quantize=not args.no_quantize,
+            )
+        )
 
         if not success:
             print("\nError: Failed to upload to Qdrant")
@@ -455,7 +445,6 @@ Examples:
         print("=" * 60)
         print("Summary")
         print("=" * 60)
-        print(f"  Documents processed: {len(rag_documents)}")
         collection_name = "informasi-umum-itb-qwen3" if args.embedding_provider == "qwen" else "informasi-umum-itb"
         print(f"  Uploaded to: {collection_name}")
         print()
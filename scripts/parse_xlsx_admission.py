@@ -14,7 +14,7 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import os
+import asyncio
 import sys
 from pathlib import Path
 
@@ -27,157 +27,6 @@ if str(SCRIPT_DIR) not in sys.path:
     sys.path.insert(0, str(SCRIPT_DIR))
 
 
-def upload_to_qdrant(
-    documents: list[dict],
-    batch_size: int = 50,
-    embedding_provider: str = "openai",
-    collection_name: str | None = None,
-) -> bool:
-    """
-    Embed and upload documents to Qdrant.
-
-    Args:
-        documents: List of documents to embed and upload
-        batch_size: Batch size for upload
-        embedding_provider: Either "openai" or "qwen"
-        collection_name: Custom collection name (auto-selected if not provided)
-
-    Uses the same configuration as agents/models.py:
-    - OpenAI: text-embedding-3-large, collection "informasi-umum-itb"
-    - Qwen: qwen/qwen3-embedding-8b, collection "informasi-umum-itb-qwen3"
-    """
-    from dotenv import load_dotenv
-
-    load_dotenv()
-
-    # Import Qdrant and embeddings
-    try:
-        from langchain_openai import OpenAIEmbeddings
-        from langchain_qdrant import QdrantVectorStore
-        from qdrant_client import QdrantClient
-        from langchain_core.documents import Document
-    except ImportError as e:
-        print(f"Error: Required packages are missing: {e}")
-        print("Run: pip install langchain-openai langchain-qdrant qdrant-client python-dotenv")
-        return False
-
-    # Get configuration from environment
-    qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
-    qdrant_api_key = os.getenv("QDRANT_API_KEY")
-
-    # Normalize embedding provider
-    embedding_provider = embedding_provider.lower()
-
-    # Set collection name and embedding based on provider
-    if embedding_provider == "qwen":
-        # Use custom collection if provided, otherwise use default
-        if collection_name is None:
-            collection_name = "informasi-umum-itb-qwen3"
-        embedding_model = os.getenv("EMBEDDING_MODEL", "qwen/qwen3-embedding-8b")
-        openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
-
-        if not openrouter_api_key:
-            print("Error: OPENROUTER_API_KEY environment variable is required for Qwen embeddings")
-            return False
-
-        embeddings = OpenAIEmbeddings(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=openrouter_api_key,
-            model=embedding_model,
-            dimensions=1024,  # Explicitly set dimension for qwen3-embedding-8b
-        )
-        print(f"  Using Qwen embedding: {embedding_model}")
-    else:  # openai (default)
-        # Use custom collection if provided, otherwise use default
-        if collection_name is None:
-            collection_name = "informasi-umum-itb"
-        embeddings = OpenAIEmbeddings(model="text-embedding-3-large")
-        print("  Using OpenAI embedding: text-embedding-3-large")
-
-    # Initialize Qdrant client
-    if qdrant_api_key:
-        qdrant_client = QdrantClient(url=qdrant_url, api_key=qdrant_api_key)
-    else:
-        qdrant_client = QdrantClient(url=qdrant_url)
-
-    print(f"  Qdrant URL: {qdrant_url}")
-    print(f"  Collection: {collection_name}")
-
-    # Check if collection exists
-    try:
-        collections = qdrant_client.get_collections()
-        existing_collections = [col.name for col in collections.collections]
-
-        if collection_name not in existing_collections:
-            print(f"  Warning: Collection '{collection_name}' does not exist")
-            print(f"  Creating collection '{collection_name}'...")
-
-            # Get embedding dimension
-            test_embedding = embeddings.embed_query("test")
-            dimension = len(test_embedding)
-
-            from qdrant_client.models import Distance, VectorParams
-            qdrant_client.create_collection(
-                collection_name=collection_name,
-                vectors_config=VectorParams(size=dimension, distance=Distance.COSINE),
-            )
-            print(f"  Created collection with dimension {dimension}")
-        else:
-            collection_info = qdrant_client.get_collection(collection_name)
-            print(f"  Existing collection points: {collection_info.points_count}")
-    except Exception as e:
-        print(f"  Error checking/creating collection: {e}")
-        return False
-
-    # Initialize vector store
-    vectorstore = QdrantVectorStore(
-        client=qdrant_client,
-        collection_name=collection_name,
-        embedding=embeddings,
-    )
-
-    # Convert documents to LangChain Document format
-    langchain_docs: list[Document] = []
-    for doc in documents:
-        if isinstance(doc, dict):
-            langchain_docs.append(
-                Document(
-                    page_content=doc.get("page_content", doc.get("content", "")),
-                    metadata=doc.get("metadata", {}),
-                )
-            )
-        else:
-            # Already a Document object
-            langchain_docs.append(doc)
-
-    print(f"  Uploading {len(langchain_docs)} documents in batches of {batch_size}...")
-
-    # Upload in batches
-    total = len(langchain_docs)
-    try:
-        for i in range(0, total, batch_size):
-            batch = langchain_docs[i : i + batch_size]
-            vectorstore.add_documents(batch)
-
-            progress = min(i + batch_size, total)
-            pct = progress / total * 100
-            print(f"    Progress: {progress}/{total} ({pct:.1f}%)")
-
-        # Verify upload
-        collection_info = qdrant_client.get_collection(collection_name)
-        print("  Upload complete!")
-        print(f"  Collection now has {collection_info.points_count} points")
-
-        return True
-
-    except Exception as e:
-        print(f"  Error uploading documents: {e}")
-        import traceback
-
-        traceback.print_exc()
-        return False
-
-
 def main() -> None:
     """Main entry point."""
     from dotenv import load_dotenv
@@ -198,7 +47,7 @@ Examples:
   # Force refresh (ignore cache, re-call LLM)
   uv run scripts/parse_xlsx_admission.py --force-refresh --upload-to-qdrant
 
-  # Re-embed from cache (load cached .pkl files, upload to Qdrant)
+  # Re-embed from cache (load cached .json files, upload to Qdrant)
   uv run scripts/parse_xlsx_admission.py --from-cache --upload-to-qdrant
 
   # Parse specific sheets only
@@ -227,12 +76,12 @@ Examples:
     parser.add_argument(
         "--from-cache",
         action="store_true",
-        help="Load documents from cache .pkl files instead of parsing XLSX",
+        help="Load documents from cache .json files instead of parsing XLSX",
     )
 
     # Cache options
     parser.add_argument(
-        "--cache-dir", default="cache", help="Directory to store cache .pkl files"
+        "--cache-dir", default="cache", help="Directory to store cache .json files"
     )
     parser.add_argument(
         "--no-cache", action="store_true", help="Disable caching (always call LLM)"
@@ -249,10 +98,75 @@ Examples:
         "--clear-cache-all", action="store_true", help="Clear all cache"
     )
     parser.add_argument("--list-cache", action="store_true", help="List all cached sheets")
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=20,
+        help="LLM calls converting rows at once (default: 20)",
+    )
+    parser.add_argument(
+        "--llm-batch-size",
+        type=int,
+        default=10,
+        help="Rows converted per LLM call; 1 sends one prompt per row (default: 10)",
+    )
+    parser.add_argument(
+        "--sheet-workers",
+        type=int,
+        default=4,
+        help="Sheets parsed at the same time (default: 4)",
+    )
 
     # Output options
     parser.add_argument("--upload-to-qdrant", action="store_true")
-    parser.add_argument("--batch-size", type=int, default=50)
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=32,
+        help="Documents per Qdrant upload batch; 15-50 is the sweet spot, at most 256 (default: 32)",
+    )
+    parser.add_argument(
+        "--upload-concurrency",
+        type=int,
+        default=4,
+        help="Number of batches uploading to Qdrant at once (default: 4)",
+    )
+    parser.add_argument(
+        "--no-embed-cache",
+        action="store_true",
+        help="Disable the embedding cache (always call the embedding API)",
+    )
+    parser.add_argument(
+        "--clear-embed-cache",
+        action="store_true",
+        help="Clear cached embeddings for the embedding model before uploading",
+    )
+    parser.add_argument(
+        "--local-qwen",
+        action="store_true",
+        help="Run Qwen embeddings locally with sentence-transformers (GPU) instead of OpenRouter",
+    )
+    parser.add_argument(
+        "--embed-batch-size",
+        type=int,
+        default=64,
+        help="Texts per forward pass with --local-qwen (default: 64)",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Print per-step upload details in addition to the progress bars",
+    )
+    parser.add_argument(
+        "--force-reupload",
+        action="store_true",
+        help="Re-embed and upload documents that are already in the collection",
+    )
+    parser.add_argument(
+        "--no-quantize",
+        action="store_true",
+        help="Create new collections with plain float32 vectors in RAM instead of int8 quantization",
+    )
     parser.add_argument(
         "--collection",
         help="Qdrant collection name (default: auto-selected based on embedding provider)",
@@ -266,6 +180,21 @@ Examples:
 
     args = parser.parse_args()
 
+    if not 1 <= args.batch_size <= 256:
+        parser.error("--batch-size must be between 1 and 256")
+    if args.llm_concurrency < 1:
+        parser.error("--llm-concurrency must be at least 1")
+    if args.llm_batch_size < 1:
+        parser.error("--llm-batch-size must be at least 1")
+    if args.sheet_workers < 1:
+        parser.error("--sheet-workers must be at least 1")
+    if args.upload_concurrency < 1:
+        parser.error("--upload-concurrency must be at least 1")
+    if args.local_qwen and args.embedding_provider != "qwen":
+        parser.error("--local-qwen requires --embedding-provider qwen")
+    if args.embed_batch_size < 1:
+        parser.error("--embed-batch-size must be at least 1")
+
     # Initialize cache
     from scripts.parsers.xlsx_parser import LLMCache
 
@@ -314,6 +243,9 @@ Examples:
             cache_dir=args.cache_dir,
             use_cache=not args.no_cache,
             force_refresh=args.force_refresh,
+            llm_concurrency=args.llm_concurrency,
+            llm_batch_size=args.llm_batch_size,
+            sheet_workers=args.sheet_workers,
         )
 
         # Parse
@@ -329,7 +261,24 @@ Examples:
         print("Uploading to Qdrant")
         print("=" * 60)
 
-        success = upload_to_qdrant(rag_docs, args.batch_size, args.embedding_provider, args.collection)
+        from scripts.parsers.qdrant_upload import upload_documents
+
+        success = asyncio.run(
+            upload_documents(
+                rag_docs,
+                provider=args.embedding_provider,
+                batch_size=args.batch_size,
+                collection_name=args.collection,
+                concurrency=args.upload_concurrency,
+                embed_cache_dir=None if args.no_embed_cache else args.cache_dir,
+                clear_embed_cache=args.clear_embed_cache,
+                local_qwen=args.local_qwen,
+                embed_batch_size=args.embed_batch_size,
+                verbose=args.verbose,
+                force_reupload=args.force_reupload,
+                quantize=not args.no_quantize,
+            )
+        )
 
         if not success:
             print("\nError: Failed to upload to Qdrant")
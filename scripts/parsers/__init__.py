@@ -1,6 +1,16 @@
 """Parsers for extracting structured data from documents."""
 
-from .peraturan_parser import PeraturanParser, Pasal
+from .embedding_cache import EmbeddingCache
+from .local_embeddings import LocalQwenEmbeddings
+from .peraturan_parser import PeraturanParser, Pasal, parse_file, parse_many
+from .qdrant_upload import (
+    RagDocument,
+    get_qdrant_client,
+    to_rag_document,
+    track_progress,
+    upload_documents,
+)
+from .rate_limiter import AsyncRateLimiter
 from .xlsx_parser import (
     FeeParser,
     ITBDocument,
@@ -15,6 +25,8 @@ from .xlsx_parser import (
 __all__ = [
     "PeraturanParser",
     "Pasal",
+    "parse_file",
+    "parse_many",
     "ITBDocument",
     "ITBExcelParser",
     "LLMCache",
@@ -23,4 +35,12 @@ __all__ = [
     "FeeParser",
     "SimpleInfoParser",
     "SheetParserFactory",
+    "AsyncRateLimiter",
+    "EmbeddingCache",
+    "upload_documents",
+    "RagDocument",
+    "to_rag_document",
+    "get_qdrant_client",
+    "track_progress",
+    "LocalQwenEmbeddings",
 ]
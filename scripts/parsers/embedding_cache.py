@@ -0,0 +1,96 @@
+"""
+SQLite-backed cache of document embeddings.
+
+Embeddings are deterministic for a given model and text, so re-uploading
+unchanged documents can reuse the stored vectors instead of calling the
+embedding API again.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """Cache manager for embedding vectors, keyed by model and content hash."""
+
+    def __init__(self, cache_dir: str, model: str, dimensions: Optional[int] = None) -> None:
+        """
+        Open (or create) the cache database for a model.
+
+        Args:
+            cache_dir: Directory holding the cache files
+            model: Embedding model name
+            dimensions: Size of the vectors requested from the model. Models
+                        such as Qwen3 can return several sizes, so each size
+                        gets its own file and vectors of another size are
+                        never returned.
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.model = model
+        self.dimensions = dimensions
+        self.cache_file = self.cache_dir / self._get_cache_filename(model, dimensions)
+
+        self.conn = sqlite3.connect(self.cache_file)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings (hash BLOB PRIMARY KEY, vector BLOB NOT NULL)"
+        )
+
+    @staticmethod
+    def _get_cache_filename(model: str, dimensions: Optional[int] = None) -> str:
+        """Generate cache filename from model name and vector size."""
+        clean_name = model.strip().lower().replace("/", "_")
+        clean_name = "".join(c for c in clean_name if c.isalnum() or c in "_-.")
+        if dimensions:
+            clean_name += f"_{dimensions}d"
+        return f"embeddings_{clean_name}.sqlite"
+
+    def key(self, text: str) -> bytes:
+        """Cache key of a text for this cache's model."""
+        return hashlib.sha256((self.model + text).encode("utf-8")).digest()
+
+    def get_many(self, keys: list[bytes]) -> dict[bytes, np.ndarray]:
+        """Load cached vectors for the given keys; missing keys are omitted."""
+        found: dict[bytes, np.ndarray] = {}
+        unique_keys = list(dict.fromkeys(keys))
+        # Stay below SQLite's limit on query parameters
+        for i in range(0, len(unique_keys), 500):
+            chunk = unique_keys[i : i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT hash, vector FROM embeddings WHERE hash IN ({placeholders})",
+                chunk,
+            )
+            for key, vector in rows:
+                vector = np.frombuffer(vector, dtype=np.float32)
+                if self.dimensions is None or len(vector) == self.dimensions:
+                    found[key] = vector
+        return found
+
+    def set_many(self, items: list[tuple[bytes, list[float]]]) -> None:
+        """Store vectors for the given keys."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (hash, vector) VALUES (?, ?)",
+                [
+                    (key, np.asarray(vector, dtype=np.float32).tobytes())
+                    for key, vector in items
+                ],
+            )
+
+    def clear(self) -> None:
+        """Remove all cached embeddings for this model."""
+        with self.conn:
+            self.conn.execute("DELETE FROM embeddings")
+        print(f"  [CACHE CLEAR] Cleared embeddings for: {self.model}")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.conn.close()
@@ -0,0 +1,73 @@
+"""
+Local Qwen3 embeddings with sentence-transformers.
+
+Used instead of the OpenRouter API when a GPU is available: the model runs
+in-process in bfloat16, so there is no per-request round-trip and batches
+can be as large as GPU memory allows.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+from langchain_core.embeddings import Embeddings
+
+LOCAL_QWEN_MODEL = "Qwen/Qwen3-Embedding-8B"
+
+
+class LocalQwenEmbeddings(Embeddings):
+    """LangChain embeddings running Qwen3-Embedding locally."""
+
+    def __init__(
+        self,
+        model: str = LOCAL_QWEN_MODEL,
+        dimensions: int = 1024,
+        batch_size: int = 64,
+    ) -> None:
+        """
+        Load the model onto the GPU (or CPU if no GPU is available).
+
+        Args:
+            model: Hugging Face model name
+            dimensions: Embedding size; Qwen3 embeddings are truncated to it,
+                        matching the `dimensions` sent to OpenRouter
+            batch_size: Texts per forward pass
+        """
+        try:
+            import torch
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise ImportError(
+                "sentence-transformers is required for local Qwen embeddings. "
+                "Install it with: pip install sentence-transformers torch"
+            )
+
+        if torch.cuda.is_available():
+            device = "cuda"
+            model_kwargs = {"torch_dtype": torch.bfloat16}
+        else:
+            print("  Warning: No GPU found, running Qwen embeddings on CPU")
+            device = "cpu"
+            model_kwargs = {}
+
+        self.batch_size = batch_size
+        self.model = SentenceTransformer(
+            model,
+            device=device,
+            model_kwargs=model_kwargs,
+            truncate_dim=dimensions,
+        )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Embed a list of documents."""
+        vectors = self.model.encode(
+            texts,
+            batch_size=self.batch_size,
+            normalize_embeddings=True,
+            convert_to_numpy=True,
+        )
+        return vectors.tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        """Embed a single query."""
+        return self.embed_documents([text])[0]
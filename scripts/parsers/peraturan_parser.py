@@ -13,13 +13,16 @@ Document structure:
         └── Ayat (Clause) - Numbered (1), (2), (3)...
 """
 
+import io
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import BinaryIO, Iterator, List, Optional, Dict, Any, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class Pasal:
     """Represents a single Pasal (Article) from Indonesian legal document."""
 
@@ -61,14 +64,21 @@ class PeraturanParser:
     """
 
     # Regex patterns for document structure
-    BAB_PATTERN = re.compile(
-        r"^BAB\s+(?P<roman>[IVXLCDM]+)\s+(?P<title>[^\n\r]+)",
+
+    # BAB headings, Pasal headings and the start of PENJELASAN, found in one
+    # pass. The BAB title is captured in a lookahead so the match ends after
+    # the roman numeral and a Pasal heading on the next line is still found.
+    STRUCTURE_PATTERN = re.compile(
+        r"^(?:BAB\s+(?P<bab_roman>[IVXLCDM]+)(?=\s+(?P<bab_title>[^\n\r]+))"
+        r"|Pasal\s+(?P<pasal_number>\d+)"
+        r"|(?P<penjelasan>PENJELASAN)\s)",
         re.MULTILINE | re.IGNORECASE
     )
 
-    PASAL_PATTERN = re.compile(
-        r"^Pasal\s+(?P<number>\d+)",
-        re.MULTILINE | re.IGNORECASE
+    # "Pasal 14, Pasal 15" or "Pasal 14, Pasal 15, dan Pasal 16"
+    PASAL_REFERENCE_PATTERN = re.compile(
+        r"Pasal\s+\d+[,.\s]+(?:dan\s+)?Pasal\s+\d+",
+        re.IGNORECASE
     )
 
     AYAT_PATTERN = re.compile(
@@ -76,67 +86,68 @@ class PeraturanParser:
         re.MULTILINE
     )
 
-    BAGIAN_PATTERN = re.compile(
-        r"^Bagian\s+(?P<ordinal>Kesatu|Kedua|Ketiga|Keempat|Kelima|Keenam|Ketujuh|Kedelapan|Kesembilan|Kesepuluh|[IVXLCDM]+)",
-        re.MULTILINE | re.IGNORECASE
-    )
-
-    PARAGRAF_PATTERN = re.compile(
-        r"^Paragraf\s+(?P<number>\d+)",
-        re.MULTILINE | re.IGNORECASE
-    )
-
-    HURUF_PATTERN = re.compile(
-        r"^[a-z]\)\s*",
-        re.MULTILINE
-    )
-
-    PENJELASAN_PATTERN = re.compile(
-        r"^PENJELASAN\s+",
-        re.MULTILINE | re.IGNORECASE
-    )
-
-    def __init__(self, source_path: str, source_name: Optional[str] = None):
+    # Text cleanup patterns. Each starts with a literal so the regex engine
+    # can skip ahead to candidates instead of trying every position.
+    # A hyphenated line break; the word character before it is checked in
+    # _join_hyphenated_words
+    HYPHEN_PATTERN = re.compile(r"-\n(?=\w)")
+    PAGE_NUMBER_PATTERN = re.compile(r"\n\s*\d+\s*\n")
+    BLANK_LINES_PATTERN = re.compile(r"\n\n\n+")
+
+    # PDF pages extracted per worker task
+    PDF_PAGES_PER_CHUNK = 32
+
+    def __init__(
+        self,
+        source_path: str,
+        source_name: Optional[str] = None,
+        source_file: Optional[BinaryIO] = None,
+        max_workers: Optional[int] = None,
+    ):
         """
         Initialize parser.
 
         Args:
             source_path: Path to PDF or text file
             source_name: Optional source name (defaults to filename)
+            source_file: Optional binary file object (e.g. io.BytesIO) holding
+                         the document; read instead of opening source_path
+            max_workers: Processes used to extract PDF pages (defaults to
+                         the number of CPUs; 1 extracts in this process)
         """
         self.source_path = Path(source_path)
+        self.source_file = source_file
         self.source_name = source_name or self.source_path.stem
+        self.max_workers = max_workers
         self.raw_text: str = ""
         self.babs: List[Dict[str, Any]] = []
         self.pasals: List[Pasal] = []
 
-    def parse(self, text: Optional[str] = None) -> List[Pasal]:
+    def parse(self, text: Optional[str] = None, keep_raw: bool = False) -> List[Pasal]:
         """
         Parse document and return list of Pasal objects.
 
         Args:
             text: Optional pre-extracted text. If not provided, will attempt
                   to read from source_path.
+            keep_raw: Keep the extracted text in `raw_text`. Off by default,
+                      so the raw copy is released once it has been cleaned.
 
         Returns:
             List of Pasal objects extracted from the document.
         """
-        if text:
-            self.raw_text = text
-        else:
-            self.raw_text = self._read_file()
+        raw_text = text if text else self._read_file()
+        self.raw_text = raw_text if keep_raw else ""
 
         # Preprocess text
-        cleaned_text = self._preprocess_text(self.raw_text)
+        cleaned_text = self._preprocess_text(raw_text)
+        del raw_text
 
-        # Remove Penjelasan section if present
-        cleaned_text = self._remove_penjelasan(cleaned_text)
-
-        # Parse BAB structure
-        self.babs = self._parse_babs(cleaned_text)
+        # Find BAB and Pasal headings, up to the Penjelasan section
+        self.babs, bab_pasal_matches = self._scan_structure(cleaned_text)
 
         # Parse Pasal within each BAB
-        self.pasals = self._parse_pasals(cleaned_text)
+        self.pasals = self._parse_pasals(cleaned_text, bab_pasal_matches)
 
         return self.pasals
 
@@ -147,6 +158,8 @@ class PeraturanParser:
         if suffix == ".pdf":
             return self._read_pdf()
         elif suffix in [".txt", ".text"]:
+            if self.source_file is not None:
+                return self.source_file.read().decode("utf-8")
             return self.source_path.read_text(encoding="utf-8")
         else:
             raise ValueError(
@@ -155,23 +168,67 @@ class PeraturanParser:
             )
 
     def _read_pdf(self) -> str:
-        """Extract text from PDF using pdfplumber."""
+        """Extract text from PDF, one page at a time."""
+        return "\n\n".join(self._iter_pdf_pages())
+
+    def _iter_pdf_pages(self) -> Iterator[str]:
+        """
+        Yield the text of each non-empty PDF page.
+
+        Pages are read with pypdfium2, which extracts text objects only and
+        skips the path and image operators pdfplumber interprets for its
+        layout analysis (these dominate PDFs with logos, stamps and tables).
+        Pages where pypdfium2 finds no text are retried with pdfplumber,
+        which also reads the whole document if pypdfium2 is not installed.
+
+        Documents longer than PDF_PAGES_PER_CHUNK pages are split into page
+        ranges extracted in parallel by up to `max_workers` processes; pages
+        are still yielded in document order.
+        """
         try:
-            import pdfplumber
+            import pypdfium2 as pdfium
         except ImportError:
-            raise ImportError(
-                "pdfplumber is required for PDF parsing. "
-                "Install it with: pip install pdfplumber"
-            )
+            yield from self._iter_pdfplumber_pages()
+            return
+
+        # Read an in-memory file once; extractors open their own copy
+        source = self.source_file.read() if self.source_file is not None else self.source_path
+        pdf = pdfium.PdfDocument(source)
+        num_pages = len(pdf)
+        pdf.close()
+
+        ranges = [
+            (start, min(start + self.PDF_PAGES_PER_CHUNK, num_pages))
+            for start in range(0, num_pages, self.PDF_PAGES_PER_CHUNK)
+        ]
+        workers = min(self.max_workers or os.cpu_count() or 1, len(ranges))
+
+        if workers > 1:
+            # Workers receive the document once, then extract page ranges
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_pdf_worker,
+                initargs=(source,),
+            ) as executor:
+                for page_texts in executor.map(_extract_pdf_pages, *zip(*ranges)):
+                    yield from filter(None, page_texts)
+        else:
+            yield from filter(None, _iter_pdfium_pages(source, 0, num_pages))
+
+    def _iter_pdfplumber_pages(self) -> Iterator[str]:
+        """
+        Yield the text of each non-empty PDF page using pdfplumber.
 
-        text_parts = []
-        with pdfplumber.open(self.source_path) as pdf:
+        Each page is closed once its text is extracted, so pdfplumber's
+        per-page character and layout caches are released as we go instead
+        of accumulating for the whole document.
+        """
+        with _open_pdfplumber(self.source_file or self.source_path) as pdf:
             for page in pdf.pages:
                 page_text = page.extract_text()
+                page.close()
                 if page_text:
-                    text_parts.append(page_text)
-
-        return "\n\n".join(text_parts)
+                    yield page_text
 
     def _preprocess_text(self, text: str) -> str:
         """
@@ -182,116 +239,165 @@ class PeraturanParser:
         - Remove page numbers
         """
         # Fix hyphenated words
-        text = re.sub(r"(\w)-\n(\w)", r"\1\2", text)
+        text = self._join_hyphenated_words(text)
 
         # Remove standalone page numbers (common pattern: centered numbers)
-        text = re.sub(r"\n\s*\d+\s*\n", "\n", text)
+        text = self.PAGE_NUMBER_PATTERN.sub("\n", text)
 
         # Normalize line endings
         text = text.replace("\r\n", "\n").replace("\r", "\n")
 
         # Remove excessive blank lines
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = self.BLANK_LINES_PATTERN.sub("\n\n", text)
 
         return text.strip()
 
-    def _remove_penjelasan(self, text: str) -> str:
-        """Remove PENJELASAN (explanation) section from the end."""
-        match = self.PENJELASAN_PATTERN.search(text)
-        if match:
-            text = text[:match.start()]
-        return text.strip()
-
-    def _parse_babs(self, text: str) -> List[Dict[str, Any]]:
-        """Extract all BAB (chapters) from text."""
-        babs = []
-        default_bab = {"roman": "", "title": "UMUM", "start": 0, "end": len(text)}
-
-        matches = list(self.BAB_PATTERN.finditer(text))
+    def _join_hyphenated_words(self, text: str) -> str:
+        """
+        Join words hyphenated across line breaks ("ketentu-" / "an" -> "ketentuan").
 
-        for i, match in enumerate(matches):
-            roman = match.group("roman").upper()
-            title = match.group("title").strip()
+        A break is joined when word characters surround it, unless the
+        character before the hyphen is the one right after a previous join;
+        this keeps the non-overlapping matches of a (\\w)-\\n(\\w) substitution.
+        """
+        parts = []
+        copied = 0  # End of the text copied to parts
+        consumed = 0  # End of the last join, including the character after it
+        for match in self.HYPHEN_PATTERN.finditer(text):
             start = match.start()
+            if start > consumed and (text[start - 1].isalnum() or text[start - 1] == "_"):
+                parts.append(text[copied:start])
+                copied = match.end()
+                consumed = copied + 1
 
-            # Set end position (start of next BAB or end of text)
-            if i + 1 < len(matches):
-                end = matches[i + 1].start()
-            else:
-                end = len(text)
+        if not parts:
+            return text
+        parts.append(text[copied:])
+        return "".join(parts)
 
-            babs.append({
-                "roman": roman,
-                "title": title,
-                "start": start,
-                "end": end,
-            })
+    def _scan_structure(self, text: str) -> Tuple[List[Dict[str, Any]], List[List[re.Match]]]:
+        """
+        Find all BAB (chapters) and their Pasal headings in one pass.
+
+        Scanning stops at the PENJELASAN (explanation) section. Pasal headings
+        before the first BAB are ignored unless the document has no BAB.
 
-        # If no BAB found, use default
-        if not babs:
-            babs.append(default_bab)
+        Returns:
+            (babs, pasal_matches) where pasal_matches[i] holds the Pasal
+            heading matches inside babs[i].
+        """
+        babs: List[Dict[str, Any]] = []
+        bab_pasal_matches: List[List[re.Match]] = []
+        bab_titles: List[Tuple[int, int]] = []  # (start, end) of each BAB title
+        preamble_matches: List[re.Match] = []  # Pasal before the first BAB
+        current_matches = preamble_matches
+        text_end = len(text)
+
+        for match in self.STRUCTURE_PATTERN.finditer(text):
+            if match.group("pasal_number"):
+                current_matches.append(match)
+            elif match.group("bab_roman"):
+                # A heading inside the previous BAB's title line is part of it
+                if bab_titles and match.start() < bab_titles[-1][1]:
+                    continue
+                babs.append({
+                    "roman": match.group("bab_roman").upper(),
+                    "title": match.group("bab_title").strip(),
+                    "start": match.start(),
+                    "end": text_end,
+                })
+                bab_titles.append(match.span("bab_title"))
+                current_matches = []
+                bab_pasal_matches.append(current_matches)
+            else:
+                # Everything from PENJELASAN on is explanation, not Pasal
+                text_end = len(text[:match.start()].rstrip())
+
+                # A BAB whose title lies past the cut is not a BAB; its Pasal
+                # belong to the BAB before it
+                while babs and bab_titles[-1][0] >= text_end:
+                    babs.pop()
+                    bab_titles.pop()
+                    orphans = bab_pasal_matches.pop()
+                    (bab_pasal_matches[-1] if babs else preamble_matches).extend(orphans)
+                break
+
+        # Each BAB ends at the start of the next BAB or the end of text
+        for bab, next_bab in zip(babs, babs[1:]):
+            bab["end"] = next_bab["start"]
+        if babs:
+            babs[-1]["end"] = text_end
+        else:
+            # If no BAB found, use default
+            babs.append({"roman": "", "title": "UMUM", "start": 0, "end": text_end})
+            bab_pasal_matches.append(preamble_matches)
 
-        return babs
+        return babs, bab_pasal_matches
 
-    def _parse_pasals(self, text: str) -> List[Pasal]:
+    def _parse_pasals(self, text: str, bab_pasal_matches: List[List[re.Match]]) -> List[Pasal]:
         """Parse all Pasal within BAB structure."""
         pasals = []
 
-        for bab in self.babs:
+        for bab, pasal_matches in zip(self.babs, bab_pasal_matches):
             bab_text = text[bab["start"]:bab["end"]]
-            bab_pasals = self._parse_pasals_in_bab(bab_text, bab)
+            # Heading positions relative to the BAB text
+            headings = [
+                (int(m.group("pasal_number")), m.start() - bab["start"], m.end() - bab["start"])
+                for m in pasal_matches
+            ]
+            bab_pasals = self._parse_pasals_in_bab(bab_text, bab, headings)
             pasals.extend(bab_pasals)
 
         return pasals
 
-    def _is_pasal_reference(self, match: re.Match, bab_text: str) -> bool:
+    def _is_pasal_reference(self, start: int, bab_text: str) -> bool:
         """
-        Check if this Pasal match is likely a reference, not a declaration.
+        Check if the Pasal heading at `start` is likely a reference, not a declaration.
 
         References like "Pasal 14, Pasal 15, dan Pasal 16" should be filtered out.
         """
-        # Get the line containing this match
-        start = match.start()
-        line_start = bab_text.rfind("\n", 0, start) + 1
-        line_end = bab_text.find("\n", start)
-        if line_end == -1:
-            line_end = len(bab_text)
-        line = bab_text[line_start:line_end]
-
-        # Check if line contains multiple "Pasal" occurrences (likely a reference)
-        pasal_count_in_line = len(list(self.PASAL_PATTERN.finditer(line)))
-        if pasal_count_in_line > 1:
-            return True
-
         # Check if followed by comma, "dan", or another Pasal within short distance
         # Look at next ~100 chars after "Pasal X"
         next_chars = bab_text[start:start + 100]
 
-        # Pattern like "Pasal 14, Pasal 15" or "Pasal 14, Pasal 15, dan Pasal 16"
-        if re.search(r'Pasal\s+\d+[,.\s]+(?:dan\s+)?Pasal\s+\d+', next_chars, re.IGNORECASE):
+        # Pattern like "Pasal 14, Pasal 15" or "Pasal 14, Pasal 15, dan Pasal 16",
+        # which needs a second "pasal" in the window
+        if next_chars.lower().count("pasal") > 1 and self.PASAL_REFERENCE_PATTERN.search(next_chars):
             return True
 
         return False
 
-    def _parse_pasals_in_bab(self, bab_text: str, bab_info: Dict[str, Any]) -> List[Pasal]:
-        """Parse Pasal within a single BAB."""
-        pasals = []
+    def _parse_pasals_in_bab(
+        self,
+        bab_text: str,
+        bab_info: Dict[str, Any],
+        headings: List[Tuple[int, int, int]],
+    ) -> List[Pasal]:
+        """
+        Parse Pasal within a single BAB.
 
-        # Find all Pasal matches in this BAB
-        all_matches = list(self.PASAL_PATTERN.finditer(bab_text))
+        Args:
+            bab_text: Text of the BAB
+            bab_info: BAB record from _scan_structure
+            headings: (number, start, end) of each Pasal heading in bab_text
+        """
+        pasals: List[Pasal] = []
+        # Bound once for the loops below
+        append = pasals.append
+        is_reference = self._is_pasal_reference
+        extract_title_and_content = self._extract_pasal_title_and_content
+        source_name = self.source_name
+        bab_roman = bab_info["roman"]
+        bab_title = bab_info["title"]
 
         # Filter out references (keep only real declarations)
-        valid_matches = [m for m in all_matches if not self._is_pasal_reference(m, bab_text)]
-
-        for i, match in enumerate(valid_matches):
-            pasal_num = int(match.group("number"))
-
-            # Get the content range for this Pasal
-            start = match.end()
+        valid_headings = [h for h in headings if not is_reference(h[1], bab_text)]
 
-            # End is start of next VALID Pasal, or end of BAB
-            if i + 1 < len(valid_matches):
-                end = valid_matches[i + 1].start()
+        for i, (pasal_num, _, start) in enumerate(valid_headings):
+            # Content runs from the end of the heading to the start of the
+            # next VALID Pasal, or end of BAB
+            if i + 1 < len(valid_headings):
+                end = valid_headings[i + 1][1]
             else:
                 end = len(bab_text)
 
@@ -300,7 +406,7 @@ class PeraturanParser:
 
             # Extract pasal title from first line(s) before first ayat
             # The title is typically the first line that doesn't start with (digit)
-            pasal_title, content_body = self._extract_pasal_title_and_content(content_text)
+            pasal_title, content_body = extract_title_and_content(content_text)
 
             # Build content with pasal header included
             pasal_header = f"Pasal {pasal_num}"
@@ -308,13 +414,13 @@ class PeraturanParser:
                 pasal_header += f" {pasal_title}"
             content_with_header = f"{pasal_header}\n{content_body}"
 
-            pasals.append(Pasal(
+            append(Pasal(
                 content=content_with_header,
                 pasal=pasal_num,
                 pasal_title=pasal_title if pasal_title else None,
-                bab=bab_info["roman"],
-                bab_title=bab_info["title"],
-                source=self.source_name,
+                bab=bab_roman,
+                bab_title=bab_title,
+                source=source_name,
             ))
 
         return pasals
@@ -329,39 +435,45 @@ class PeraturanParser:
         if not content:
             return None, ""
 
-        # Split into lines
         lines = content.split("\n")
-        lines = [line.strip() for line in lines if line.strip()]
-
-        title_lines = []
-        content_lines = []
-        found_first_ayat = False
-
-        for line in lines:
-            # Check if this line starts an ayat
-            if self.AYAT_PATTERN.match(line):
-                found_first_ayat = True
-                content_lines.append(line)
-            elif found_first_ayat:
-                # Already past the title, this is content continuation
-                content_lines.append(line)
+
+        title_lines: List[str] = []
+        content_lines: List[str] = []
+        body_lines: List[str] = []  # From the first ayat on, kept unstripped
+        ayat_match = self.AYAT_PATTERN.match
+        title_append = title_lines.append
+        content_append = content_lines.append
+
+        # Only lines before the first ayat need classifying; everything from
+        # the first ayat on is content and is taken as one slice
+        for i, line in enumerate(lines):
+            line = line.strip()
+            if not line:
+                continue
+
+            # Check if this line starts an ayat; most lines fail the cheap
+            # "(digit" prefix check and never reach the regex
+            if line[:1] == "(" and line[1:2].isdigit() and ayat_match(line):
+                body_lines = lines[i:]
+                break
+
+            # Still before first ayat - could be title or intro text
+            # Stop collecting title if line ends with colon or is short
+            if line.endswith(":") or line.endswith("."):
+                title_append(line)
+            elif len(line) < 100 and not line.startswith("("):
+                # Likely a title line (short, doesn't start with ayat)
+                title_append(line)
             else:
-                # Still before first ayat - could be title or intro text
-                # Stop collecting title if line ends with colon or is short
-                if line.endswith(":") or line.endswith("."):
-                    title_lines.append(line)
-                elif len(line) < 100 and not line.startswith("("):
-                    # Likely a title line (short, doesn't start with ayat)
-                    title_lines.append(line)
-                else:
-                    # Longer text, likely part of content
-                    content_lines.append(line)
+                # Longer text, likely part of content
+                content_append(line)
+        content_lines += body_lines
 
         # Join title and content
         title = " ".join(title_lines).strip() if title_lines else None
         # Clean up title - if it's too long, treat it as content instead
         if title and len(title) > 150:
-            content_lines = list(title_lines) + content_lines
+            content_lines = title_lines + content_lines
             title = None
 
         # Build content body preserving ayat structure
@@ -370,36 +482,16 @@ class PeraturanParser:
         return title, content_body
 
     def _build_content_body(self, lines: List[str]) -> str:
-        """Build content body from lines, preserving ayat structure."""
-        formatted_lines = []
-        current_ayat: List[str] = []
-
-        for line in lines:
-            # Check if this is an ayat line
-            ayat_match = self.AYAT_PATTERN.match(line)
-
-            if ayat_match:
-                # Save previous ayat if exists
-                if current_ayat:
-                    formatted_lines.append(" ".join(current_ayat))
-                    current_ayat = []
-
-                # Start new ayat
-                current_ayat.append(line)
-            else:
-                # Continuation of current ayat or standalone text
-                current_ayat.append(line)
-
-        # Don't forget the last ayat
-        if current_ayat:
-            formatted_lines.append(" ".join(current_ayat))
-
-        result = " ".join(formatted_lines)
-
-        # Clean up extra whitespace
-        result = re.sub(r"\s+", " ", result).strip()
+        """
+        Build content body from lines, preserving ayat structure.
 
-        return result
+        Ayat markers like "(1)" stay at the start of their text, so ayat and
+        their continuation lines are all joined with single spaces; lines
+        need no second ayat classification here, nor stripping.
+        """
+        # Collapse whitespace runs to single spaces; str.split() splits on
+        # the same characters as \s and drops leading/trailing whitespace
+        return " ".join(" ".join(lines).split())
 
     def get_summary(self) -> Dict[str, Any]:
         """Get summary statistics of parsed document."""
@@ -436,7 +528,9 @@ class PeraturanParser:
             "pasals": [p.to_dict() for p in self.pasals],
         }
 
-        output_path.write_text(json.dumps(data, ensure_ascii=False, indent=2))
+        # Encode straight into the file instead of building the whole string
+        with output_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
 
         return str(output_path)
 
@@ -456,21 +550,19 @@ class PeraturanParser:
 
         output_path = Path(output_path)
 
-        lines = [f"# {self.source_name}", ""]
-
-        # Group by BAB
-        current_bab = None
-        for pasal in self.pasals:
-            if pasal.bab != current_bab:
-                current_bab = pasal.bab
-                lines.append(f"\n## BAB {pasal.bab} - {pasal.bab_title}\n")
+        # Write each block as it is produced instead of joining the document
+        with output_path.open("w", encoding="utf-8") as f:
+            f.write(f"# {self.source_name}\n")
 
-            title_suffix = f" - {pasal.pasal_title}" if pasal.pasal_title else ""
-            lines.append(f"### Pasal {pasal.pasal}{title_suffix}")
-            lines.append(pasal.content)
-            lines.append("")
+            # Group by BAB
+            current_bab = None
+            for pasal in self.pasals:
+                if pasal.bab != current_bab:
+                    current_bab = pasal.bab
+                    f.write(f"\n\n## BAB {pasal.bab} - {pasal.bab_title}\n")
 
-        output_path.write_text("\n".join(lines))
+                title_suffix = f" - {pasal.pasal_title}" if pasal.pasal_title else ""
+                f.write(f"\n### Pasal {pasal.pasal}{title_suffix}\n{pasal.content}\n")
 
         return str(output_path)
 
@@ -481,10 +573,118 @@ class PeraturanParser:
         Returns:
             List of dictionaries with 'page_content' and 'metadata' keys.
         """
-        return [
-            {
+        return list(self.iter_rag_documents())
+
+    def iter_rag_documents(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yield RAG documents one Pasal at a time.
+
+        Lets streaming consumers such as the Qdrant upload avoid holding every
+        document alongside the parsed Pasal objects.
+        """
+        for pasal in self.pasals:
+            yield {
                 "page_content": pasal.content,
                 "metadata": pasal.to_metadata(),
             }
-            for pasal in self.pasals
-        ]
+
+
+def parse_file(path: str) -> List[Pasal]:
+    """
+    Parse one PDF or text file; module-level so worker processes can run it.
+
+    PDF pages are extracted in the calling process, since parse_many already
+    spreads whole files across CPUs.
+    """
+    return PeraturanParser(path, max_workers=1).parse()
+
+
+def parse_many(paths: List[str], max_workers: Optional[int] = None) -> Dict[str, List[Pasal]]:
+    """
+    Parse many PDF or text files in parallel worker processes.
+
+    Args:
+        paths: Files to parse
+        max_workers: Worker processes (defaults to the number of CPUs)
+
+    Returns:
+        Dict mapping each path to its Pasal objects, in input order.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # One file per task: files are large and vary in size
+        return dict(zip(paths, executor.map(parse_file, paths)))
+
+
+# PDF page extraction helpers; module-level so worker processes can run them
+
+_worker_pdf_source: Any = None
+
+
+def _open_pdfplumber(source: Any) -> Any:
+    """Open a PDF with pdfplumber."""
+    try:
+        import pdfplumber
+    except ImportError:
+        raise ImportError(
+            "pdfplumber is required for PDF parsing. "
+            "Install it with: pip install pdfplumber"
+        )
+
+    return pdfplumber.open(source)
+
+
+def _normalize_pdfium_text(text: str) -> str:
+    """
+    Bring pypdfium2 page text to the layout pdfplumber produces.
+
+    pdfium ends lines with CRLF, keeps trailing spaces and marks
+    hyphens as U+FFFE.
+    """
+    text = text.replace("\ufffe", "-").replace("\r\n", "\n").replace("\r", "\n")
+    return "\n".join(line.rstrip() for line in text.split("\n"))
+
+
+def _iter_pdfium_pages(source: Any, start: int, stop: int) -> Iterator[str]:
+    """
+    Yield the text of PDF pages [start, stop) using pypdfium2.
+
+    Pages without a pdfium text layer are retried with pdfplumber; pages
+    with no text at all yield an empty string.
+    """
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(source)
+    fallback_pdf = None
+    try:
+        for index in range(start, stop):
+            page = pdf[index]
+            textpage = page.get_textpage()
+            page_text = _normalize_pdfium_text(textpage.get_text_range())
+            textpage.close()
+            page.close()
+
+            if not page_text.strip():
+                if fallback_pdf is None:
+                    fallback_pdf = _open_pdfplumber(
+                        io.BytesIO(source) if isinstance(source, bytes) else source
+                    )
+                fallback_page = fallback_pdf.pages[index]
+                page_text = fallback_page.extract_text()
+                fallback_page.close()
+
+            yield page_text or ""
+    finally:
+        pdf.close()
+        if fallback_pdf is not None:
+            fallback_pdf.close()
+
+
+def _init_pdf_worker(source: Any) -> None:
+    """Store the PDF path or bytes in a worker process."""
+    global _worker_pdf_source
+    _worker_pdf_source = source
+
+
+def _extract_pdf_pages(start: int, stop: int) -> List[str]:
+    """Extract the text of PDF pages [start, stop) in a worker process."""
+    return list(_iter_pdfium_pages(_worker_pdf_source, start, stop))
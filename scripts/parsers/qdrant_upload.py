@@ -0,0 +1,502 @@
+"""
+Shared Qdrant upload for the parser scripts.
+
+Documents are deduplicated, embedded (with caching and client-side rate
+limits) and upserted in a pipeline that overlaps embedding requests with
+Qdrant writes.
+
+This module provides:
+- upload_documents: Embed and upload documents to Qdrant
+- enable_indexing: Re-enable HNSW indexing after a bulk upload
+- RagDocument: Lightweight (page_content, metadata) record for uploads
+- to_rag_document: Convert a RAG dict or LangChain Document to a RagDocument
+- get_qdrant_client: Cached client, so repeated uploads reuse its connections
+- track_progress: Advance a progress bar as points are consumed by an upload
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import os
+import sys
+import time
+import uuid
+from collections.abc import Sized
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, NamedTuple, Optional
+
+# Documents per embedding request (OpenAI accepts up to 2048 inputs)
+EMBED_CHUNK_SIZE = 512
+
+# Vector size per embedding model, so creating a collection needs no probe request
+MODEL_DIMENSIONS = {
+    "text-embedding-3-large": 3072,
+    "text-embedding-3-small": 1536,
+    "qwen/qwen3-embedding-8b": 1024,
+    "Qwen/Qwen3-Embedding-8B": 1024,  # --local-qwen, truncated like the API
+}
+
+# Largest gRPC message the client may send; big upload batches exceed the 4MB default
+GRPC_MAX_MESSAGE_LENGTH = 64 * 1024 * 1024
+
+
+class RagDocument(NamedTuple):
+    """Document text and metadata, without LangChain Document's validation."""
+
+    page_content: str
+    metadata: Dict[str, Any]
+
+
+def to_rag_document(doc: Any) -> RagDocument:
+    """Convert a RAG dict ("page_content" or "content") or LangChain Document."""
+    if isinstance(doc, dict):
+        return RagDocument(
+            doc.get("page_content") or doc.get("content", ""),
+            doc.get("metadata") or {},
+        )
+    return RagDocument(doc.page_content, doc.metadata)
+
+
+@lru_cache(maxsize=4)
+def get_qdrant_client(
+    url: str,
+    api_key: Optional[str] = None,
+    prefer_grpc: Optional[bool] = None,
+    grpc_port: Optional[int] = None,
+):
+    """
+    Get a Qdrant client for a server, creating it on first use.
+
+    Clients are cached per argument set, so every upload in a process shares
+    one connection pool (HTTP keep-alive, or one gRPC channel) per server.
+
+    Args:
+        url: Qdrant server URL
+        api_key: Qdrant API key (optional for local)
+        prefer_grpc: Use gRPC for point operations (default: QDRANT_PREFER_GRPC, true)
+        grpc_port: Qdrant gRPC port (default: QDRANT_GRPC_PORT, 6334)
+
+    Returns:
+        QdrantClient instance
+    """
+    from qdrant_client import QdrantClient
+
+    if prefer_grpc is None:
+        prefer_grpc = os.getenv("QDRANT_PREFER_GRPC", "true").lower() == "true"
+    if grpc_port is None:
+        grpc_port = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
+
+    # gRPC sends vectors as compact protobuf instead of JSON
+    return QdrantClient(
+        url=url,
+        api_key=api_key,
+        prefer_grpc=prefer_grpc,
+        grpc_port=grpc_port,
+        timeout=120,
+        grpc_options={
+            "grpc.max_send_message_length": GRPC_MAX_MESSAGE_LENGTH,
+            "grpc.max_receive_message_length": GRPC_MAX_MESSAGE_LENGTH,
+        },
+    )
+
+
+def track_progress(items: Iterable[Any], progress) -> Iterator[Any]:
+    """
+    Yield items unchanged, advancing a tqdm bar as each one is consumed.
+
+    Lets a bar follow QdrantClient.upload_collection, which batches the
+    points internally and reports no progress of its own.
+    """
+    for item in items:
+        yield item
+        progress.update()
+
+
+async def enable_indexing(qdrant_client, collection_name: str, timeout: float = 300.0) -> None:
+    """
+    Re-enable indexing on a collection created for bulk upload.
+
+    If the collection still has indexing disabled (HNSW m or the indexing
+    threshold set to 0), restores Qdrant's default HNSW and indexing settings,
+    then waits until the collection status is green (index built) or the
+    timeout expires. Collections that are already indexed are left as is.
+
+    Args:
+        qdrant_client: Qdrant client
+        collection_name: Collection to re-enable indexing on
+        timeout: Maximum number of seconds to wait for the index build
+    """
+    from qdrant_client.models import CollectionStatus, HnswConfigDiff, OptimizersConfigDiff
+
+    # Runs from the upload's finally block, so a failure here (e.g. Qdrant
+    # unreachable) must not replace the upload's own result
+    try:
+        config = qdrant_client.get_collection(collection_name).config
+        if config.hnsw_config.m != 0 and config.optimizer_config.indexing_threshold != 0:
+            return
+
+        print("  Building HNSW index...")
+        qdrant_client.update_collection(
+            collection_name=collection_name,
+            optimizers_config=OptimizersConfigDiff(indexing_threshold=20000),
+            hnsw_config=HnswConfigDiff(m=16),
+        )
+
+        deadline = time.monotonic() + timeout
+        while qdrant_client.get_collection(collection_name).status != CollectionStatus.GREEN:
+            if time.monotonic() >= deadline:
+                print("  Warning: Index is still building; it will finish in the background")
+                return
+            await asyncio.sleep(1)
+        print("  Index ready")
+    except Exception as e:
+        print(f"  Warning: Could not enable indexing: {e}")
+
+
+async def upload_documents(
+    documents: Iterable[Any],
+    *,
+    provider: str = "openai",
+    batch_size: int = 32,
+    concurrency: int = 4,
+    collection_name: Optional[str] = None,
+    embed_cache_dir: Optional[str] = "cache",
+    clear_embed_cache: bool = False,
+    local_qwen: bool = False,
+    embed_batch_size: int = 64,
+    verbose: bool = False,
+    force_reupload: bool = False,
+    quantize: bool = True,
+) -> bool:
+    """
+    Embed and upload documents to Qdrant.
+
+    Args:
+        documents: RAG dicts or LangChain Documents; may be a lazy iterator
+        provider: Embedding provider, either "openai" or "qwen"
+        batch_size: Batch size for upload
+        concurrency: Maximum number of batches uploading at once
+        collection_name: Qdrant collection (default: chosen by provider)
+        embed_cache_dir: Directory of the embedding cache (None disables it)
+        clear_embed_cache: Clear cached embeddings for the model first
+        local_qwen: Run Qwen embeddings locally (GPU) instead of via OpenRouter
+        embed_batch_size: Texts per forward pass for local Qwen embeddings
+        verbose: Print per-step details in addition to the progress bars
+        force_reupload: Re-embed and upload documents already in the collection
+        quantize: Create new collections with int8 scalar quantization
+
+    Uses the same configuration as agents/models.py:
+    - OpenAI: text-embedding-3-large, collection "informasi-umum-itb"
+    - Qwen: qwen/qwen3-embedding-8b, collection "informasi-umum-itb-qwen3"
+    """
+    # Load environment variables
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    # Import Qdrant and embeddings
+    try:
+        from langchain_openai import OpenAIEmbeddings
+        from tqdm.auto import tqdm
+    except ImportError as e:
+        print(f"Error: Required packages are missing: {e}")
+        print("Run: pip install langchain-openai qdrant-client python-dotenv")
+        return False
+
+    from .embedding_cache import EmbeddingCache
+    from .rate_limiter import AsyncRateLimiter, count_tokens
+
+    # Get configuration from environment
+    qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
+    qdrant_api_key = os.getenv("QDRANT_API_KEY")
+
+    # Stay under the embedding API's rate limits instead of retrying 429s
+    request_limiter = AsyncRateLimiter(int(os.getenv("OPENAI_MAX_RPM", "3500")))
+    token_limiter = AsyncRateLimiter(int(os.getenv("OPENAI_MAX_TPM", "350000")))
+
+    # Normalize embedding provider
+    provider = provider.lower()
+
+    # Set collection name and embedding based on provider
+    if provider == "qwen":
+        # Use custom collection if provided, otherwise use default
+        if collection_name is None:
+            collection_name = "informasi-umum-itb-qwen3"
+        if local_qwen:
+            from .local_embeddings import LOCAL_QWEN_MODEL, LocalQwenEmbeddings
+
+            embedding_model = LOCAL_QWEN_MODEL
+            try:
+                embeddings = LocalQwenEmbeddings(
+                    embedding_model, dimensions=1024, batch_size=embed_batch_size
+                )
+            except ImportError as e:
+                print(f"Error: {e}")
+                return False
+            print(f"  Using local Qwen embedding: {embedding_model}")
+        else:
+            embedding_model = os.getenv("EMBEDDING_MODEL", "qwen/qwen3-embedding-8b")
+            openrouter_api_key = os.getenv("OPENROUTER_API_KEY")
+
+            if not openrouter_api_key:
+                print("Error: OPENROUTER_API_KEY environment variable is required for Qwen embeddings")
+                return False
+
+            embeddings = OpenAIEmbeddings(
+                base_url="https://openrouter.ai/api/v1",
+                api_key=openrouter_api_key,
+                model=embedding_model,
+                dimensions=1024,  # Explicitly set dimension for qwen3-embedding-8b
+            )
+            print(f"  Using Qwen embedding: {embedding_model}")
+    else:  # openai (default)
+        # Use custom collection if provided, otherwise use default
+        if collection_name is None:
+            collection_name = "informasi-umum-itb"
+        embedding_model = "text-embedding-3-large"
+        embeddings = OpenAIEmbeddings(model=embedding_model)
+        print(f"  Using OpenAI embedding: {embedding_model}")
+
+    # Shared client, so repeated uploads reuse its connections
+    qdrant_client = get_qdrant_client(qdrant_url, qdrant_api_key)
+
+    print(f"  Qdrant URL: {qdrant_url}")
+    print(f"  Collection: {collection_name}")
+
+    # Create the collection if it is missing. Creating unconditionally and
+    # treating "already exists" as success saves a get_collections round-trip.
+    created_collection = False
+    try:
+        # Get embedding dimension; only unknown models need a probe request
+        dimension = MODEL_DIMENSIONS.get(embedding_model) or len(embeddings.embed_query("x"))
+
+        # Indexing is disabled until the bulk upload has finished, so
+        # Qdrant builds the HNSW graph once instead of during every write
+        from qdrant_client.models import (
+            Distance,
+            HnswConfigDiff,
+            OptimizersConfigDiff,
+            ScalarQuantization,
+            ScalarQuantizationConfig,
+            ScalarType,
+            VectorParams,
+        )
+
+        # With quantization, searches use int8 vectors kept in RAM (4x
+        # smaller) while the full float32 vectors and graph stay on disk
+        quantization_config = None
+        if quantize:
+            quantization_config = ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+        try:
+            qdrant_client.create_collection(
+                collection_name=collection_name,
+                vectors_config=VectorParams(
+                    size=dimension, distance=Distance.COSINE, on_disk=quantize
+                ),
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
+                hnsw_config=HnswConfigDiff(m=0, on_disk=quantize),
+                quantization_config=quantization_config,
+            )
+            created_collection = True
+            print(f"  Created collection '{collection_name}' with dimension {dimension}")
+        except Exception as e:
+            if "already exists" not in str(e):
+                raise
+            if verbose:
+                collection_info = qdrant_client.get_collection(collection_name)
+                print(f"  Existing collection points: {collection_info.points_count}")
+    except Exception as e:
+        print(f"  Error checking/creating collection: {e}")
+        return False
+
+    # Embedding and upserting run as a pipeline: a producer embeds
+    # EMBED_CHUNK_SIZE documents per request (`concurrency` requests in
+    # flight) and queues each finished chunk, while `concurrency` consumers
+    # upsert queued chunks, so Qdrant writes overlap with embedding calls.
+    queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+
+    # Progress bars only draw on a terminal, at most twice per second
+    progress_options = {"unit": "doc", "mininterval": 0.5, "disable": not sys.stdout.isatty()}
+    total_documents = len(documents) if isinstance(documents, Sized) else None
+    embed_progress = tqdm(total=total_documents, desc="embedding", **progress_options)
+    upload_progress = tqdm(total=total_documents, desc="upserting", **progress_options)
+
+    async def embed_texts(texts) -> list:
+        # Local inference has no API rate limits
+        if not local_qwen:
+            await request_limiter.acquire()
+            await token_limiter.acquire(count_tokens(texts, embedding_model))
+        return await embeddings.aembed_documents(texts)
+
+    skipped = 0
+
+    async def embed_chunk(chunk) -> None:
+        nonlocal skipped
+        # Point IDs derive from the content, so re-runs produce the same IDs
+        ids = [str(uuid.uuid5(uuid.NAMESPACE_URL, doc.page_content)) for doc in chunk]
+
+        # Skip documents already uploaded by an earlier run (a collection
+        # created by this run is empty, so there is nothing to look up)
+        if not force_reupload and not created_collection:
+            existing = await asyncio.to_thread(
+                qdrant_client.retrieve,
+                collection_name,
+                ids=ids,
+                with_payload=False,
+                with_vectors=False,
+            )
+            if existing:
+                existing_ids = {str(point.id) for point in existing}
+                new = [(doc, id_) for doc, id_ in zip(chunk, ids) if id_ not in existing_ids]
+                skipped += len(chunk) - len(new)
+                embed_progress.update(len(chunk) - len(new))
+                upload_progress.update(len(chunk) - len(new))
+                if not new:
+                    return
+                chunk = [doc for doc, _ in new]
+                ids = [id_ for _, id_ in new]
+
+        texts = [doc.page_content for doc in chunk]
+        if embed_cache:
+            # Reuse cached embeddings of unchanged documents
+            keys = [embed_cache.key(text) for text in texts]
+            vectors_by_key = embed_cache.get_many(keys)
+            missing = [i for i, key in enumerate(keys) if key not in vectors_by_key]
+            if missing:
+                new_vectors = await embed_texts([texts[i] for i in missing])
+                embedded = [(keys[i], vector) for i, vector in zip(missing, new_vectors)]
+                embed_cache.set_many(embedded)
+                vectors_by_key.update(embedded)
+            vectors = [vectors_by_key[key] for key in keys]
+            if verbose:
+                print(f"  Embedded {len(missing)} documents ({len(chunk) - len(missing)} cached)")
+        else:
+            vectors = await embed_texts(texts)
+            if verbose:
+                print(f"  Embedded {len(chunk)} documents")
+        embed_progress.update(len(chunk))
+        await queue.put((chunk, ids, vectors))
+
+    async def embed_producer(document_iter) -> None:
+        in_flight = set()
+        while True:
+            chunk = list(islice(document_iter, EMBED_CHUNK_SIZE))
+            if not chunk:
+                break
+            if len(in_flight) >= concurrency:
+                done, in_flight = await asyncio.wait(
+                    in_flight, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    task.result()
+            in_flight.add(asyncio.create_task(embed_chunk(chunk)))
+        await asyncio.gather(*in_flight)
+
+        # One sentinel per consumer marks the end of the stream
+        for _ in range(concurrency):
+            await queue.put(None)
+
+    async def upsert_consumer() -> None:
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            chunk, ids, vectors = item
+
+            # upload_collection takes plain ids, vectors and payloads (no
+            # PointStruct per document), splits them into batches and
+            # retries failed ones. Same payload layout as QdrantVectorStore,
+            # so the agents can read it.
+            await asyncio.to_thread(
+                qdrant_client.upload_collection,
+                collection_name=collection_name,
+                vectors=[list(map(float, vector)) for vector in vectors],
+                payload=[
+                    {"page_content": doc.page_content, "metadata": doc.metadata}
+                    for doc in chunk
+                ],
+                ids=track_progress(ids, upload_progress),
+                batch_size=batch_size,
+                max_retries=3,
+                wait=True,
+            )
+            if verbose:
+                print(f"  Upserted {len(chunk)} points")
+
+    async def run_pipeline(document_iter) -> None:
+        tasks = [
+            asyncio.create_task(embed_producer(document_iter)),
+            *(asyncio.create_task(upsert_consumer()) for _ in range(concurrency)),
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    embed_cache = (
+        EmbeddingCache(embed_cache_dir, embedding_model, dimensions=dimension)
+        if embed_cache_dir
+        else None
+    )
+    if embed_cache and clear_embed_cache:
+        embed_cache.clear()
+
+    try:
+        # Documents may be a lazy stream (e.g. from --json-input); the
+        # pipeline pulls them as it goes. Duplicate texts are dropped by
+        # content hash before embedding.
+        seen_hashes = set()
+        total = 0
+        unique = 0
+
+        def unique_documents():
+            nonlocal total, unique
+            for doc in documents:
+                total += 1
+                doc = to_rag_document(doc)
+                content_hash = hashlib.blake2b(
+                    doc.page_content.encode("utf-8"), digest_size=8
+                ).digest()
+                if content_hash in seen_hashes:
+                    embed_progress.update()
+                    upload_progress.update()
+                else:
+                    seen_hashes.add(content_hash)
+                    unique += 1
+                    yield doc
+
+        await run_pipeline(unique_documents())
+        print(f"  Deduplicated to {unique}/{total} documents")
+        if skipped:
+            print(f"  Skipped {skipped} documents already in the collection")
+
+        # Verify upload
+        collection_info = qdrant_client.get_collection(collection_name)
+        print("  Upload complete!")
+        print(f"  Collection now has {collection_info.points_count} points")
+
+        return True
+
+    except Exception as e:
+        print(f"  Error uploading documents: {e}")
+        import traceback
+
+        traceback.print_exc()
+        return False
+
+    finally:
+        embed_progress.close()
+        upload_progress.close()
+        if embed_cache:
+            embed_cache.close()
+        # Checked on every run, so a collection created by an earlier run
+        # that stopped before its index was built is indexed now
+        await enable_indexing(qdrant_client, collection_name)
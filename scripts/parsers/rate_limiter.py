@@ -0,0 +1,70 @@
+"""
+Client-side rate limiting for embedding API requests.
+
+This module provides:
+- AsyncRateLimiter: Token bucket shared by concurrent asyncio tasks
+- count_tokens: Token count of a batch of texts, for tokens-per-minute limits
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket limiting how much capacity is used per time period.
+
+    Callers wait until enough capacity has refilled instead of sending a
+    request the API would reject with HTTP 429 and a retry delay.
+    """
+
+    def __init__(self, max_rate: float, time_period: float = 60.0) -> None:
+        self.max_rate = max_rate
+        self.refill_rate = max_rate / time_period
+        self._level = max_rate
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """Wait until `amount` capacity is available, then consume it."""
+        # A single request larger than the bucket waits for a full bucket
+        amount = min(amount, self.max_rate)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._level = min(
+                    self.max_rate,
+                    self._level + (now - self._last_refill) * self.refill_rate,
+                )
+                self._last_refill = now
+                if self._level >= amount:
+                    self._level -= amount
+                    return
+                await asyncio.sleep((amount - self._level) / self.refill_rate)
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(model: str) -> Optional[Any]:
+    """Load the tiktoken encoding for a model, or None if unavailable."""
+    try:
+        import tiktoken
+
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            # Non-OpenAI models (e.g. via OpenRouter): close enough for limiting
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(texts: list[str], model: str) -> int:
+    """Count tokens in texts, estimating 4 characters per token without tiktoken."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return sum(len(text) for text in texts) // 4 + 1
+    return sum(len(tokens) for tokens in encoding.encode_batch(texts))
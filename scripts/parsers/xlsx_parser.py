@@ -2,7 +2,7 @@
 Parser for ITB information Excel files using OpenRouter Qwen3-8B for natural language conversion.
 
 This module provides:
-- LLMCache: Pickle-based caching for LLM responses
+- LLMCache: JSON file caching for LLM responses
 - ITBDocument: Base document class
 - BaseSheetParser: Abstract parser for different sheet types
 - Concrete parsers: ProgramListParser, ScheduleParser, FeeParser, SimpleInfoParser
@@ -12,11 +12,18 @@ This module provides:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import os
 import pickle
+import re
+import sqlite3
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -24,11 +31,26 @@ import pandas as pd
 from langchain_core.messages import HumanMessage
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
+from openai import RateLimitError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# The Rust calamine reader is much faster than openpyxl; pandas falls back to
+# openpyxl when python-calamine is not installed
+try:
+    import python_calamine  # noqa: F401
+
+    EXCEL_ENGINE: Optional[str] = "calamine"
+except ImportError:
+    EXCEL_ENGINE = None
 
 load_dotenv()
 
 if TYPE_CHECKING:
-    from collections.abc import Mapping
+    from collections.abc import Iterable, Mapping, Sequence
 
 
 @dataclass
@@ -39,21 +61,86 @@ class ITBDocument:
     metadata: dict[str, Any] = field(default_factory=dict)  # Structured metadata
 
 
+def _dump_cache_json(data: dict[str, Any]) -> bytes:
+    """Serialize cache data to JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY)
+    # Metadata can hold NumPy scalars (e.g. row indexes) from pandas
+    return json.dumps(
+        data,
+        ensure_ascii=False,
+        default=lambda obj: obj.item() if hasattr(obj, "item") else str(obj),
+    ).encode("utf-8")
+
+
+def _load_cache_json(raw: bytes) -> dict[str, Any]:
+    """Deserialize cache data written by _dump_cache_json."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# Deletes every ASCII character not allowed in cache filenames
+_CACHE_KEY_DELETE_TABLE = str.maketrans(
+    "",
+    "",
+    "".join(chr(c) for c in range(128) if not (chr(c).isalnum() or chr(c) in "_-")),
+)
+
+
+@lru_cache(maxsize=256)
+def _clean_sheet_name(sheet_name: str) -> str:
+    """Turn a sheet name into the part of its cache filename after the prefix."""
+    clean_name = sheet_name.strip().lower()
+    clean_name = clean_name.replace(" ", "_").replace("/", "_")
+    if clean_name.isascii():
+        return clean_name.translate(_CACHE_KEY_DELETE_TABLE)
+    return "".join(c for c in clean_name if c.isalnum() or c in "_-")
+
+
 class LLMCache:
-    """Cache manager for LLM-generated results using pickle."""
+    """Cache manager for LLM-generated results stored as JSON files."""
 
     def __init__(self, cache_dir: str = "cache") -> None:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.metadata_file = self.cache_dir / "xlsx_admission_metadata.json"
+        # Sheet name of each cache file, with the file's mtime when it was read
+        self._sheet_names: dict[Path, tuple[int, str]] = {}
+        self.migrate_legacy_cache()
+
+        # LLM responses by prompt hash, shared by all sheets. Sheets are
+        # parsed from several threads, so the connection is guarded by a lock
+        self.prompt_file = self.cache_dir / "llm_prompts.sqlite"
+        self._prompt_lock = threading.Lock()
+        self.prompt_db = sqlite3.connect(self.prompt_file, check_same_thread=False)
+        self.prompt_db.execute("PRAGMA journal_mode=WAL")
+        self.prompt_db.execute(
+            "CREATE TABLE IF NOT EXISTS prompts (hash TEXT PRIMARY KEY, response TEXT NOT NULL)"
+        )
+
+    def _cache_files(self) -> list[Path]:
+        """List the per-sheet cache files."""
+        return [
+            cache_file
+            for cache_file in self.cache_dir.glob("xlsx_admission_*.json")
+            if cache_file != self.metadata_file
+        ]
+
+    def migrate_legacy_cache(self) -> None:
+        """Rewrite cache files from the old pickle format as JSON."""
+        for legacy_file in self.cache_dir.glob("xlsx_admission_*.pkl"):
+            try:
+                data: dict[str, Any] = pickle.loads(legacy_file.read_bytes())
+                legacy_file.with_suffix(".json").write_bytes(_dump_cache_json(data))
+                legacy_file.unlink()
+                print(f"  [CACHE MIGRATE] Converted {legacy_file.name} to JSON")
+            except Exception as e:
+                print(f"  [CACHE ERROR] Failed to migrate {legacy_file.name}: {e}")
 
     def _get_cache_key(self, sheet_name: str) -> str:
         """Generate cache filename from sheet name."""
-        # Clean sheet name for filename
-        clean_name = sheet_name.strip().lower()
-        clean_name = clean_name.replace(" ", "_").replace("/", "_")
-        clean_name = "".join(c for c in clean_name if c.isalnum() or c in "_-")
-        return f"xlsx_admission_{clean_name}.pkl"
+        return f"xlsx_admission_{_clean_sheet_name(sheet_name)}.json"
 
     def get(self, sheet_name: str) -> Optional[dict[str, Any]]:
         """Load cached documents for a sheet."""
@@ -64,8 +151,8 @@ class LLMCache:
             return None
 
         try:
-            with cache_file.open("rb") as f:
-                data: dict[str, Any] = pickle.load(f)
+            data = _load_cache_json(cache_file.read_bytes())
+            self._remember_sheet_name(cache_file, data.get("sheet_name", sheet_name))
             doc_count = len(data.get("documents", []))
             print(f"  [CACHE HIT] Loaded {doc_count} documents from cache")
             return data
@@ -90,8 +177,8 @@ class LLMCache:
         }
 
         try:
-            with cache_file.open("wb") as f:
-                pickle.dump(data, f)
+            cache_file.write_bytes(_dump_cache_json(data))
+            self._remember_sheet_name(cache_file, sheet_name)
             print(f"  [CACHE SAVE] Saved {len(documents)} documents to {cache_key}")
         except Exception as e:
             print(f"  [CACHE ERROR] Failed to save cache: {e}")
@@ -101,23 +188,62 @@ class LLMCache:
         if sheet_name:
             cache_key = self._get_cache_key(sheet_name)
             cache_file = self.cache_dir / cache_key
+            self._sheet_names.pop(cache_file, None)
             if cache_file.exists():
                 cache_file.unlink()
                 print(f"  [CACHE CLEAR] Cleared cache for: {sheet_name}")
         else:
             # Clear all xlsx_admission cache files
-            for cache_file in self.cache_dir.glob("xlsx_admission_*.pkl"):
+            self._sheet_names.clear()
+            for cache_file in self._cache_files():
                 cache_file.unlink()
                 print(f"  [CACHE CLEAR] Deleted: {cache_file.name}")
+            self.clear_responses()
+
+    @staticmethod
+    def prompt_key(prompt: str) -> str:
+        """Cache key of an LLM prompt."""
+        return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get_response(self, key: str) -> Optional[str]:
+        """Load the cached LLM response for a prompt key, if any."""
+        with self._prompt_lock:
+            row = self.prompt_db.execute(
+                "SELECT response FROM prompts WHERE hash = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_responses(self, items: Iterable[tuple[str, str]]) -> None:
+        """Store LLM responses for the given prompt keys."""
+        with self._prompt_lock, self.prompt_db:
+            self.prompt_db.executemany(
+                "INSERT OR REPLACE INTO prompts (hash, response) VALUES (?, ?)", items
+            )
+
+    def clear_responses(self) -> None:
+        """Remove all cached LLM responses."""
+        with self._prompt_lock, self.prompt_db:
+            self.prompt_db.execute("DELETE FROM prompts")
+        print(f"  [CACHE CLEAR] Cleared LLM responses in {self.prompt_file.name}")
+
+    def _remember_sheet_name(self, cache_file: Path, sheet_name: str) -> None:
+        """Record the sheet name of a cache file that was just read or written."""
+        self._sheet_names[cache_file] = (cache_file.stat().st_mtime_ns, sheet_name)
 
     def list_cached(self) -> list[str]:
         """List all cached sheet names."""
         cached: list[str] = []
-        for cache_file in self.cache_dir.glob("xlsx_admission_*.pkl"):
+        for cache_file in self._cache_files():
             try:
-                with cache_file.open("rb") as f:
-                    data: dict[str, Any] = pickle.load(f)
+                # Only files changed since they were last seen are read again
+                known = self._sheet_names.get(cache_file)
+                if known is not None and known[0] == cache_file.stat().st_mtime_ns:
+                    cached.append(known[1])
+                    continue
+
+                data = _load_cache_json(cache_file.read_bytes())
                 sheet_name: str = data["sheet_name"]
+                self._remember_sheet_name(cache_file, sheet_name)
                 cached.append(sheet_name)
             except Exception:
                 pass
@@ -126,10 +252,9 @@ class LLMCache:
     def load_all_cached(self) -> list[dict[str, Any]]:
         """Load all cached documents (for re-embedding)."""
         all_docs: list[dict[str, Any]] = []
-        for cache_file in self.cache_dir.glob("xlsx_admission_*.pkl"):
+        for cache_file in self._cache_files():
             try:
-                with cache_file.open("rb") as f:
-                    data: dict[str, Any] = pickle.load(f)
+                data = _load_cache_json(cache_file.read_bytes())
                 docs: list[dict[str, Any]] = data.get("documents", [])
                 all_docs.extend(docs)
             except Exception as e:
@@ -140,34 +265,181 @@ class LLMCache:
 class BaseSheetParser(ABC):
     """Abstract base parser for different sheet types."""
 
+    # Appended to a row prompt to convert several rows with one LLM call
+    BATCH_PROMPT_SUFFIX = """
+
+The data is given as the {count} numbered records below. Convert each record separately, in order.
+Output exactly {count} results separated by lines containing only "---", without numbering or any other text.
+
+Records:
+{records}"""
+
+    BATCH_SEPARATOR_PATTERN = re.compile(r"^\s*-{3,}\s*$", re.MULTILINE)
+
     def __init__(
         self,
         sheet_name: str,
         df: pd.DataFrame,
         llm: ChatOpenAI,
         cache: Optional[LLMCache] = None,
+        max_concurrency: int = 20,
+        batch_size: int = 10,
     ) -> None:
         self.sheet_name = sheet_name
         self.df = df
         self.llm = llm
         self.cache = cache
+        self.max_concurrency = max_concurrency
+        self.batch_size = batch_size
+        # Rate-limited requests are retried with exponential backoff
+        self._retrying_llm = llm.with_retry(
+            retry_if_exception_type=(RateLimitError,), stop_after_attempt=5
+        )
 
-    @abstractmethod
     def parse(self) -> list[ITBDocument]:
         """Parse sheet and return list of documents."""
+        return asyncio.run(self.aparse())
+
+    @abstractmethod
+    async def aparse(self) -> list[ITBDocument]:
+        """Parse sheet and return list of documents, converting rows concurrently."""
         pass
 
-    def _convert_with_llm(self, data: Mapping[str, Any], prompt_template: str) -> str:
-        """Use LLM to convert structured data to natural language."""
+    async def _aconvert_with_llm(
+        self, data: Mapping[str, Any], prompt_template: str
+    ) -> str:
+        """Convert structured data to natural language, retrying when rate limited."""
         prompt = prompt_template.format(data=data)
-        response = self.llm.invoke([HumanMessage(content=prompt)])
+        response = await self._retrying_llm.ainvoke([HumanMessage(content=prompt)])
         return str(response.content).strip()
 
+    async def _aconvert_batch_with_llm(
+        self, rows: Sequence[Mapping[str, Any]], prompt_template: str
+    ) -> Optional[list[str]]:
+        """
+        Convert several rows that share a prompt with a single LLM call.
+
+        Returns None if the response does not split into one result per row.
+        """
+        records = "\n".join(f"{i}) {data}" for i, data in enumerate(rows, 1))
+        prompt = prompt_template.format(
+            data="(the records listed below)"
+        ) + self.BATCH_PROMPT_SUFFIX.format(count=len(rows), records=records)
+        response = await self._retrying_llm.ainvoke([HumanMessage(content=prompt)])
+
+        results = [
+            part.strip()
+            for part in self.BATCH_SEPARATOR_PATTERN.split(str(response.content))
+        ]
+        results = [result for result in results if result]
+        if len(results) != len(rows):
+            print(
+                f"  Warning: LLM returned {len(results)} results for {len(rows)} rows, "
+                "converting them one by one"
+            )
+            return None
+        return results
+
+    def _batch_requests(
+        self, requests: Sequence[tuple[Mapping[str, Any], str]]
+    ) -> list[tuple[list[Mapping[str, Any]], str]]:
+        """Group consecutive requests with the same prompt into batches of batch_size."""
+        batches: list[tuple[list[Mapping[str, Any]], str]] = []
+        for data, prompt_template in requests:
+            if (
+                batches
+                and batches[-1][1] == prompt_template
+                and len(batches[-1][0]) < self.batch_size
+            ):
+                batches[-1][0].append(data)
+            else:
+                batches.append(([data], prompt_template))
+        return batches
+
+    async def _aconvert_many_with_llm(
+        self, requests: Sequence[tuple[Mapping[str, Any], str]]
+    ) -> list[str]:
+        """
+        Convert many (data, prompt_template) pairs concurrently.
+
+        Responses cached for a prompt are reused and identical prompts are
+        sent once; the remaining rows are converted by _aconvert_all. Results
+        are returned in request order.
+        """
+        keys = [
+            LLMCache.prompt_key(prompt_template.format(data=data))
+            for data, prompt_template in requests
+        ]
+        responses: dict[str, str] = {}
+        pending: dict[str, tuple[Mapping[str, Any], str]] = {}
+        for key, request in zip(keys, requests):
+            if key in responses or key in pending:
+                continue
+            cached = self.cache.get_response(key) if self.cache else None
+            if cached is not None:
+                responses[key] = cached
+            else:
+                pending[key] = request
+
+        if pending:
+            converted = await self._aconvert_all(list(pending.values()))
+            responses.update(zip(pending, converted))
+            if self.cache:
+                self.cache.set_responses(zip(pending, converted))
+
+        return [responses[key] for key in keys]
+
+    async def _aconvert_all(
+        self, requests: Sequence[tuple[Mapping[str, Any], str]]
+    ) -> list[str]:
+        """
+        Convert (data, prompt_template) pairs with concurrent LLM calls.
+
+        Consecutive rows sharing a prompt are sent up to `batch_size` per LLM
+        call, and batches are independent, so their calls run at the same
+        time, at most `max_concurrency` at once. Results are returned in
+        request order.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def convert_row(data: Mapping[str, Any], prompt_template: str) -> str:
+            async with semaphore:
+                return await self._aconvert_with_llm(data, prompt_template)
+
+        async def convert_batch(
+            rows: list[Mapping[str, Any]], prompt_template: str
+        ) -> list[str]:
+            if len(rows) > 1:
+                async with semaphore:
+                    results = await self._aconvert_batch_with_llm(rows, prompt_template)
+                if results is not None:
+                    return results
+
+            # Single rows, or a batch whose response could not be split
+            return await asyncio.gather(
+                *(convert_row(data, prompt_template) for data in rows)
+            )
+
+        batches = await asyncio.gather(
+            *(
+                convert_batch(rows, template)
+                for rows, template in self._batch_requests(requests)
+            )
+        )
+        return [result for batch in batches for result in batch]
+
 
 class ProgramListParser(BaseSheetParser):
     """Parser for program lists (S1, S2, S3, Keinsinyuran)."""
 
-    def parse(self) -> list[ITBDocument]:
+    PROMPT_TEMPLATE = """Convert this ITB study program data to natural Indonesian.
+Make it informative and clear for prospective students.
+
+Data: {data}
+
+Output a clear, informative paragraph in formal Indonesian. Focus on what the program is about and key details."""
+
+    async def aparse(self) -> list[ITBDocument]:
         """Parse program list sheet row by row."""
         # Skip reference row (row 0) and header row (row 1)
         df = (
@@ -175,65 +447,80 @@ class ProgramListParser(BaseSheetParser):
             if len(self.df) > 2
             else pd.DataFrame()
         )
-        documents: list[ITBDocument] = []
+        # Drop empty rows in one pass instead of checking each row
+        df = df.loc[df.notna().any(axis=1)]
+        rows: list[dict[str, Any]] = []
+        column_fields = self._map_columns(df.columns.tolist())
 
-        for _, row in df.iterrows():
-            if row.isna().all():
-                continue
-
-            data = self._extract_program_data(row)
+        for row in df.itertuples(index=False, name=None):
+            data = self._extract_program_data(row, column_fields)
             if not data or not data.get("program"):
                 continue
 
-            nl_content = self._convert_to_natural_language(data)
+            rows.append(data)
 
-            documents.append(
-                ITBDocument(
-                    content=nl_content,
-                    metadata={
-                        "source": f"Informasi Umum ITB - {self.sheet_name}",
-                        "type": "program_list",
-                        **{k: v for k, v in data.items() if v},
-                    },
-                )
-            )
+        contents = await self._aconvert_many_with_llm(
+            [(data, self.PROMPT_TEMPLATE) for data in rows]
+        )
 
-        return documents
+        return [
+            ITBDocument(
+                content=nl_content,
+                metadata={
+                    "source": f"Informasi Umum ITB - {self.sheet_name}",
+                    "type": "program_list",
+                    **{k: v for k, v in data.items() if v},
+                },
+            )
+            for data, nl_content in zip(rows, contents)
+        ]
 
-    def _extract_program_data(self, row: pd.Series) -> dict[str, Any]:
-        """Extract program data from a row."""
+    @staticmethod
+    def _map_columns(columns: list[Any]) -> list[tuple[str, bool]]:
+        """
+        Map each column to the data field its values are stored under.
+
+        Returns:
+            (field name, whether it is one of the known program fields) per
+            column, in column order
+        """
+        column_fields: list[tuple[str, bool]] = []
+        for col in columns:
+            # Clean column names
+            col_lower = str(col).lower()
+            col_name = str(col) if not col_lower.isdigit() else f"col_{col}"
+
+            if "prodi" in col_lower or "program" in col_lower or "study" in col_lower:
+                column_fields.append(("program", True))
+            elif "fakultas" in col_lower or "faculty" in col_lower:
+                column_fields.append(("fakultas", True))
+            elif "kode" in col_lower or "code" in col_lower:
+                column_fields.append(("kode", True))
+            elif (
+                "akreditasi" in col_lower
+                or "akredit" in col_lower
+                or "accredit" in col_lower
+            ):
+                column_fields.append(("akreditasi", True))
+            else:
+                column_fields.append((col_name, False))
+        return column_fields
+
+    def _extract_program_data(
+        self, row: tuple[Any, ...], column_fields: list[tuple[str, bool]]
+    ) -> dict[str, Any]:
+        """Extract program data from a row, using the fields from _map_columns."""
         data: dict[str, Any] = {}
         non_null_values: list[tuple[str, str]] = []
 
         # Collect all non-null values with their column info
-        for idx, col in enumerate(row.index):
-            val = row.iloc[idx]
+        for (field_name, is_known), val in zip(column_fields, row):
             if pd.notna(val) and str(val).strip():
                 val_str = str(val).strip()
-                # Clean column names
-                col_lower = str(col).lower()
-                col_name = str(col) if not col_lower.isdigit() else f"col_{idx}"
-
-                if (
-                    "prodi" in col_lower
-                    or "program" in col_lower
-                    or "study" in col_lower
-                ):
-                    data["program"] = val_str
-                elif "fakultas" in col_lower or "faculty" in col_lower:
-                    data["fakultas"] = val_str
-                elif "kode" in col_lower or "code" in col_lower:
-                    data["kode"] = val_str
-                elif (
-                    "akreditasi" in col_lower
-                    or "akredit" in col_lower
-                    or "accredit" in col_lower
-                ):
-                    data["akreditasi"] = val_str
-                else:
+                data[field_name] = val_str
+                if not is_known:
                     # Store all non-null values
-                    data[col_name] = val_str
-                    non_null_values.append((col_name, val_str))
+                    non_null_values.append((field_name, val_str))
 
         # If no "program" field was found, use the first non-null value as the program name
         if "program" not in data and non_null_values:
@@ -246,22 +533,18 @@ class ProgramListParser(BaseSheetParser):
 
         return data
 
-    def _convert_to_natural_language(self, data: Mapping[str, Any]) -> str:
-        """Convert program data to natural Indonesian using Gemini."""
-        prompt = """Convert this ITB study program data to natural Indonesian.
-Make it informative and clear for prospective students.
-
-Data: {data}
 
-Output a clear, informative paragraph in formal Indonesian. Focus on what the program is about and key details."""
+class ScheduleParser(BaseSheetParser):
+    """Parser for schedule/registration dates."""
 
-        return self._convert_with_llm(data, prompt)
+    PROMPT_TEMPLATE = """Convert this ITB admission schedule information to natural Indonesian.
+Make it clear when each event occurs.
 
+Data: {data}
 
-class ScheduleParser(BaseSheetParser):
-    """Parser for schedule/registration dates."""
+Output a clear, informative paragraph in formal Indonesian about the schedule."""
 
-    def parse(self) -> list[ITBDocument]:
+    async def aparse(self) -> list[ITBDocument]:
         """Parse schedule sheet and convert to timeline format."""
         documents: list[ITBDocument] = []
 
@@ -273,66 +556,60 @@ class ScheduleParser(BaseSheetParser):
             return documents
 
         # First non-empty row is likely the header
-        header_row = None
-        for idx, row in df.iterrows():
-            if not row.isna().all():
-                header_row = idx
-                break
-
-        if header_row is None:
-            return documents
-
-        headers = df.iloc[header_row].fillna("").tolist()
-        data_df = df.iloc[header_row + 1 :].reset_index(drop=True)
+        # header_row is an index label: rows before it were dropped above
+        header_row = df.notna().any(axis=1).idxmax()
+        headers = [
+            str(header).strip().lower()
+            for header in df.loc[header_row].fillna("").tolist()
+        ]
+        data_df = df.loc[header_row:].iloc[1:].reset_index(drop=True)
 
         # Group rows into logical events
-        for _, row in data_df.iterrows():
-            if row.isna().all():
-                continue
-
+        events: list[dict[str, Any]] = []
+        # Empty rows were already dropped above
+        for row in data_df.itertuples(index=False, name=None):
             event_data = self._extract_event_data(row, headers)
             if event_data:
-                nl_content = self._convert_event_to_natural_language(event_data)
-                documents.append(
-                    ITBDocument(
-                        content=nl_content,
-                        metadata={
-                            "source": f"Informasi Umum ITB - {self.sheet_name}",
-                            "type": "schedule",
-                            **{k: v for k, v in event_data.items() if v},
-                        },
-                    )
-                )
+                events.append(event_data)
 
-        return documents
+        contents = await self._aconvert_many_with_llm(
+            [(event_data, self.PROMPT_TEMPLATE) for event_data in events]
+        )
 
-    def _extract_event_data(self, row: pd.Series, headers: list[Any]) -> dict[str, Any]:
-        """Extract event data from a row."""
+        return [
+            ITBDocument(
+                content=nl_content,
+                metadata={
+                    "source": f"Informasi Umum ITB - {self.sheet_name}",
+                    "type": "schedule",
+                    **{k: v for k, v in event_data.items() if v},
+                },
+            )
+            for event_data, nl_content in zip(events, contents)
+        ]
+
+    def _extract_event_data(
+        self, row: tuple[Any, ...], headers: list[str]
+    ) -> dict[str, Any]:
+        """Extract event data from a row, given the normalized headers."""
         data: dict[str, Any] = {}
-        for idx, val in enumerate(row):
-            if pd.notna(val) and idx < len(headers):
-                col_name = str(headers[idx]).strip().lower()
-                val_str = str(val).strip()
-                if col_name:
-                    data[col_name] = val_str
+        for col_name, val in zip(headers, row):
+            if col_name and pd.notna(val):
+                data[col_name] = str(val).strip()
         return data
 
-    def _convert_event_to_natural_language(self, data: Mapping[str, Any]) -> str:
-        """Convert event data to natural Indonesian."""
-        prompt = """Convert this ITB admission schedule information to natural Indonesian.
-Make it clear when each event occurs.
 
-Data: {data}
-
-Output a clear, informative paragraph in formal Indonesian about the schedule."""
+class FeeParser(BaseSheetParser):
+    """Parser for tuition/fee information."""
 
-        return self._convert_with_llm(data, prompt)
+    PROMPT_TEMPLATE = """Convert this ITB tuition fee information to natural Indonesian.
+Make it clear what the fees are for and the amounts.
 
+Data: {data}
 
-class FeeParser(BaseSheetParser):
-    """Parser for tuition/fee information."""
+Output a clear, informative paragraph in formal Indonesian about the fees."""
 
-    def parse(self) -> list[ITBDocument]:
+    async def aparse(self) -> list[ITBDocument]:
         """Parse fee sheet and convert to readable format."""
         documents: list[ITBDocument] = []
 
@@ -343,80 +620,85 @@ class FeeParser(BaseSheetParser):
             return documents
 
         # Find header row
-        header_row = None
-        for idx, row in df.iterrows():
-            if not row.isna().all():
-                header_row = idx
-                break
-
-        if header_row is None:
-            return documents
-
-        headers = df.iloc[header_row].fillna("").tolist()
-        data_df = df.iloc[header_row + 1 :].reset_index(drop=True)
-
-        for _, row in data_df.iterrows():
-            if row.isna().all():
-                continue
+        # header_row is an index label: rows before it were dropped above
+        header_row = df.notna().any(axis=1).idxmax()
+        headers = [
+            str(header).strip().lower()
+            for header in df.loc[header_row].fillna("").tolist()
+        ]
+        data_df = df.loc[header_row:].iloc[1:].reset_index(drop=True)
 
+        fees: list[dict[str, Any]] = []
+        # Empty rows were already dropped above
+        for row in data_df.itertuples(index=False, name=None):
             fee_data = self._extract_fee_data(row, headers)
             if fee_data:
-                nl_content = self._convert_fee_to_natural_language(fee_data)
-                documents.append(
-                    ITBDocument(
-                        content=nl_content,
-                        metadata={
-                            "source": f"Informasi Umum ITB - {self.sheet_name}",
-                            "type": "fee",
-                            **{k: v for k, v in fee_data.items() if v},
-                        },
-                    )
-                )
+                fees.append(fee_data)
 
-        return documents
+        contents = await self._aconvert_many_with_llm(
+            [(fee_data, self.PROMPT_TEMPLATE) for fee_data in fees]
+        )
 
-    def _extract_fee_data(self, row: pd.Series, headers: list[Any]) -> dict[str, Any]:
-        """Extract fee data from a row."""
+        return [
+            ITBDocument(
+                content=nl_content,
+                metadata={
+                    "source": f"Informasi Umum ITB - {self.sheet_name}",
+                    "type": "fee",
+                    **{k: v for k, v in fee_data.items() if v},
+                },
+            )
+            for fee_data, nl_content in zip(fees, contents)
+        ]
+
+    def _extract_fee_data(
+        self, row: tuple[Any, ...], headers: list[str]
+    ) -> dict[str, Any]:
+        """Extract fee data from a row, given the normalized headers."""
         data: dict[str, Any] = {}
-        for idx, val in enumerate(row):
-            if pd.notna(val) and idx < len(headers):
-                col_name = str(headers[idx]).strip().lower()
-                val_str = str(val).strip()
-                if col_name:
-                    data[col_name] = val_str
+        for col_name, val in zip(headers, row):
+            if col_name and pd.notna(val):
+                data[col_name] = str(val).strip()
         return data
 
-    def _convert_fee_to_natural_language(self, data: Mapping[str, Any]) -> str:
-        """Convert fee data to natural Indonesian."""
-        prompt = """Convert this ITB tuition fee information to natural Indonesian.
-Make it clear what the fees are for and the amounts.
+
+class SimpleInfoParser(BaseSheetParser):
+    """Parser for simple reference information."""
+
+    SUMMARY_PROMPT_TEMPLATE = """Provide a brief summary of this ITB information sheet in Indonesian.
+Focus on what kind of information this sheet contains.
 
 Data: {data}
 
-Output a clear, informative paragraph in formal Indonesian about the fees."""
+Output: A concise 1-2 sentence summary in Indonesian."""
 
-        return self._convert_with_llm(data, prompt)
+    ROW_PROMPT_TEMPLATE = """Convert this ITB information to natural Indonesian.
+Make it clear and readable.
 
+Data: {data}
 
-class SimpleInfoParser(BaseSheetParser):
-    """Parser for simple reference information."""
+Output: A clear, informative sentence in Indonesian."""
 
-    def parse(self) -> list[ITBDocument]:
+    async def aparse(self) -> list[ITBDocument]:
         """Parse simple info sheet and convert to natural language."""
         documents: list[ITBDocument] = []
 
         df = self.df.copy()
         df = df.dropna(how="all")
 
+        # (data, prompt template, metadata) of each document, converted
+        # together at the end
+        pending: list[tuple[dict[str, Any], str, dict[str, Any]]] = []
+
         # Convert entire sheet to natural language
         # Create a summary document
         summary_data = self._summarize_sheet(df)
         if summary_data:
-            nl_content = self._convert_summary_to_natural_language(summary_data)
-            documents.append(
-                ITBDocument(
-                    content=nl_content,
-                    metadata={
+            pending.append(
+                (
+                    summary_data,
+                    self.SUMMARY_PROMPT_TEMPLATE,
+                    {
                         "source": f"Informasi Umum ITB - {self.sheet_name}",
                         "type": "simple_info",
                         "row_count": len(df),
@@ -425,17 +707,16 @@ class SimpleInfoParser(BaseSheetParser):
             )
 
         # Also process individual rows for granularity
-        for idx, row in df.iterrows():
-            if row.isna().all():
-                continue
-
-            row_data = self._extract_row_data(row)
+        columns = df.columns.tolist()
+        # Empty rows were already dropped above
+        for idx, *row in df.itertuples(name=None):
+            row_data = self._extract_row_data(row, columns)
             if row_data and len(row_data) > 0:
-                nl_content = self._convert_row_to_natural_language(row_data)
-                documents.append(
-                    ITBDocument(
-                        content=nl_content,
-                        metadata={
+                pending.append(
+                    (
+                        row_data,
+                        self.ROW_PROMPT_TEMPLATE,
+                        {
                             "source": f"Informasi Umum ITB - {self.sheet_name}",
                             "type": "simple_info",
                             "row": idx,
@@ -444,6 +725,14 @@ class SimpleInfoParser(BaseSheetParser):
                     )
                 )
 
+        contents = await self._aconvert_many_with_llm(
+            [(data, template) for data, template, _ in pending]
+        )
+        documents.extend(
+            ITBDocument(content=nl_content, metadata=metadata)
+            for (_, _, metadata), nl_content in zip(pending, contents)
+        )
+
         return documents
 
     def _summarize_sheet(self, df: pd.DataFrame) -> dict[str, Any]:
@@ -454,41 +743,15 @@ class SimpleInfoParser(BaseSheetParser):
             "columns": list(df.columns)[:10],  # Limit columns
         }
 
-    def _extract_row_data(self, row: pd.Series) -> dict[str, Any]:
-        """Extract data from a single row."""
+    def _extract_row_data(self, row: list[Any], columns: list[Any]) -> dict[str, Any]:
+        """Extract data from a single row of values in column order."""
         data: dict[str, Any] = {}
-        for idx, val in enumerate(row):
+        for col, val in zip(columns, row):
             if pd.notna(val):
-                col_name = (
-                    f"col_{idx}"
-                    if not isinstance(row.index[idx], str)
-                    else str(row.index[idx])
-                )
+                col_name = f"col_{col}" if not isinstance(col, str) else str(col)
                 data[col_name] = str(val).strip()
         return data
 
-    def _convert_summary_to_natural_language(self, data: Mapping[str, Any]) -> str:
-        """Convert summary to natural Indonesian."""
-        prompt = """Provide a brief summary of this ITB information sheet in Indonesian.
-Focus on what kind of information this sheet contains.
-
-Data: {data}
-
-Output: A concise 1-2 sentence summary in Indonesian."""
-
-        return self._convert_with_llm(data, prompt)
-
-    def _convert_row_to_natural_language(self, data: Mapping[str, Any]) -> str:
-        """Convert row data to natural Indonesian."""
-        prompt = """Convert this ITB information to natural Indonesian.
-Make it clear and readable.
-
-Data: {data}
-
-Output: A clear, informative sentence in Indonesian."""
-
-        return self._convert_with_llm(data, prompt)
-
 
 class SheetParserFactory:
     """Factory to create appropriate parser for each sheet type."""
@@ -524,6 +787,9 @@ class SheetParserFactory:
         "Daya Tampung S1 ITB": "simple",
     }
 
+    # Resolved category of each normalized sheet name
+    _category_cache: dict[str, str] = {}
+
     PARSER_CLASSES: dict[str, type[BaseSheetParser]] = {
         "program_list": ProgramListParser,
         "schedule": ScheduleParser,
@@ -538,38 +804,44 @@ class SheetParserFactory:
         df: pd.DataFrame,
         llm: ChatOpenAI,
         cache: Optional[LLMCache] = None,
+        max_concurrency: int = 20,
+        batch_size: int = 10,
     ) -> BaseSheetParser:
         """Create appropriate parser for the sheet."""
-        normalized_name = sheet_name.strip()
-
-        # Try direct match first
-        category = cls._RAW_SHEET_CATEGORIES.get(normalized_name)
-
-        # Try partial match if direct fails
-        if not category:
-            for key, value in cls._RAW_SHEET_CATEGORIES.items():
-                if key.strip() in normalized_name or normalized_name in key.strip():
-                    category = value
-                    break
-
-        if not category:
-            category = "simple"
-
+        category = cls.get_sheet_category(sheet_name)
         parser_class = cls.PARSER_CLASSES.get(category, SimpleInfoParser)
-        return parser_class(sheet_name, df, llm, cache=cache)
+        return parser_class(
+            sheet_name,
+            df,
+            llm,
+            cache=cache,
+            max_concurrency=max_concurrency,
+            batch_size=batch_size,
+        )
 
     @classmethod
     def get_sheet_category(cls, sheet_name: str) -> str:
         """Get the category for a sheet name."""
         normalized_name = sheet_name.strip()
+        category = cls._category_cache.get(normalized_name)
+        if category is not None:
+            return category
+
+        # Try direct match first
         category = cls._RAW_SHEET_CATEGORIES.get(normalized_name)
 
+        # Try partial match if direct fails
         if not category:
-            for key, value in cls._RAW_SHEET_CATEGORIES.items():
-                if key.strip() in normalized_name or normalized_name in key.strip():
-                    return value
-            return "simple"
+            category = next(
+                (
+                    value
+                    for key, value in cls._RAW_SHEET_CATEGORIES.items()
+                    if key in normalized_name or normalized_name in key
+                ),
+                "simple",
+            )
 
+        cls._category_cache[normalized_name] = category
         return category
 
 
@@ -610,6 +882,9 @@ class ITBExcelParser:
         cache_dir: str = "cache",
         use_cache: bool = True,
         force_refresh: bool = False,
+        llm_concurrency: int = 20,
+        llm_batch_size: int = 10,
+        sheet_workers: int = 4,
     ) -> None:
         self.xlsx_path = Path(xlsx_path)
         self.llm = llm or self._default_llm()
@@ -617,6 +892,9 @@ class ITBExcelParser:
         self.all_documents: list[ITBDocument] = []
         self.cache = LLMCache(cache_dir) if use_cache else None
         self.force_refresh = force_refresh
+        self.llm_concurrency = llm_concurrency
+        self.llm_batch_size = llm_batch_size
+        self.sheet_workers = sheet_workers
 
     def _default_llm(self) -> ChatOpenAI:
         """Create default LLM instance using OpenRouter."""
@@ -637,45 +915,92 @@ class ITBExcelParser:
         )
 
     def parse(self) -> list[ITBDocument]:
-        """Parse all sheets and return combined documents."""
-        xlsx = pd.ExcelFile(self.xlsx_path)
+        """
+        Parse all sheets and return combined documents.
+
+        Sheets are independent, so up to `sheet_workers` are parsed at once:
+        while one sheet waits on LLM responses, others are read and sent.
+        All sheets share one event loop, since the LLM's async HTTP client
+        is bound to the loop it was first used on. Documents are returned
+        in sheet order.
+        """
         print(f"Configured sheets to process: {self.sheets}")
 
-        for sheet_name in self.sheets:
-            if sheet_name not in xlsx.sheet_names:
-                print(f"Warning: Sheet '{sheet_name}' not found")
-                continue
+        # A forced refresh re-calls the LLM instead of reusing earlier responses
+        if self.cache and self.force_refresh:
+            self.cache.clear_responses()
 
-            print(f"Parsing: {sheet_name}")
-
-            # Check cache first
-            if self.cache and not self.force_refresh:
-                cached = self.cache.get(sheet_name)
-                if cached:
-                    # Convert cached dict back to ITBDocument objects
-                    for doc_data in cached.get("documents", []):
-                        self.all_documents.append(
-                            ITBDocument(
-                                content=doc_data["content"],
-                                metadata=doc_data["metadata"],
-                            )
-                        )
+        with pd.ExcelFile(self.xlsx_path, engine=EXCEL_ENGINE) as xlsx:
+            sheet_names: list[str] = []
+            for sheet_name in self.sheets:
+                if sheet_name not in xlsx.sheet_names:
+                    print(f"Warning: Sheet '{sheet_name}' not found")
                     continue
+                sheet_names.append(sheet_name)
 
-            # Parse from Excel
-            df = pd.read_excel(self.xlsx_path, sheet_name=sheet_name, header=None)
+            for documents in asyncio.run(self._aparse_sheets(sheet_names, xlsx)):
+                self.all_documents.extend(documents)
 
-            parser = SheetParserFactory.create(sheet_name, df, self.llm, self.cache)
-            documents = parser.parse()
+        return self.all_documents
 
-            # Save to cache
-            if self.cache:
-                self.cache.set(sheet_name, documents, parser.__class__.__name__)
+    async def _aparse_sheets(
+        self, sheet_names: list[str], xlsx: pd.ExcelFile
+    ) -> list[list[ITBDocument]]:
+        """Parse sheets concurrently, at most `sheet_workers` at once."""
+        semaphore = asyncio.Semaphore(self.sheet_workers)
+        # The open workbook is shared, so sheets are read one at a time
+        read_lock = asyncio.Lock()
 
-            self.all_documents.extend(documents)
-            print(f"  -> {len(documents)} documents")
+        async def parse_sheet(sheet_name: str) -> list[ITBDocument]:
+            async with semaphore:
+                return await self._aparse_sheet(sheet_name, xlsx, read_lock)
 
-        return self.all_documents
+        return await asyncio.gather(
+            *(parse_sheet(sheet_name) for sheet_name in sheet_names)
+        )
+
+    async def _aparse_sheet(
+        self, sheet_name: str, xlsx: pd.ExcelFile, read_lock: asyncio.Lock
+    ) -> list[ITBDocument]:
+        """Parse one sheet, using the cache when possible."""
+        print(f"Parsing: {sheet_name}")
+
+        # Check cache first
+        if self.cache and not self.force_refresh:
+            cached = self.cache.get(sheet_name)
+            if cached:
+                # Convert cached dict back to ITBDocument objects
+                return [
+                    ITBDocument(
+                        content=doc_data["content"],
+                        metadata=doc_data["metadata"],
+                    )
+                    for doc_data in cached.get("documents", [])
+                ]
+
+        # Parse from Excel, off the event loop so other sheets keep converting
+        async with read_lock:
+            df = await asyncio.to_thread(xlsx.parse, sheet_name, header=None)
+        # Empty columns (e.g. left over from merged cells) only add work per row.
+        # Column labels are kept, so unnamed columns keep their col_<n> names
+        df = df.dropna(axis=1, how="all")
+
+        parser = SheetParserFactory.create(
+            sheet_name,
+            df,
+            self.llm,
+            self.cache,
+            max_concurrency=self.llm_concurrency,
+            batch_size=self.llm_batch_size,
+        )
+        documents = await parser.aparse()
+
+        # Save to cache
+        if self.cache:
+            self.cache.set(sheet_name, documents, parser.__class__.__name__)
+
+        print(f"  -> {sheet_name}: {len(documents)} documents")
+        return documents
 
     def to_rag_documents(self) -> list[dict[str, Any]]:
         """Convert to RAG-compatible format."""
@@ -8,6 +8,9 @@ This script:
 3. Creates a new collection with new embeddings
 4. Optionally creates and downloads a new snapshot
 
+Points are streamed through steps 1-3 a batch at a time, so memory use does
+not grow with the size of the collection.
+
 Usage:
     # Read from existing collection and re-embed
     python scripts/reembed_snapshot.py --source-collection informasi-umum-itb
@@ -21,25 +24,62 @@ Usage:
 
 import argparse
 import os
+import shutil
 import sys
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice, tee
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple
 
+import numpy as np
 from dotenv import load_dotenv
 
+# Add scripts dir to path for imports
+SCRIPT_DIR = Path(__file__).parent
+if str(SCRIPT_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPT_DIR))
+
 load_dotenv()
 
 try:
     from qdrant_client import QdrantClient
-    from qdrant_client.models import Distance, VectorParams, PointStruct, Filter
+    from qdrant_client.models import (
+        BinaryQuantization,
+        BinaryQuantizationConfig,
+        CollectionStatus,
+        Distance,
+        Filter,
+        HnswConfigDiff,
+        OptimizersConfigDiff,
+        PointVectors,
+        ScalarQuantization,
+        ScalarQuantizationConfig,
+        ScalarType,
+        VectorParams,
+    )
     import requests
+    from requests.adapters import HTTPAdapter
 except ImportError:
     print("Error: Required packages are missing")
     print("Run: pip install qdrant-client requests python-dotenv")
     sys.exit(1)
 
+# orjson parses the large float arrays of embedding responses much faster
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _parse_embeddings(response: "requests.Response") -> np.ndarray:
+    """Parse an embeddings API response into a float32 array, one row per text."""
+    result = orjson.loads(response.content) if orjson is not None else response.json()
+    return np.asarray([item["embedding"] for item in result["data"]], dtype=np.float32)
+
 
 class QdrantCollectionReembedder:
     """Re-embed Qdrant collection points with a new embedding model."""
@@ -59,6 +99,8 @@ class QdrantCollectionReembedder:
         "qwen/qwen3-embedding-8b": None,  # Use native dimension (4096)
     }
 
+    QUANTIZATION_TYPES = ("scalar", "binary")
+
     def __init__(
         self,
         qdrant_url: str,
@@ -66,21 +108,58 @@ class QdrantCollectionReembedder:
         api_key: str,
         embedding_model: str = "openai/text-embedding-3-small",
         provider: str = "openai",  # "openai" or "openrouter"
+        prefer_grpc: bool = True,
+        grpc_port: int = 6334,
+        quantization: Optional[str] = None,
+        truncate_dim: Optional[int] = None,
+        embed_cache_dir: Optional[str] = None,
+        http_pool_size: int = 8,
     ):
         self.qdrant_url = qdrant_url
         self.qdrant_api_key = qdrant_api_key
         self.api_key = api_key
         self.embedding_model = embedding_model
         self.provider = provider
-
-        # Initialize Qdrant client
+        # Quantization of the new collection ("scalar" or "binary")
+        self.quantization = quantization
+        # Keep only the first N dimensions of each embedding. Qwen3 embeddings
+        # are Matryoshka-trained, so a prefix is still a usable embedding
+        self.truncate_dim = truncate_dim
+        # Vectors of texts embedded by earlier runs, keyed by content hash;
+        # opened once the embedding dimension is known
+        self.embed_cache_dir = embed_cache_dir
+        self.embed_cache = None
+
+        # One session for all embedding requests, so batches reuse keep-alive
+        # connections instead of opening a new TLS connection each. The pool
+        # should be at least as large as the number of concurrent requests
+        self.http = requests.Session()
+        self.http.headers["Authorization"] = f"Bearer {api_key}"
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=http_pool_size)
+        self.http.mount("https://", adapter)
+        self.http.mount("http://", adapter)
+
+        # Initialize Qdrant client. Point operations go over gRPC, whose
+        # protobuf payloads are much smaller than REST JSON for vectors
+        client_kwargs: Dict[str, Any] = {"url": qdrant_url, "timeout": 60}
         if qdrant_api_key:
-            self.client = QdrantClient(url=qdrant_url, api_key=qdrant_api_key)
-        else:
-            self.client = QdrantClient(url=qdrant_url)
+            client_kwargs["api_key"] = qdrant_api_key
+        if prefer_grpc:
+            client_kwargs.update(
+                prefer_grpc=True,
+                grpc_port=grpc_port,
+                grpc_options={"grpc.max_send_message_length": 256 * 1024 * 1024},
+            )
+        self.client = QdrantClient(**client_kwargs)
 
         self.output_collection_name: Optional[str] = None
 
+    def close(self) -> None:
+        """Close the HTTP session and the embedding cache."""
+        self.http.close()
+        if self.embed_cache:
+            self.embed_cache.close()
+
     def connect_to_qdrant(self) -> bool:
         """Verify connection to Qdrant."""
         try:
@@ -92,51 +171,70 @@ class QdrantCollectionReembedder:
             print(f"  Failed to connect to Qdrant: {e}")
             return False
 
-    def read_all_points(self, collection_name: str) -> List[Dict]:
-        """Read all points from collection using scroll API."""
-        all_points = []
-        offset = None
-        limit = 100
-
-        print(f"  Reading points from '{collection_name}'...")
-
-        # First verify collection exists
+    def count_points(self, collection_name: str) -> int:
+        """Count points in a collection, or return 0 if it does not exist."""
         try:
             collections = self.client.get_collections()
             if collection_name not in [col.name for col in collections.collections]:
                 print(f"  Error: Collection '{collection_name}' not found")
-                return []
+                return 0
+            return self.client.count(collection_name=collection_name, exact=True).count
         except Exception as e:
             print(f"  Error checking collections: {e}")
-            return []
+            return 0
+
+    def get_vector_size(self, collection_name: str) -> Optional[int]:
+        """Vector size of a collection, or None if it uses named vectors."""
+        vectors = self.client.get_collection(collection_name).config.params.vectors
+        return vectors.size if isinstance(vectors, VectorParams) else None
+
+    def iter_points(
+        self,
+        collection_name: str,
+        payload_fields: Optional[List[str]] = None,
+        limit: int = 512,
+    ) -> Iterator:
+        """
+        Yield all points from collection using scroll API, one page at a time.
+
+        Args:
+            collection_name: Collection to read
+            payload_fields: Payload fields to fetch (default: the whole payload)
+            limit: Points per scroll page
+        """
+        offset = None
+        read = 0
+        pages = 0
+
+        print(f"  Reading points from '{collection_name}'...")
 
         while True:
             records, offset = self.client.scroll(
                 collection_name=collection_name,
                 limit=limit,
                 offset=offset,
-                with_payload=True,
+                with_payload=payload_fields or True,
                 with_vectors=False,
             )
+            pages += 1
+
+            # Analyze payload structure on the first page
+            if read == 0 and records:
+                self._analyze_payloads(records)
 
-            all_points.extend(records)
+            read += len(records)
+            yield from records
 
             if offset is None:
                 break
 
-            if len(all_points) % 500 == 0:
-                print(f"    Read {len(all_points)} points...")
-
-        print(f"  Read {len(all_points)} total points")
-
-        # Analyze payload structure
-        if all_points:
-            self._analyze_payloads(all_points)
+            if pages % 10 == 0:
+                print(f"    Read {read} points...")
 
-        return all_points
+        print(f"  Read {read} total points")
 
     def _analyze_payloads(self, points: List) -> None:
-        """Analyze payload structure to understand data format."""
+        """Analyze payload structure of sample points to understand data format."""
         if not points:
             return
 
@@ -157,7 +255,7 @@ class QdrantCollectionReembedder:
             total_length = sum(len(str(record.payload.get("page_content", ""))) for record in points)
             avg_length = total_length / len(points)
             max_length = max(len(str(record.payload.get("page_content", ""))) for record in points)
-            print(f"  page_content stats: avg={avg_length:.0f} chars, max={max_length} chars")
+            print(f"  page_content stats (first {len(points)} points): avg={avg_length:.0f} chars, max={max_length} chars")
 
     def get_embedding_dimension(self) -> int:
         """Get embedding dimension for the current model."""
@@ -168,7 +266,7 @@ class QdrantCollectionReembedder:
                     # Use native dimension - need to test with actual API call
                     print(f"  Using native dimension for {self.embedding_model} (testing...)")
                     test_embedding = self._embed_batch(["test"])
-                    if test_embedding:
+                    if test_embedding is not None and len(test_embedding):
                         dimension = len(test_embedding[0])
                         print(f"  Measured embedding dimension: {dimension}")
                         return dimension
@@ -181,20 +279,31 @@ class QdrantCollectionReembedder:
         # Otherwise test with actual API call
         print(f"  Testing embedding dimension for {self.embedding_model}...")
         test_embedding = self._embed_batch(["test"])
-        if test_embedding:
+        if test_embedding is not None and len(test_embedding):
             dimension = len(test_embedding[0])
             print(f"  Measured embedding dimension: {dimension}")
             return dimension
         else:
             raise Exception("Failed to get embedding dimension")
 
-    def _embed_batch_openai(self, texts: List[str]) -> Optional[List[List[float]]]:
+    def open_embed_cache(self, dimension: int) -> None:
+        """
+        Open the embedding cache for vectors of the model's full dimension.
+
+        The dimension is part of the cache file, so vectors cached at another
+        size (e.g. 1024-dim Qwen3 vectors from the parse_*.py uploads) are not
+        reused for a collection of a different size.
+        """
+        from parsers.embedding_cache import EmbeddingCache
+
+        if self.embed_cache_dir:
+            self.embed_cache = EmbeddingCache(
+                self.embed_cache_dir, self.embedding_model, dimensions=dimension
+            )
+
+    def _embed_batch_openai(self, texts: List[str]) -> Optional[np.ndarray]:
         """Embed using OpenAI API directly."""
         url = "https://api.openai.com/v1/embeddings"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
 
         data = {
             "input": texts,
@@ -202,25 +311,19 @@ class QdrantCollectionReembedder:
         }
 
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            response = self.http.post(url, json=data, timeout=60)
             response.raise_for_status()
 
-            result = response.json()
-            embeddings = [item["embedding"] for item in result["data"]]
-            return embeddings
+            return _parse_embeddings(response)
 
         except Exception as e:
             print(f"  OpenAI API error: {e}")
             return None
 
-    def _embed_batch_openrouter(self, texts: List[str]) -> Optional[List[List[float]]]:
+    def _embed_batch_openrouter(self, texts: List[str]) -> Optional[np.ndarray]:
         """Embed using OpenRouter API directly."""
         url = "https://openrouter.ai/api/v1/embeddings"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com",
-        }
+        headers = {"HTTP-Referer": "https://github.com"}
 
         # Build request data - only specify dimensions if model requires it
         # For Qwen3-8B, use native dimension (4096) by not specifying dimensions
@@ -237,12 +340,10 @@ class QdrantCollectionReembedder:
                 break
 
         try:
-            response = requests.post(url, headers=headers, json=data, timeout=60)
+            response = self.http.post(url, headers=headers, json=data, timeout=60)
             response.raise_for_status()
 
-            result = response.json()
-            embeddings = [item["embedding"] for item in result["data"]]
-            return embeddings
+            return _parse_embeddings(response)
 
         except Exception as e:
             print(f"  OpenRouter API error: {e}")
@@ -250,7 +351,7 @@ class QdrantCollectionReembedder:
                 print(f"  Response: {e.response.text}")
             return None
 
-    def _embed_batch(self, texts: List[str]) -> Optional[List[List[float]]]:
+    def _embed_batch(self, texts: List[str]) -> Optional[np.ndarray]:
         """Embed a batch of texts using the configured provider."""
         if self.provider == "openai":
             return self._embed_batch_openai(texts)
@@ -259,71 +360,178 @@ class QdrantCollectionReembedder:
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
 
-    def reembed_points(
+    def _embed_with_retries(
+        self, texts: List[str], max_retries: int
+    ) -> Optional[np.ndarray]:
+        """
+        Embed a batch of texts, retrying with exponential backoff on failure.
+
+        Repeated texts (e.g. boilerplate chunks) are sent once and their
+        vector is copied to every position they appear at.
+        """
+        # Position of each text in the deduplicated request
+        positions: Dict[str, int] = {}
+        for text in texts:
+            positions.setdefault(text, len(positions))
+        unique_texts = list(positions)
+
+        for attempt in range(max_retries):
+            try:
+                new_vectors = self._embed_batch(unique_texts)
+                if new_vectors is not None and len(new_vectors):
+                    if len(unique_texts) < len(texts):
+                        new_vectors = new_vectors[[positions[text] for text in texts]]
+                    return new_vectors
+                print(f"  Attempt {attempt + 1}/{max_retries} failed: no embeddings returned")
+            except Exception as e:
+                print(f"  Attempt {attempt + 1}/{max_retries} failed: {e}")
+            if attempt < max_retries - 1:
+                wait_time = 2 ** attempt  # Exponential backoff
+                print(f"  Retrying in {wait_time}s...")
+                time.sleep(wait_time)
+        return None
+
+    def iter_reembedded(
         self,
-        points: List,
+        points: Iterable,
+        total: int,
         batch_size: int,
         text_field: str = "page_content",
         max_retries: int = 3,
-    ) -> List[Dict]:
-        """Re-embed points using the configured embedding API."""
-        reembedded = []
-
-        total = len(points)
+        concurrency: int = 8,
+        token_budget: int = 100_000,
+    ) -> Iterator[Dict]:
+        """
+        Re-embed points using the configured embedding API.
+
+        Points are taken from `points` a batch at a time and up to
+        `concurrency` batches are sent to the API at once. Re-embedded points
+        are yielded in input order, so only the batches in flight are held
+        in memory.
+
+        Batches hold at most `batch_size` texts and `token_budget` estimated
+        tokens, so long documents are split into smaller requests.
+        """
         print(f"  Re-embedding {total} points with {self.embedding_model}...")
         print(f"  Using text field: '{text_field}'")
         print(f"  Provider: {self.provider}")
+        print(f"  Concurrent requests: {concurrency}")
+        print(f"  Token budget per batch: {token_budget}")
+
+        cached_count = 0
+
+        def collect(
+            batch_index: int,
+            end: int,
+            valid_points: List,
+            keys: List[bytes],
+            vectors_by_key: Dict[bytes, Any],
+            future,
+        ) -> Iterator[Dict]:
+            new_vectors = future.result() if future else []
+            if new_vectors is None:
+                print(f"  Error: Failed to embed batch {batch_index} after {max_retries} attempts")
+                return
+
+            if self.embed_cache:
+                # Cache full vectors, so changing --truncate-dim reuses them
+                missing = [key for key in keys if key not in vectors_by_key]
+                embedded = list(zip(missing, new_vectors))
+                if embedded:
+                    self.embed_cache.set_many(embedded)
+                vectors_by_key.update(embedded)
+                new_vectors = [vectors_by_key[key] for key in keys]
+
+            if self.truncate_dim:
+                new_vectors = [vector[:self.truncate_dim] for vector in new_vectors]
+
+            # Yield with original data
+            for point, vector in zip(valid_points, new_vectors):
+                yield {
+                    "id": point.id,
+                    "vector": vector,
+                    "payload": point.payload,
+                }
 
-        for i in range(0, total, batch_size):
-            batch = points[i:i + batch_size]
+            pct = end / total * 100 if total else 100.0
+            print(f"    Progress: {end}/{total} ({pct:.1f}%)")
 
-            # Extract texts from specified field
-            texts = []
-            valid_points = []
+        batches = self._pack_batches(points, batch_size, token_budget, text_field)
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            in_flight = deque()
 
-            for point in batch:
-                text = point.payload.get(text_field, "")
-                if isinstance(text, str) and text.strip():
-                    texts.append(text.strip())
-                    valid_points.append(point)
-                else:
-                    print(f"  Warning: Point {point.id} has empty or missing '{text_field}' field")
+            for batch_index, (read, valid_points, texts) in enumerate(batches):
+                keys: List[bytes] = []
+                vectors_by_key: Dict[bytes, Any] = {}
+                if self.embed_cache:
+                    # Only send texts without a cached embedding to the API
+                    keys = [self.embed_cache.key(text) for text in texts]
+                    vectors_by_key = self.embed_cache.get_many(keys)
+                    texts = [text for text, key in zip(texts, keys) if key not in vectors_by_key]
+                    cached_count += len(keys) - len(texts)
 
-            if not texts:
-                print(f"  Warning: No valid texts in batch {i//batch_size}")
-                continue
+                # Embed batch with retries
+                future = executor.submit(self._embed_with_retries, texts, max_retries) if texts else None
+                in_flight.append((batch_index, read, valid_points, keys, vectors_by_key, future))
 
-            # Embed batch with retries
-            new_vectors = None
-            for attempt in range(max_retries):
-                try:
-                    new_vectors = self._embed_batch(texts)
-                    if new_vectors:
-                        break
-                except Exception as e:
-                    print(f"  Attempt {attempt + 1}/{max_retries} failed: {e}")
-                    if attempt < max_retries - 1:
-                        wait_time = 2 ** attempt  # Exponential backoff
-                        print(f"  Retrying in {wait_time}s...")
-                        time.sleep(wait_time)
+                # Wait for the oldest batch once the window is full
+                if len(in_flight) >= concurrency:
+                    yield from collect(*in_flight.popleft())
 
-            if new_vectors is None:
-                print(f"  Error: Failed to embed batch {i//batch_size} after {max_retries} attempts")
+            while in_flight:
+                yield from collect(*in_flight.popleft())
+
+        if self.embed_cache:
+            print(f"  Reused {cached_count} cached embeddings")
+
+    @staticmethod
+    def _estimate_tokens(text: str) -> int:
+        """Rough token count of a text, at about 4 characters per token."""
+        return len(text) // 4 + 1
+
+    def _pack_batches(
+        self,
+        points: Iterable,
+        batch_size: int,
+        token_budget: int,
+        text_field: str,
+    ) -> Iterator[Tuple[int, List, List[str]]]:
+        """
+        Group points with non-empty text into embedding batches.
+
+        A batch is closed when it holds `batch_size` texts or the next text
+        would take it past `token_budget` estimated tokens. A text over the
+        budget on its own is sent as a batch of one.
+
+        Yields:
+            Tuples of (points read so far, batch points, batch texts)
+        """
+        read = 0
+        batch_points: List = []
+        texts: List[str] = []
+        tokens = 0
+
+        for point in points:
+            # Extract text from specified field
+            text = point.payload.get(text_field, "")
+            if not (isinstance(text, str) and text.strip()):
+                print(f"  Warning: Point {point.id} has empty or missing '{text_field}' field")
+                read += 1
                 continue
 
-            # Store with original data
-            for point, vector in zip(valid_points, new_vectors):
-                reembedded.append({
-                    "id": point.id,
-                    "vector": vector,
-                    "payload": point.payload,
-                })
+            text = text.strip()
+            text_tokens = self._estimate_tokens(text)
+            if texts and (len(texts) >= batch_size or tokens + text_tokens > token_budget):
+                yield read, batch_points, texts
+                batch_points, texts, tokens = [], [], 0
 
-            progress = min(i + batch_size, total)
-            pct = progress / total * 100
-            print(f"    Progress: {progress}/{total} ({pct:.1f}%)")
+            batch_points.append(point)
+            texts.append(text)
+            tokens += text_tokens
+            read += 1
 
-        return reembedded
+        if texts:
+            yield read, batch_points, texts
 
     def create_new_collection(self, dimension: int, output_name: str) -> bool:
         """Create new collection for re-embedded points."""
@@ -346,58 +554,189 @@ class QdrantCollectionReembedder:
         except Exception as e:
             print(f"  Warning: Could not check existing collections: {e}")
 
-        # Create collection
+        # Create collection. Indexing is disabled until the bulk insert has
+        # finished, so Qdrant builds the HNSW graph once (see enable_indexing).
+        # With quantization, only the quantized copy is kept in RAM and the
+        # original vectors move to disk.
         try:
             self.client.create_collection(
                 collection_name=output_name,
-                vectors_config=VectorParams(size=dimension, distance=Distance.COSINE),
+                vectors_config=VectorParams(
+                    size=dimension,
+                    distance=Distance.COSINE,
+                    on_disk=bool(self.quantization),
+                ),
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=0),
+                hnsw_config=HnswConfigDiff(m=0),
+                quantization_config=self._quantization_config(),
             )
             print(f"  Collection created with dimension {dimension}")
+            if self.quantization:
+                print(f"  Quantization: {self.quantization} (original vectors on disk)")
             self.output_collection_name = output_name
             return True
         except Exception as e:
             print(f"  Failed to create collection: {e}")
             return False
 
-    def insert_points(self, reembedded: List[Dict], batch_size: int = 100) -> bool:
-        """Insert re-embedded points into new collection."""
-        total = len(reembedded)
+    def _quantization_config(self):
+        """
+        Build the quantization config for the configured quantization type.
+
+        Returns:
+            Qdrant quantization config, or None when quantization is disabled
+        """
+        if self.quantization == "scalar":
+            return ScalarQuantization(
+                scalar=ScalarQuantizationConfig(
+                    type=ScalarType.INT8, quantile=0.99, always_ram=True
+                )
+            )
+        if self.quantization == "binary":
+            return BinaryQuantization(binary=BinaryQuantizationConfig(always_ram=True))
+        return None
+
+    def insert_points(
+        self,
+        reembedded: Iterable[Dict],
+        batch_size: int = 256,
+        parallel: int = 1,
+        verify_timeout: float = 60.0,
+    ) -> int:
+        """
+        Insert re-embedded points into new collection as they arrive.
+
+        Batches are uploaded without waiting for each write to be applied;
+        the collection is checked once at the end instead.
+
+        Returns:
+            Number of points the collection holds after the upload, or 0 if
+            the upload failed
+        """
         output_name = self.output_collection_name
-        print(f"  Inserting {total} points into '{output_name}'...")
+        print(f"  Inserting points into '{output_name}'...")
+
+        inserted = 0
+
+        def counted() -> Iterator[Dict]:
+            nonlocal inserted
+            for item in reembedded:
+                yield item
+                inserted += 1
+
+        # Columns are consumed in lockstep, so tee only buffers one point;
+        # the uploader builds each batch directly from them (protobuf over
+        # gRPC) without a PointStruct model per point
+        ids, vectors, payloads = (
+            map(itemgetter(field), stream)
+            for field, stream in zip(("id", "vector", "payload"), tee(counted(), 3))
+        )
+        # The gRPC conversion only accepts plain lists as vectors, not the
+        # float32 rows the embedder produces
+        vectors = (vector.tolist() for vector in vectors)
 
-        for i in range(0, total, batch_size):
-            batch = reembedded[i:i + batch_size]
+        try:
+            # Splits the stream into batches and retries failed ones
+            self.client.upload_collection(
+                collection_name=output_name,
+                ids=ids,
+                vectors=vectors,
+                payload=payloads,
+                batch_size=batch_size,
+                parallel=parallel,
+                max_retries=3,
+                wait=False,
+            )
+        except Exception as e:
+            print(f"  Error inserting points after {inserted} points: {e}")
+            return 0
 
-            points = [
-                PointStruct(
-                    id=item["id"],
-                    vector=item["vector"],
-                    payload=item["payload"],
-                )
-                for item in batch
-            ]
+        print(f"  Inserted {inserted} points")
+
+        # Verify insertion, giving Qdrant time to apply the last writes
+        try:
+            deadline = time.monotonic() + verify_timeout
+            while True:
+                count = self.client.count(collection_name=output_name, exact=True).count
+                if count >= inserted or time.monotonic() >= deadline:
+                    break
+                time.sleep(1)
+            print(f"  Verification: Collection has {count} points")
+        except Exception as e:
+            print(f"  Warning: Could not verify collection: {e}")
+            return inserted
+
+        if count < inserted:
+            print(f"  Warning: {inserted - count} points are missing from the collection")
+        return count
 
+    def update_vectors(
+        self,
+        collection_name: str,
+        reembedded: Iterable[Dict],
+        batch_size: int = 256,
+    ) -> int:
+        """
+        Replace the vectors of existing points in place as they arrive.
+
+        Payloads are left untouched on the server, so only ids and vectors
+        are sent. Only the last batch waits for its write to be applied.
+
+        Returns:
+            Number of points updated
+        """
+        print(f"  Updating vectors in '{collection_name}'...")
+
+        reembedded = iter(reembedded)
+        updated = 0
+
+        batch = list(islice(reembedded, batch_size))
+        while batch:
+            next_batch = list(islice(reembedded, batch_size))
             try:
-                self.client.upsert(
-                    collection_name=output_name,
-                    points=points,
+                self.client.update_vectors(
+                    collection_name=collection_name,
+                    points=[
+                        PointVectors(id=item["id"], vector=item["vector"].tolist())
+                        for item in batch
+                    ],
+                    wait=not next_batch,
                 )
+                updated += len(batch)
             except Exception as e:
-                print(f"  Error inserting batch starting at {i}: {e}")
-                continue
+                print(f"  Error updating vectors after {updated} points: {e}")
+                break
+            batch = next_batch
+
+        print(f"  Updated {updated} points")
+        return updated
+
+    def enable_indexing(self, timeout: float = 300.0) -> None:
+        """
+        Re-enable indexing on the output collection after the bulk insert.
 
-            progress = min(i + batch_size, total)
-            pct = progress / total * 100
-            print(f"    Progress: {progress}/{total} ({pct:.1f}%)")
+        Restores Qdrant's default HNSW and indexing settings, then waits until
+        the collection status is green (index built) or the timeout expires.
+        """
+        output_name = self.output_collection_name
 
-        # Verify insertion
+        print(f"  Building HNSW index for '{output_name}'...")
         try:
-            info = self.client.get_collection(output_name)
-            print(f"  Verification: Collection has {info.points_count} points")
-        except Exception as e:
-            print(f"  Warning: Could not verify collection: {e}")
+            self.client.update_collection(
+                collection_name=output_name,
+                optimizers_config=OptimizersConfigDiff(indexing_threshold=20000),
+                hnsw_config=HnswConfigDiff(m=16),
+            )
 
-        return True
+            deadline = time.monotonic() + timeout
+            while self.client.get_collection(output_name).status != CollectionStatus.GREEN:
+                if time.monotonic() >= deadline:
+                    print("  Warning: Index is still building; it will finish in the background")
+                    return
+                time.sleep(1)
+            print("  Index ready")
+        except Exception as e:
+            print(f"  Warning: Could not enable indexing: {e}")
 
     def create_snapshot(self, output_dir: str) -> Optional[str]:
         """Create and download snapshot from output collection."""
@@ -432,9 +771,11 @@ class QdrantCollectionReembedder:
             if response.status_code != 200:
                 raise Exception(f"Download failed: {response.status_code} - {response.text}")
 
+            # Copy the raw stream in 1 MB reads instead of looping over small
+            # chunks in Python; decode_content undoes any transfer compression
+            response.raw.decode_content = True
             with open(snapshot_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
 
             file_size = os.path.getsize(snapshot_path) / (1024 * 1024)
             print(f"  Downloaded to: {snapshot_path}")
@@ -513,12 +854,60 @@ Examples:
         default=100,
         help="Embedding batch size (default: 100)",
     )
+    parser.add_argument(
+        "--token-budget",
+        type=int,
+        default=100_000,
+        help="Maximum estimated tokens per embedding batch (default: 100000)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="Embedding requests sent at the same time (default: 8)",
+    )
+    parser.add_argument(
+        "--upload-parallel",
+        type=int,
+        default=1,
+        help="Processes uploading points to Qdrant (default: 1)",
+    )
+    parser.add_argument(
+        "--quantization",
+        type=str,
+        default=os.getenv("QDRANT_QUANTIZATION", "").lower() or None,
+        help="Quantize the new collection: scalar (int8, 4x smaller) or binary "
+        "(32x smaller) (default: QDRANT_QUANTIZATION env var, none)",
+    )
+    parser.add_argument(
+        "--truncate-dim",
+        type=int,
+        default=None,
+        help="Keep only the first N embedding dimensions (Matryoshka models such as Qwen3)",
+    )
     parser.add_argument(
         "--text-field",
         type=str,
         default="page_content",
         help="Payload field containing text to embed (default: page_content)",
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=str,
+        default="cache",
+        help="Directory of the embedding cache (default: cache)",
+    )
+    parser.add_argument(
+        "--no-embed-cache",
+        action="store_true",
+        help="Disable the embedding cache (always call the embedding API)",
+    )
+    parser.add_argument(
+        "--in-place",
+        action="store_true",
+        help="Replace vectors in the source collection instead of creating a new one "
+        "(only if the new vectors have the same dimension)",
+    )
     parser.add_argument(
         "--create-snapshot",
         action="store_true",
@@ -538,6 +927,21 @@ Examples:
 
     args = parser.parse_args()
 
+    if args.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+    if args.token_budget < 1:
+        parser.error("--token-budget must be at least 1")
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.upload_parallel < 1:
+        parser.error("--upload-parallel must be at least 1")
+    if args.quantization and args.quantization not in QdrantCollectionReembedder.QUANTIZATION_TYPES:
+        parser.error(
+            f"--quantization must be one of {', '.join(QdrantCollectionReembedder.QUANTIZATION_TYPES)}"
+        )
+    if args.truncate_dim is not None and args.truncate_dim < 1:
+        parser.error("--truncate-dim must be at least 1")
+
     # Set default embedding model based on provider
     if args.embedding_model is None:
         if args.provider == "openai":
@@ -548,6 +952,8 @@ Examples:
     # Get configuration from environment
     qdrant_url = os.getenv("QDRANT_URL", "http://localhost:6333")
     qdrant_api_key = os.getenv("QDRANT_API_KEY")
+    prefer_grpc = os.getenv("QDRANT_PREFER_GRPC", "true").lower() == "true"
+    grpc_port = int(os.getenv("QDRANT_GRPC_PORT", "6334"))
 
     # Get API key based on provider
     if args.provider == "openai":
@@ -569,14 +975,22 @@ Examples:
 
     print("Configuration:")
     print(f"  Qdrant URL: {qdrant_url}")
+    print(f"  Transport: {f'gRPC (port {grpc_port})' if prefer_grpc else 'REST'}")
     print(f"  Source Collection: {args.source_collection}")
     print(f"  Output Collection: {args.output_collection}")
     print(f"  Provider: {args.provider}")
     print(f"  Embedding Model: {args.embedding_model}")
     print(f"  Batch Size: {args.batch_size}")
+    print(f"  Token Budget: {args.token_budget}")
+    print(f"  Concurrency: {args.concurrency}")
     print(f"  Text Field: {args.text_field}")
+    print(f"  Quantization: {args.quantization or 'none'}")
+    if args.truncate_dim:
+        print(f"  Truncate Dimension: {args.truncate_dim}")
     if args.create_snapshot:
         print(f"  Create Snapshot: Yes (to {args.snapshot_dir})")
+    if args.in_place:
+        print(f"  In Place: Yes (replace vectors in '{args.source_collection}')")
     if args.dry_run:
         print(f"  Dry Run: Yes (no re-embedding)")
     print()
@@ -588,6 +1002,12 @@ Examples:
         api_key=api_key,
         embedding_model=args.embedding_model,
         provider=args.provider,
+        prefer_grpc=prefer_grpc,
+        grpc_port=grpc_port,
+        quantization=args.quantization,
+        truncate_dim=args.truncate_dim,
+        embed_cache_dir=None if args.no_embed_cache or args.dry_run else args.cache_dir,
+        http_pool_size=args.concurrency,
     )
 
     # STEP 1: Connect to Qdrant
@@ -596,21 +1016,24 @@ Examples:
         sys.exit(1)
     print()
 
-    # STEP 2: Read all points from source collection
-    print("STEP 2: Reading points from source collection...")
-    points = reembedder.read_all_points(args.source_collection)
+    # STEP 2: Check source collection
+    print("STEP 2: Checking source collection...")
+    total = reembedder.count_points(args.source_collection)
 
-    if not points:
+    if not total:
         print("  No points found in collection")
         sys.exit(1)
+    print(f"  Found {total} points in '{args.source_collection}'")
     print()
 
     # Dry run - just analyze and exit
     if args.dry_run:
+        points_read = sum(1 for _ in reembedder.iter_points(args.source_collection))
+        print()
         print("=" * 60)
         print("Dry Run Complete")
         print("=" * 60)
-        print(f"  Read {len(points)} points from '{args.source_collection}'")
+        print(f"  Read {points_read} points from '{args.source_collection}'")
         print(f"  Would re-embed with {args.embedding_model}")
         print()
         return
@@ -618,34 +1041,73 @@ Examples:
     # STEP 3: Get embedding dimension
     print("STEP 3: Determining embedding dimension...")
     dimension = reembedder.get_embedding_dimension()
+    reembedder.open_embed_cache(dimension)
+    if args.truncate_dim:
+        if args.truncate_dim > dimension:
+            print(f"  Error: --truncate-dim {args.truncate_dim} exceeds the model dimension {dimension}")
+            sys.exit(1)
+        dimension = args.truncate_dim
+        print(f"  Truncating embeddings to {dimension} dimensions")
     print()
 
-    # STEP 4: Re-embed points
-    print(f"STEP 4: Re-embedding points...")
-    reembedded = reembedder.reembed_points(points, args.batch_size, args.text_field)
-
-    if not reembedded:
-        print("  No points were re-embedded")
-        sys.exit(1)
-
-    print(f"  Re-embedded {len(reembedded)} points")
+    # Vectors can only be replaced in place if the collection accepts them
+    in_place = args.in_place
+    if in_place:
+        source_dimension = reembedder.get_vector_size(args.source_collection)
+        if source_dimension != dimension:
+            print(
+                f"  Warning: '{args.source_collection}' vectors have dimension {source_dimension}, "
+                f"not {dimension}; creating a new collection instead"
+            )
+            print()
+            in_place = False
+
+    # STEP 4: Create new collection
+    if in_place:
+        print("STEP 4: Using source collection (in place)...")
+        reembedder.output_collection_name = args.source_collection
+        if args.quantization:
+            print("  Warning: --quantization is ignored for in-place updates")
+    else:
+        print("STEP 4: Creating new collection...")
+        if not reembedder.create_new_collection(dimension, args.output_collection):
+            sys.exit(1)
     print()
 
-    # STEP 5: Create new collection
-    print("STEP 5: Creating new collection...")
-    if not reembedder.create_new_collection(dimension, args.output_collection):
+    # STEP 5: Read, re-embed and insert points, a batch at a time
+    print("STEP 5: Re-embedding and inserting points...")
+    # In-place updates keep the stored payloads, so only the text is read
+    points = reembedder.iter_points(
+        args.source_collection, payload_fields=[args.text_field] if in_place else None
+    )
+    reembedded = reembedder.iter_reembedded(
+        points,
+        total,
+        args.batch_size,
+        args.text_field,
+        concurrency=args.concurrency,
+        token_budget=args.token_budget,
+    )
+    if in_place:
+        inserted = reembedder.update_vectors(args.source_collection, reembedded)
+        if inserted < total:
+            print(f"  Warning: {total - inserted} points still have vectors from the old model")
+    else:
+        inserted = reembedder.insert_points(reembedded, parallel=args.upload_parallel)
+    reembedder.close()
+
+    if not inserted:
+        print("  No points were re-embedded and stored")
         sys.exit(1)
-    print()
 
-    # STEP 6: Insert points
-    print("STEP 6: Inserting re-embedded points...")
-    reembedder.insert_points(reembedded)
+    if not in_place:
+        reembedder.enable_indexing()
     print()
 
-    # STEP 7: Create snapshot (optional)
+    # STEP 6: Create snapshot (optional)
     snapshot_path = None
     if args.create_snapshot:
-        print("STEP 7: Creating snapshot...")
+        print("STEP 6: Creating snapshot...")
         snapshot_path = reembedder.create_snapshot(args.snapshot_dir)
         if not snapshot_path:
             print("  Failed to create snapshot")
@@ -655,8 +1117,8 @@ Examples:
     print("=" * 60)
     print("Summary")
     print("=" * 60)
-    print(f"  Input: {len(points)} points from '{args.source_collection}'")
-    print(f"  Re-embedded: {len(reembedded)} points")
+    print(f"  Input: {total} points from '{args.source_collection}'")
+    print(f"  Re-embedded: {inserted} points")
     print(f"  Output Collection: '{reembedder.output_collection_name}'")
     print(f"  Embedding Model: {args.embedding_model}")
     print(f"  Vector Dimension: {dimension}")
@@ -0,0 +1,88 @@
+"""
+Unit tests for the SQLite embedding cache.
+
+Tests storing and loading vectors, and per-dimension separation of vectors.
+"""
+
+import numpy as np
+import pytest
+
+from scripts.parsers.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = EmbeddingCache(str(tmp_path), "openai/text-embedding-3-small", dimensions=4)
+    yield cache
+    cache.close()
+
+
+def test_set_and_get_round_trip(cache):
+    keys = [cache.key("pasal satu"), cache.key("pasal dua")]
+    vectors = [[0.1, 0.2, 0.3, 0.4], [1.0, -1.0, 0.5, 0.0]]
+    cache.set_many(list(zip(keys, vectors)))
+
+    found = cache.get_many(keys)
+
+    assert set(found) == set(keys)
+    for key, vector in zip(keys, vectors):
+        assert found[key].dtype == np.float32
+        np.testing.assert_allclose(found[key], np.asarray(vector, dtype=np.float32))
+
+
+def test_get_many_omits_missing_keys(cache):
+    stored = cache.key("stored")
+    cache.set_many([(stored, [0.0, 1.0, 2.0, 3.0])])
+
+    found = cache.get_many([stored, cache.key("missing"), stored])
+
+    assert list(found) == [stored]
+
+
+def test_vectors_persist_across_instances(tmp_path):
+    first = EmbeddingCache(str(tmp_path), "model-a", dimensions=2)
+    key = first.key("text")
+    first.set_many([(key, [0.5, 0.25])])
+    first.close()
+
+    second = EmbeddingCache(str(tmp_path), "model-a", dimensions=2)
+    try:
+        np.testing.assert_allclose(second.get_many([key])[key], [0.5, 0.25])
+    finally:
+        second.close()
+
+
+def test_keys_depend_on_model(tmp_path):
+    a = EmbeddingCache(str(tmp_path), "model-a")
+    b = EmbeddingCache(str(tmp_path), "model-b")
+    try:
+        assert a.key("same text") != b.key("same text")
+    finally:
+        a.close()
+        b.close()
+
+
+def test_vectors_of_wrong_dimension_are_dropped(cache):
+    ok, short, long = cache.key("ok"), cache.key("short"), cache.key("long")
+    cache.set_many(
+        [
+            (ok, [0.0, 1.0, 2.0, 3.0]),
+            (short, [0.0, 1.0, 2.0]),
+            (long, [0.0, 1.0, 2.0, 3.0, 4.0]),
+        ]
+    )
+
+    assert list(cache.get_many([ok, short, long])) == [ok]
+
+
+def test_each_dimension_gets_its_own_file(tmp_path):
+    small = EmbeddingCache(str(tmp_path), "qwen/qwen3-embedding-8b", dimensions=2)
+    large = EmbeddingCache(str(tmp_path), "qwen/qwen3-embedding-8b", dimensions=4)
+    try:
+        assert small.cache_file != large.cache_file
+        key = small.key("text")
+        small.set_many([(key, [1.0, 2.0])])
+        assert large.get_many([key]) == {}
+    finally:
+        small.close()
+        large.close()
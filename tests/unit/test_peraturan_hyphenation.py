@@ -0,0 +1,63 @@
+"""
+Unit tests for joining words hyphenated across line breaks in legal documents.
+
+Tests that PeraturanParser._join_hyphenated_words gives the same result as
+the (\\w)-\\n(\\w) substitution it replaced.
+"""
+
+import random
+import re
+
+import pytest
+
+from scripts.parsers.peraturan_parser import PeraturanParser
+
+# The substitution _join_hyphenated_words replaced
+OLD_HYPHEN_PATTERN = re.compile(r"(\w)-\n(\w)")
+
+
+def join_with_regex(text):
+    return OLD_HYPHEN_PATTERN.sub(r"\1\2", text)
+
+
+@pytest.fixture
+def parser():
+    return PeraturanParser("dokumen.txt")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "tanpa pemenggalan",
+        "ketentu-\nan umum",
+        "Pasal 1\nketentu-\nan dan peratur-\nan",
+        # The character after one join cannot start the next one
+        "a-\nb-\nc",
+        "ab-\ncd-\nef-\ngh",
+        "- \nbukan",
+        "-\nawal",
+        "akhir-\n",
+        "kata -\nlain",
+        "huruf_-\n_garis",
+        "angka 1-\n2",
+        "a-\n\nb",
+        "a--\nb",
+        "pemerintah-\ndaerah-\n",
+    ],
+)
+def test_matches_regex_on_examples(parser, text):
+    assert parser._join_hyphenated_words(text) == join_with_regex(text)
+
+
+def test_matches_regex_on_random_text(parser):
+    rng = random.Random(0)
+    alphabet = ["a", "b", "Z", "1", "_", "é", "-", "\n", " ", "-\n", ".", "\t"]
+    for _ in range(5000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        assert parser._join_hyphenated_words(text) == join_with_regex(text), repr(text)
+
+
+def test_text_without_joins_is_returned_unchanged(parser):
+    text = "BAB I\nKETENTUAN UMUM\n"
+    assert parser._join_hyphenated_words(text) is text
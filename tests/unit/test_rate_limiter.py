@@ -0,0 +1,79 @@
+"""
+Unit tests for the embedding request rate limiter.
+
+Tests token bucket refill over time and capping of oversized requests.
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from scripts.parsers import rate_limiter
+from scripts.parsers.rate_limiter import AsyncRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake monotonic clock; sleeping advances it instead of waiting."""
+    state = SimpleNamespace(now=0.0, sleeps=[])
+
+    async def fake_sleep(seconds):
+        state.sleeps.append(seconds)
+        state.now += seconds
+        if len(state.sleeps) > 100:
+            raise AssertionError("acquire() kept waiting without ever succeeding")
+
+    monkeypatch.setattr(rate_limiter, "time", SimpleNamespace(monotonic=lambda: state.now))
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return state
+
+
+def run_acquires(limiter_args, amounts, clock, advance_before=None):
+    """Acquire each amount in turn, optionally advancing the clock first."""
+    advance_before = advance_before or {}
+
+    async def run():
+        limiter = AsyncRateLimiter(*limiter_args)
+        for i, amount in enumerate(amounts):
+            clock.now += advance_before.get(i, 0.0)
+            await limiter.acquire(amount)
+        return limiter
+
+    return asyncio.run(run())
+
+
+def test_acquire_within_capacity_does_not_wait(clock):
+    run_acquires((10, 60.0), [1] * 10, clock)
+    assert clock.sleeps == []
+
+
+def test_acquire_waits_for_refill(clock):
+    # 60 per minute refills 1 per second
+    limiter = run_acquires((60, 60.0), [60, 30], clock)
+    assert sum(clock.sleeps) == pytest.approx(30.0)
+    assert limiter._level == pytest.approx(0.0)
+
+
+def test_partial_refill_is_used_before_waiting(clock):
+    run_acquires((60, 60.0), [60, 30], clock, advance_before={1: 10.0})
+    assert sum(clock.sleeps) == pytest.approx(20.0)
+
+
+def test_refill_is_capped_at_bucket_size(clock):
+    # A long idle period refills only up to max_rate
+    limiter = run_acquires((60, 60.0), [60, 60], clock, advance_before={1: 1000.0})
+    assert clock.sleeps == []
+    assert limiter._level == pytest.approx(0.0)
+
+
+def test_request_larger_than_bucket_waits_for_full_bucket(clock):
+    limiter = run_acquires((60, 60.0), [60, 500], clock)
+    # Capped to the bucket size instead of waiting forever
+    assert sum(clock.sleeps) == pytest.approx(60.0)
+    assert limiter._level == pytest.approx(0.0)
+
+
+def test_request_larger_than_bucket_on_full_bucket_does_not_wait(clock):
+    run_acquires((60, 60.0), [500], clock)
+    assert clock.sleeps == []
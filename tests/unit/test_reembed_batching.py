@@ -0,0 +1,77 @@
+"""
+Unit tests for packing snapshot points into embedding batches.
+
+Tests QdrantCollectionReembedder._pack_batches splitting by batch size and
+by estimated token budget.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from scripts.reembed_snapshot import QdrantCollectionReembedder
+
+
+@pytest.fixture
+def reembedder():
+    # _pack_batches needs no clients, so skip __init__
+    return QdrantCollectionReembedder.__new__(QdrantCollectionReembedder)
+
+
+def make_points(texts):
+    return [SimpleNamespace(id=i, payload={"text": text}) for i, text in enumerate(texts)]
+
+
+def pack(reembedder, points, batch_size=100, token_budget=10_000):
+    return list(reembedder._pack_batches(points, batch_size, token_budget, "text"))
+
+
+def test_splits_by_batch_size(reembedder):
+    points = make_points([f"dokumen {i}" for i in range(7)])
+
+    batches = pack(reembedder, points, batch_size=3)
+
+    assert [texts for _, _, texts in batches] == [
+        ["dokumen 0", "dokumen 1", "dokumen 2"],
+        ["dokumen 3", "dokumen 4", "dokumen 5"],
+        ["dokumen 6"],
+    ]
+    assert [read for read, _, _ in batches] == [3, 6, 7]
+    assert [point.id for _, batch_points, _ in batches for point in batch_points] == list(range(7))
+
+
+def test_splits_by_token_budget(reembedder):
+    # 39 characters estimate to 10 tokens each
+    text = "x" * 39
+    points = make_points([text] * 5)
+
+    batches = pack(reembedder, points, token_budget=25)
+
+    assert [len(texts) for _, _, texts in batches] == [2, 2, 1]
+
+
+def test_text_over_budget_is_sent_alone(reembedder):
+    points = make_points(["pendek", "x" * 400, "pendek juga"])
+
+    batches = pack(reembedder, points, token_budget=20)
+
+    assert [texts for _, _, texts in batches] == [["pendek"], ["x" * 400], ["pendek juga"]]
+
+
+def test_empty_texts_are_skipped_but_counted(reembedder, capsys):
+    points = make_points(["satu", "", "   ", "dua"])
+    points.append(SimpleNamespace(id=4, payload={}))
+
+    batches = pack(reembedder, points, batch_size=10)
+
+    assert [(read, texts) for read, _, texts in batches] == [(5, ["satu", "dua"])]
+    assert "Point 1 has empty" in capsys.readouterr().out
+
+
+def test_texts_are_stripped(reembedder):
+    batches = pack(reembedder, make_points(["  Pasal 1\n"]))
+    assert batches[0][2] == ["Pasal 1"]
+
+
+def test_no_points_yields_no_batches(reembedder):
+    assert pack(reembedder, []) == []